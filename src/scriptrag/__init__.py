@@ -2,7 +2,23 @@
 
 from __future__ import annotations
 
-from scriptrag.main import ScriptRAG
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from scriptrag.main import ScriptRAG
 
 __version__ = "0.2.0"
 __all__ = ["ScriptRAG"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import ScriptRAG on first access.
+
+    The class pulls in the parser, search engine and database layers, which
+    the CLI and MCP entry points should not pay for at package import.
+    """
+    if name == "ScriptRAG":
+        from scriptrag.main import ScriptRAG
+
+        return ScriptRAG
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,18 +12,41 @@ This module provides the main API components for ScriptRAG:
 
 from __future__ import annotations
 
-from scriptrag.api.analyze import AnalyzeCommand as AnalyzeCommand
-from scriptrag.api.analyze_results import AnalyzeResult as AnalyzeResult
-from scriptrag.api.analyze_results import FileResult as FileResult
-from scriptrag.api.database import DatabaseInitializer as DatabaseInitializer
-from scriptrag.api.database_operations import DatabaseOperations as DatabaseOperations
-from scriptrag.api.db_script_ops import ScriptRecord as ScriptRecord
-from scriptrag.api.index import IndexCommand as IndexCommand
-from scriptrag.api.index import IndexOperationResult as IndexOperationResult
-from scriptrag.api.index import IndexResult as IndexResult
-from scriptrag.api.list import FountainMetadata as FountainMetadata
-from scriptrag.api.list import ScriptLister as ScriptLister
-from scriptrag.api.query import QueryAPI as QueryAPI
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+from typing import Any as _Any
+
+if _TYPE_CHECKING:
+    from scriptrag.api.analyze import AnalyzeCommand as AnalyzeCommand
+    from scriptrag.api.analyze_results import AnalyzeResult as AnalyzeResult
+    from scriptrag.api.analyze_results import FileResult as FileResult
+    from scriptrag.api.database import DatabaseInitializer as DatabaseInitializer
+    from scriptrag.api.database_operations import (
+        DatabaseOperations as DatabaseOperations,
+    )
+    from scriptrag.api.db_script_ops import ScriptRecord as ScriptRecord
+    from scriptrag.api.index import IndexCommand as IndexCommand
+    from scriptrag.api.index import IndexOperationResult as IndexOperationResult
+    from scriptrag.api.index import IndexResult as IndexResult
+    from scriptrag.api.list import FountainMetadata as FountainMetadata
+    from scriptrag.api.list import ScriptLister as ScriptLister
+    from scriptrag.api.query import QueryAPI as QueryAPI
+
+# Exported name -> defining module; imported on first attribute access
+_EXPORTS = {
+    "AnalyzeCommand": "scriptrag.api.analyze",
+    "AnalyzeResult": "scriptrag.api.analyze_results",
+    "DatabaseInitializer": "scriptrag.api.database",
+    "DatabaseOperations": "scriptrag.api.database_operations",
+    "FileResult": "scriptrag.api.analyze_results",
+    "FountainMetadata": "scriptrag.api.list",
+    "IndexCommand": "scriptrag.api.index",
+    "IndexOperationResult": "scriptrag.api.index",
+    "IndexResult": "scriptrag.api.index",
+    "QueryAPI": "scriptrag.api.query",
+    "ScriptLister": "scriptrag.api.list",
+    "ScriptRecord": "scriptrag.api.db_script_ops",
+}
 
 __all__ = [
     "AnalyzeCommand",
@@ -39,3 +62,18 @@ __all__ = [
     "ScriptLister",
     "ScriptRecord",
 ]
+
+
+def __getattr__(name: str) -> _Any:
+    """Import exported API classes on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily imported exports."""
+    return sorted({*globals(), *_EXPORTS})
@@ -20,6 +20,7 @@ from scriptrag.api.analyze_helpers import (
 from scriptrag.api.analyze_protocols import SceneAnalyzer
 from scriptrag.api.analyze_results import AnalyzeResult, FileResult
 from scriptrag.api.list import ScriptLister
+from scriptrag.common.profiling import span
 from scriptrag.config import get_logger
 from scriptrag.exceptions import (
     AnalyzerError,
@@ -65,6 +66,8 @@ class AnalyzeCommand:
         """
         self.analyzers = analyzers or []
         self._analyzer_registry: dict[str, type[SceneAnalyzer | BaseSceneAnalyzer]] = {}
+        # Whether analyzers stay initialized between files (see warm_up)
+        self._warm = False
 
     @classmethod
     def from_config(cls, auto_load_analyzers: bool = True) -> AnalyzeCommand:
@@ -230,6 +233,31 @@ class AnalyzeCommand:
         self.analyzers.append(self._analyzer_registry[name]())
         logger.info(f"Loaded registered analyzer: {name}")
 
+    async def warm_up(self) -> None:
+        """Initialize the loaded analyzers and keep them between files.
+
+        Long-running callers such as watch mode use this so analyzers, and
+        the LLM clients of markdown agents, are not torn down and re-created
+        for every file. Call :meth:`close` to release them.
+        """
+        for analyzer in self.analyzers:
+            if hasattr(analyzer, "initialize"):
+                await analyzer.initialize()
+        self._warm = True
+
+    async def close(self) -> None:
+        """Release analyzers kept initialized by :meth:`warm_up`."""
+        self._warm = False
+        await self._cleanup_analyzers()
+
+    async def _cleanup_analyzers(self) -> None:
+        """Clean up analyzer resources unless they are kept warm."""
+        if self._warm:
+            return
+        for analyzer in self.analyzers:
+            if hasattr(analyzer, "cleanup"):  # pragma: no cover
+                await analyzer.cleanup()
+
     async def analyze(
         self,
         path: Path | None = None,
@@ -432,9 +460,7 @@ class AnalyzeCommand:
                     if force or scene_needs_update(scene, self.analyzers):
                         updated_scenes.append(scene)
                 # Clean up and return early
-                for analyzer in self.analyzers:
-                    if hasattr(analyzer, "cleanup"):  # pragma: no cover
-                        await analyzer.cleanup()
+                await self._cleanup_analyzers()
                 logger.debug(f"Dry run mode - not writing to {file_path}")
                 return FileResult(
                     path=file_path,
@@ -467,7 +493,8 @@ class AnalyzeCommand:
 
                     for analyzer in self.analyzers:
                         try:
-                            result = await analyzer.analyze(scene_data)
+                            with span(f"analyze.{analyzer.name}"):
+                                result = await analyzer.analyze(scene_data)
                             # Store the result directly with version at top level
                             analyzer_result = result if result else {}
                             if hasattr(analyzer, "version"):  # pragma: no cover
@@ -518,9 +545,7 @@ class AnalyzeCommand:
                     updated_scenes.append(scene)
 
             # Clean up analyzers
-            for analyzer in self.analyzers:
-                if hasattr(analyzer, "cleanup"):  # pragma: no cover
-                    await analyzer.cleanup()
+            await self._cleanup_analyzers()
 
             # Write back to file if there are updates
             # Only write if scenes actually have new metadata
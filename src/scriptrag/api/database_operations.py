@@ -64,6 +64,16 @@ class DatabaseOperations:
         with self._conn_manager.transaction() as conn:
             yield conn
 
+    @contextmanager
+    def readonly(self) -> Generator[sqlite3.Connection, None, None]:
+        """Get a read-only database context.
+
+        Yields:
+            Database connection that cannot write
+        """
+        with self._conn_manager.readonly() as conn:
+            yield conn
+
     def check_database_exists(self) -> bool:
         """Check if the database exists and is initialized.
 
@@ -203,6 +213,21 @@ class DatabaseOperations:
         """
         return self._scene_ops.insert_actions(conn, scene_id, actions)
 
+    def get_scene_details(
+        self, conn: sqlite3.Connection, scene_ids: list[int]
+    ) -> dict[int, dict[str, Any]]:
+        """Get scene position and script metadata for many scenes at once.
+
+        Args:
+            conn: Database connection
+            scene_ids: IDs of the scenes to look up
+
+        Returns:
+            Mapping of scene ID to scene_number, time_of_day, script_title,
+            script_author, season and episode
+        """
+        return self._scene_ops.get_scene_details(conn, scene_ids)
+
     # Embedding operations - delegate to embedding operations module
     def upsert_embedding(
         self,
@@ -283,7 +308,7 @@ class DatabaseOperations:
         query_embedding: bytes,
         script_id: int | None,
         embedding_model: str,
-        limit: int = 10,
+        limit: int | None = 10,
     ) -> list[dict[str, Any]]:
         """Search for similar scenes using vector similarity.
 
@@ -296,7 +321,7 @@ class DatabaseOperations:
             query_embedding: Query embedding vector (binary)
             script_id: Optional script ID to limit search
             embedding_model: Model used for embeddings
-            limit: Maximum number of results
+            limit: Maximum number of results (None returns every candidate)
 
         Returns:
             List of scene records with similarity scores
@@ -304,3 +329,23 @@ class DatabaseOperations:
         return self._embedding_ops.search_similar_scenes(
             conn, query_embedding, script_id, embedding_model, limit
         )
+
+    def get_scene_candidates(
+        self,
+        conn: sqlite3.Connection,
+        scene_ids: list[int],
+        embedding_model: str,
+    ) -> list[dict[str, Any]]:
+        """Get scenes with their embeddings by ID, e.g. from an ANN index.
+
+        Args:
+            conn: Database connection
+            scene_ids: IDs of the candidate scenes
+            embedding_model: Model used for embeddings
+
+        Returns:
+            Scene records in the shape returned by ``search_similar_scenes``
+        """
+        return self._embedding_ops.get_scene_candidates(
+            conn, scene_ids, embedding_model
+        )
@@ -52,6 +52,16 @@ class DatabaseConnectionManager:
         with self._manager.transaction() as conn:
             yield conn
 
+    @contextmanager
+    def readonly(self) -> Generator[sqlite3.Connection, None, None]:
+        """Get a read-only database context.
+
+        Yields:
+            Pooled database connection in query-only mode
+        """
+        with self._manager.readonly() as conn:
+            yield conn
+
     def check_database_exists(self) -> bool:
         """Check if the database exists and is initialized.
 
@@ -165,7 +165,7 @@ class EmbeddingOperations:
         _query_embedding: bytes,
         script_id: int | None,
         embedding_model: str,
-        limit: int = 10,
+        limit: int | None = 10,
     ) -> list[dict[str, Any]]:
         """Search for similar scenes using vector similarity.
 
@@ -178,7 +178,7 @@ class EmbeddingOperations:
             _query_embedding: Query embedding vector (binary, reserved for future use)
             script_id: Optional script ID to limit search
             embedding_model: Model used for embeddings
-            limit: Maximum number of results
+            limit: Maximum number of results (None returns every candidate)
 
         Returns:
             List of scene records with similarity scores
@@ -221,3 +221,43 @@ class EmbeddingOperations:
 
         # Return scenes with embeddings for external similarity calculation
         return scenes[:limit]  # Limit applied after retrieval for now
+
+    def get_scene_candidates(
+        self,
+        conn: sqlite3.Connection,
+        scene_ids: list[int],
+        embedding_model: str,
+    ) -> list[dict[str, Any]]:
+        """Get scenes with their embeddings by ID, e.g. from an ANN index.
+
+        Args:
+            conn: Database connection
+            scene_ids: IDs of the candidate scenes
+            embedding_model: Model used for embeddings
+
+        Returns:
+            Scene records in the shape returned by ``search_similar_scenes``
+        """
+        if not scene_ids:
+            return []
+
+        placeholders = ",".join("?" * len(scene_ids))
+        cursor = conn.execute(
+            f"""
+            SELECT s.*, e.embedding
+            FROM scenes s
+            JOIN embeddings e ON e.entity_id = s.id
+            WHERE s.id IN ({placeholders})
+            AND e.entity_type = 'scene'
+            AND e.embedding_model = ?
+            AND e.embedding IS NOT NULL
+            """,
+            (*scene_ids, embedding_model),
+        )
+
+        scenes = []
+        for row in cursor:
+            scene_dict = dict(row)
+            scene_dict["_embedding"] = scene_dict.pop("embedding")
+            scenes.append(scene_dict)
+        return scenes
@@ -253,3 +253,42 @@ class SceneOperations:
 
         logger.debug(f"Inserted {count} actions for scene {scene_id}")
         return count
+
+    def get_scene_details(
+        self, conn: sqlite3.Connection, scene_ids: list[int]
+    ) -> dict[int, dict[str, Any]]:
+        """Get scene position and script metadata for many scenes at once.
+
+        Args:
+            conn: Database connection
+            scene_ids: IDs of the scenes to look up
+
+        Returns:
+            Mapping of scene ID to a dict with scene_number, time_of_day,
+            script_title, script_author, season and episode; unknown scene IDs
+            are left out
+        """
+        if not scene_ids:
+            return {}
+
+        placeholders = ", ".join("?" for _ in scene_ids)
+        cursor = conn.execute(
+            f"""
+            SELECT sc.id AS scene_id, sc.scene_number, sc.time_of_day,
+                   s.title AS script_title, s.author AS script_author,
+                   COALESCE(s.season, json_extract(s.metadata, '$.season'))
+                       AS season,
+                   COALESCE(s.episode, json_extract(s.metadata, '$.episode'))
+                       AS episode
+            FROM scenes sc
+            JOIN scripts s ON s.id = sc.script_id
+            WHERE sc.id IN ({placeholders})
+            """,
+            list(scene_ids),
+        )
+        columns = [column[0] for column in cursor.description]
+        details = {}
+        for row in cursor:
+            detail = dict(zip(columns, row, strict=True))
+            details[detail.pop("scene_id")] = detail
+        return details
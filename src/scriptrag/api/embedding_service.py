@@ -7,6 +7,7 @@ from typing import Any
 
 import numpy as np
 
+from scriptrag.common.profiling import timed
 from scriptrag.config import ScriptRAGSettings, get_logger
 from scriptrag.embeddings import (
     EmbeddingCache,
@@ -16,7 +17,7 @@ from scriptrag.embeddings import (
 )
 from scriptrag.embeddings.batch_processor import BatchProcessor
 from scriptrag.embeddings.cache import InvalidationStrategy
-from scriptrag.embeddings.dimensions import DimensionManager
+from scriptrag.embeddings.dimensions import DimensionManager, StoragePrecision
 from scriptrag.embeddings.pipeline import PipelineConfig
 from scriptrag.embeddings.similarity import SimilarityMetric
 from scriptrag.embeddings.vector_store import (
@@ -29,6 +30,17 @@ from scriptrag.llm.client import LLMClient
 logger = get_logger(__name__)
 
 
+def _get_storage_precision(settings: Any) -> StoragePrecision:
+    """Read the embedding storage precision, defaulting to float32.
+
+    Settings objects without the field (e.g. test doubles) keep float32.
+    """
+    name = getattr(settings, "embedding_storage_precision", None)
+    if not isinstance(name, str):
+        return StoragePrecision.FLOAT32
+    return StoragePrecision.from_name(name)
+
+
 class EmbeddingService:
     """Service for generating and managing embeddings for screenplay content."""
 
@@ -55,7 +67,8 @@ class EmbeddingService:
         # Initialize new architecture components
         self.dimension_manager = DimensionManager()
         self.similarity_calculator = SimilarityCalculator(SimilarityMetric.COSINE)
-        self.serializer = BinaryEmbeddingSerializer()
+        self.storage_precision = _get_storage_precision(settings)
+        self.serializer = BinaryEmbeddingSerializer(self.storage_precision)
 
         # Setup cache
         if cache_dir is None:
@@ -66,7 +79,9 @@ class EmbeddingService:
         )
 
         # Setup vector stores
-        self.lfs_store = GitLFSVectorStore(Path(".embeddings"))
+        self.lfs_store = GitLFSVectorStore(
+            Path(".embeddings"), precision=self.storage_precision
+        )
         self.vector_store: VectorStore = self.lfs_store
 
         # Setup batch processor
@@ -91,6 +106,7 @@ class EmbeddingService:
             dimension_manager=self.dimension_manager,
         )
 
+    @timed("embedding.generate")
     async def generate_embedding(
         self, text: str, model: str | None = None, use_cache: bool = True
     ) -> list[float]:
@@ -229,6 +245,23 @@ class EmbeddingService:
         """
         return self.serializer.decode(data)
 
+    def approximate_similarities(
+        self,
+        query_embedding: list[float] | list[list[float]],
+        blobs: list[bytes],
+    ) -> np.ndarray:
+        """Estimate cosine similarities of stored embeddings in one pass.
+
+        Args:
+            query_embedding: Query vector, or a list of query vectors
+            blobs: Embeddings as stored in the database
+
+        Returns:
+            One estimate per blob (one row per query for several queries),
+            NaN where a blob cannot be scored
+        """
+        return self.serializer.approximate_similarities(blobs, query_embedding)
+
     def cosine_similarity(self, vec1: list[float], vec2: list[float]) -> float:
         """Calculate cosine similarity between two vectors.
 
@@ -320,6 +353,40 @@ class EmbeddingService:
         # Use pipeline for batch generation
         return await self.pipeline.generate_batch(texts)
 
+    @timed("embedding.generate")
+    async def generate_query_embeddings(
+        self, texts: list[str], model: str | None = None
+    ) -> list[list[float]]:
+        """Generate embeddings for several query texts with one request.
+
+        Args:
+            texts: Query texts to embed
+            model: Model to use (defaults to service default)
+
+        Returns:
+            One embedding vector per text
+
+        Raises:
+            ScriptRAGError: If embedding generation fails
+        """
+        model = model or self.default_model
+
+        # Update pipeline config if needed
+        if model != self.pipeline_config.model:
+            self.pipeline_config.model = model
+            dimensions = self.dimension_manager.get_dimensions(model)
+            if dimensions:
+                self.pipeline_config.dimensions = dimensions
+
+        try:
+            return await self.pipeline.generate_combined(texts)
+        except Exception as e:
+            raise ScriptRAGError(
+                message=f"Failed to generate embeddings: {e}",
+                hint="Check LLM provider configuration and API limits",
+                details={"model": model, "texts": len(texts)},
+            ) from e
+
     def get_embedding_stats(self) -> dict[str, Any]:
         """Get comprehensive embedding statistics.
 
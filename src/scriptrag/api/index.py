@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sqlite3
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -15,7 +16,9 @@ from scriptrag.api.embedding_service import EmbeddingService
 from scriptrag.api.index_bible_aliases import IndexBibleAliasApplicator
 from scriptrag.api.index_embeddings import IndexEmbeddingProcessor
 from scriptrag.api.list import FountainMetadata, ScriptLister
+from scriptrag.common.profiling import span
 from scriptrag.config import ScriptRAGSettings, get_logger, get_settings
+from scriptrag.embeddings.ann_index import get_ann_store
 from scriptrag.parser import FountainParser, Script
 
 logger = get_logger(__name__)
@@ -233,6 +236,9 @@ class IndexCommand:
                             f"{script_result.path}: {script_result.error}"
                         )
 
+            if not dry_run:
+                self._sync_ann_indexes()
+
             if progress_callback:
                 progress_callback(1.0, "Indexing complete")
 
@@ -242,6 +248,89 @@ class IndexCommand:
 
         return result
 
+    async def index_files(
+        self, paths: list[Path], dry_run: bool = False
+    ) -> IndexOperationResult:
+        """Index specific Fountain files in a single transaction.
+
+        Used by watch mode, which indexes each batch of changed files
+        together. Every script is written under its own savepoint, so a
+        script that fails to index is rolled back without losing the others.
+
+        Args:
+            paths: Fountain files to index
+            dry_run: Preview changes without applying them
+
+        Returns:
+            IndexOperationResult with details of the operation
+        """
+        result = IndexOperationResult()
+
+        if not self.db_ops.check_database_exists():
+            error_msg = "Database not initialized. Please run 'scriptrag init' first."
+            logger.error(error_msg)
+            result.errors.append(error_msg)
+            return result
+
+        scripts: list[tuple[Path, Script]] = []
+        for path in paths:
+            for script_meta in await self._discover_scripts(path, recursive=False):
+                file_path = script_meta.file_path
+                try:
+                    scripts.append((file_path, self.parser.parse_file(file_path)))
+                except Exception as e:
+                    logger.error(f"Failed to parse {file_path}: {e}")
+                    result.scripts.append(
+                        IndexResult(path=file_path, indexed=False, error=str(e))
+                    )
+                    result.errors.append(f"{file_path}: {e}")
+        if not scripts:
+            return result
+
+        if dry_run:
+            for file_path, script in scripts:
+                result.scripts.append(await self._dry_run_analysis(script, file_path))
+            return result
+
+        with (
+            span("db.write", scripts=len(scripts)),
+            self.db_ops.transaction() as conn,
+        ):
+            if not conn.in_transaction:
+                # Savepoints must not open the transaction themselves, or
+                # releasing the first one would commit it
+                conn.execute("BEGIN")
+            for file_path, script in scripts:
+                conn.execute("SAVEPOINT index_script")
+                try:
+                    result.scripts.append(
+                        await self._write_script(conn, script, file_path)
+                    )
+                except Exception as e:
+                    conn.execute("ROLLBACK TO SAVEPOINT index_script")
+                    logger.error(f"Failed to index {file_path}: {e}")
+                    result.scripts.append(
+                        IndexResult(path=file_path, indexed=False, error=str(e))
+                    )
+                    result.errors.append(f"{file_path}: {e}")
+                finally:
+                    conn.execute("RELEASE SAVEPOINT index_script")
+
+        self._sync_ann_indexes()
+        return result
+
+    def _sync_ann_indexes(self) -> None:
+        """Extend or rebuild the ANN indexes with newly indexed embeddings."""
+        store = get_ann_store(self.settings)
+        if store is None:
+            return
+        try:
+            with self.db_ops.transaction() as conn:
+                store.sync_all(conn, ["scene"])
+        except Exception as e:
+            # Searches fall back to exact scoring while the index is stale
+            logger.warning(f"Failed to update ANN index: {e!s}")
+
     async def _discover_scripts(
         self, path: Path | None, recursive: bool
     ) -> list[FountainMetadata]:
@@ -351,86 +440,102 @@ class IndexCommand:
                 return await self._dry_run_analysis(script, file_path)
 
             # Process with transaction
-            with self.db_ops.transaction() as conn:
-                # Check if script exists
-                existing = self.db_ops.get_existing_script(conn, file_path)
-                is_update: bool = existing is not None
-
-                # Always clear existing data when updating to ensure consistency
-                if existing and existing.id is not None:
-                    self.db_ops.clear_script_data(conn, existing.id)
-
-                # Upsert script
-                script_id: int = self.db_ops.upsert_script(conn, script, file_path)
-
-                # Extract all unique characters from all scenes
-                all_characters: set[str] = set()
-                for scene in script.scenes:
-                    for dialogue in scene.dialogue_lines:
-                        all_characters.add(dialogue.character)
-
-                # Upsert all characters
-                character_map: dict[str, int] = {}
-                if all_characters:
-                    character_map = self.db_ops.upsert_characters(
-                        conn, script_id, all_characters
-                    )
-                    # Apply Bible aliases if available
-                    await IndexBibleAliasApplicator.apply_bible_aliases(
-                        conn, script_id, character_map
-                    )
+            with (
+                span("db.write", script=file_path.name),
+                self.db_ops.transaction() as conn,
+            ):
+                return await self._write_script(conn, script, file_path)
 
-                # Process scenes
-                total_dialogues: int = 0
-                total_actions: int = 0
-
-                for scene in script.scenes:
-                    # Clear existing scene content if updating
-                    # Upsert scene and check if content changed
-                    scene_id: int
-                    content_changed: bool
-                    scene_id, content_changed = self.db_ops.upsert_scene(
-                        conn, scene, script_id
-                    )
+        except Exception as e:
+            logger.error(f"Error indexing {file_path}: {e}")
+            raise
 
-                    # Clear and re-insert content if it has changed
-                    if content_changed:
-                        self.db_ops.clear_scene_content(conn, scene_id)
+    async def _write_script(
+        self, conn: sqlite3.Connection, script: Script, file_path: Path
+    ) -> IndexResult:
+        """Write a parsed script and its scenes within an open transaction.
 
-                        # Insert dialogues
-                        dialogue_count: int = self.db_ops.insert_dialogues(
-                            conn, scene_id, scene.dialogue_lines, character_map
-                        )
-                        total_dialogues += dialogue_count
+        Args:
+            conn: Database connection
+            script: Parsed script object
+            file_path: Path to the script file
 
-                        # Insert actions
-                        action_count: int = self.db_ops.insert_actions(
-                            conn, scene_id, scene.action_lines
-                        )
-                        total_actions += action_count
+        Returns:
+            IndexResult for this script
+        """
+        # Check if script exists
+        existing = self.db_ops.get_existing_script(conn, file_path)
+        is_update: bool = existing is not None
 
-                    # Process embeddings from boneyard metadata
-                    await self.embedding_processor.process_scene_embeddings(
-                        conn, scene, scene_id
-                    )
+        # Always clear existing data when updating to ensure consistency
+        if existing and existing.id is not None:
+            self.db_ops.clear_script_data(conn, existing.id)
+
+        # Upsert script
+        script_id: int = self.db_ops.upsert_script(conn, script, file_path)
+
+        # Extract all unique characters from all scenes
+        all_characters: set[str] = set()
+        for scene in script.scenes:
+            for dialogue in scene.dialogue_lines:
+                all_characters.add(dialogue.character)
+
+        # Upsert all characters
+        character_map: dict[str, int] = {}
+        if all_characters:
+            character_map = self.db_ops.upsert_characters(
+                conn, script_id, all_characters
+            )
+            # Apply Bible aliases if available
+            await IndexBibleAliasApplicator.apply_bible_aliases(
+                conn, script_id, character_map
+            )
+
+        # Process scenes
+        total_dialogues: int = 0
+        total_actions: int = 0
 
-                # Get final stats
-                stats: dict[str, int] = self.db_ops.get_script_stats(conn, script_id)
-
-                return IndexResult(
-                    path=file_path,
-                    script_id=script_id,
-                    indexed=True,  # Successfully processed regardless of new/update
-                    updated=is_update,  # Only updated if it existed
-                    scenes_indexed=stats["scenes"],
-                    characters_indexed=stats["characters"],
-                    dialogues_indexed=stats["dialogues"],
-                    actions_indexed=stats["actions"],
+        for scene in script.scenes:
+            # Clear existing scene content if updating
+            # Upsert scene and check if content changed
+            scene_id: int
+            content_changed: bool
+            scene_id, content_changed = self.db_ops.upsert_scene(conn, scene, script_id)
+
+            # Clear and re-insert content if it has changed
+            if content_changed:
+                self.db_ops.clear_scene_content(conn, scene_id)
+
+                # Insert dialogues
+                dialogue_count: int = self.db_ops.insert_dialogues(
+                    conn, scene_id, scene.dialogue_lines, character_map
                 )
+                total_dialogues += dialogue_count
 
-        except Exception as e:
-            logger.error(f"Error indexing {file_path}: {e}")
-            raise
+                # Insert actions
+                action_count: int = self.db_ops.insert_actions(
+                    conn, scene_id, scene.action_lines
+                )
+                total_actions += action_count
+
+            # Process embeddings from boneyard metadata
+            await self.embedding_processor.process_scene_embeddings(
+                conn, scene, scene_id
+            )
+
+        # Get final stats
+        stats: dict[str, int] = self.db_ops.get_script_stats(conn, script_id)
+
+        return IndexResult(
+            path=file_path,
+            script_id=script_id,
+            indexed=True,  # Successfully processed regardless of new/update
+            updated=is_update,  # Only updated if it existed
+            scenes_indexed=stats["scenes"],
+            characters_indexed=stats["characters"],
+            dialogues_indexed=stats["dialogues"],
+            actions_indexed=stats["actions"],
+        )
 
     async def _dry_run_analysis(self, script: Script, file_path: Path) -> IndexResult:
         """Analyze what would be indexed without making changes.
@@ -6,6 +6,7 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 
+from scriptrag.common.profiling import timed
 from scriptrag.config import get_logger
 from scriptrag.parser import FountainParser
 
@@ -58,6 +59,7 @@ class ScriptLister:
         )
         self._parser = FountainParser()
 
+    @timed("list")
     def list_scripts(
         self, path: Path | None = None, recursive: bool = True
     ) -> list[FountainMetadata]:
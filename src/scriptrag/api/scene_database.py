@@ -7,13 +7,22 @@ import sqlite3
 from datetime import datetime
 from typing import Any
 
-from scriptrag.api.scene_models import SceneIdentifier
+from scriptrag.api.scene_models import SceneIdentifier, SceneRead
 from scriptrag.config import get_logger
 from scriptrag.parser import Scene
 from scriptrag.utils import ScreenplayUtils
 
 logger = get_logger(__name__)
 
+SCENE_READS_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS scene_reads (
+        scene_id INTEGER PRIMARY KEY,
+        reader_id TEXT,
+        last_read_at TIMESTAMP NOT NULL,
+        FOREIGN KEY (scene_id) REFERENCES scenes (id) ON DELETE CASCADE
+    )
+"""
+
 
 class SceneDatabaseOperations:
     """Handles database operations for scenes."""
@@ -400,33 +409,48 @@ class SceneDatabaseOperations:
         cursor = conn.execute(query, params)
         return [row[0] for row in cursor.fetchall()]
 
-    def update_last_read(
-        self, conn: sqlite3.Connection, scene_id: SceneIdentifier, timestamp: datetime
-    ) -> None:
-        """Update the last_read_at timestamp for a scene."""
-        query = """
-            UPDATE scenes
-            SET last_read_at = ?
-            WHERE scene_number = ?
-                AND script_id = (
-                    SELECT id FROM scripts
-                    WHERE title = ?
+    def record_reads(self, conn: sqlite3.Connection, reads: list[SceneRead]) -> None:
+        """Store the latest read of each scene in the scene_reads table.
+
+        Reads are kept outside the scenes table so that recording them does not
+        touch scenes.updated_at, which update conflict detection relies on.
+        Older reads never overwrite newer ones.
         """
-        # Convert datetime to string for SQLite
-        timestamp_str = timestamp.isoformat()
-        params: list[Any] = [timestamp_str, scene_id.scene_number, scene_id.project]
+        # Databases created before scene_reads existed get it on first use
+        conn.execute(SCENE_READS_SCHEMA)
 
-        # Add season/episode conditions
-        if scene_id.season is not None:
-            query += " AND json_extract(metadata, '$.season') = ?"
-            params.append(scene_id.season)
+        for read in reads:
+            scene_id = read.scene_id
+            query = """
+                INSERT INTO scene_reads (scene_id, reader_id, last_read_at)
+                SELECT s.id, ?, ?
+                FROM scenes s
+                JOIN scripts sc ON s.script_id = sc.id
+                WHERE s.scene_number = ?
+                    AND sc.title = ?
+            """
+            params: list[Any] = [
+                read.reader_id,
+                read.read_at.isoformat(),
+                scene_id.scene_number,
+                scene_id.project,
+            ]
 
-        if scene_id.episode is not None:
-            query += " AND json_extract(metadata, '$.episode') = ?"
-            params.append(scene_id.episode)
+            if scene_id.season is not None:
+                query += " AND json_extract(sc.metadata, '$.season') = ?"
+                params.append(scene_id.season)
 
-        query += ")"
-        conn.execute(query, params)
+            if scene_id.episode is not None:
+                query += " AND json_extract(sc.metadata, '$.episode') = ?"
+                params.append(scene_id.episode)
+
+            query += """
+                ON CONFLICT (scene_id) DO UPDATE SET
+                    reader_id = excluded.reader_id,
+                    last_read_at = excluded.last_read_at
+                WHERE excluded.last_read_at > scene_reads.last_read_at
+            """
+            conn.execute(query, params)
 
     def get_last_modified(
         self, conn: sqlite3.Connection, scene_id: SceneIdentifier
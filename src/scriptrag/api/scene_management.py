@@ -17,12 +17,24 @@ from scriptrag.api.scene_models import (
     UpdateSceneResult,
 )
 from scriptrag.api.scene_parser import SceneParser
+from scriptrag.api.scene_reads import get_scene_read_tracker
 from scriptrag.api.scene_validator import FountainValidator
 from scriptrag.config import ScriptRAGSettings, get_logger
 
 logger = get_logger(__name__)
 
 
+def _as_utc(timestamp: datetime) -> datetime:
+    """Make a timestamp comparable, treating naive values as UTC.
+
+    SQLite's CURRENT_TIMESTAMP is UTC without an offset, while read
+    timestamps handed to clients carry one.
+    """
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=UTC)
+    return timestamp
+
+
 class SceneManagementAPI:
     """AI-friendly scene management interface."""
 
@@ -39,39 +51,44 @@ class SceneManagementAPI:
         self.scene_db = SceneDatabaseOperations()
         self.validator = FountainValidator()
         self.parser = SceneParser()
+        self.read_tracker = get_scene_read_tracker(self.settings)
 
     async def read_scene(
         self, scene_id: SceneIdentifier, reader_id: str = "ai_agent"
     ) -> ReadSceneResult:
-        """Read a scene and update last_read timestamp."""
+        """Read a scene and record the read.
+
+        The scene is read over a read-only connection. The read itself is
+        recorded in memory and written later in a batch with other reads.
+        """
         try:
-            with self.db_ops.transaction() as conn:
+            with self.db_ops.readonly() as conn:
                 # Get scene from database
                 scene = self.scene_db.get_scene_by_id(conn, scene_id)
-                if not scene:
-                    return ReadSceneResult(
-                        success=False,
-                        error=f"Scene not found: {scene_id.key}",
-                        scene=None,
-                        last_read=None,
-                    )
+            if not scene:
+                return ReadSceneResult(
+                    success=False,
+                    error=f"Scene not found: {scene_id.key}",
+                    scene=None,
+                    last_read=None,
+                )
 
-                # Update last_read_at timestamp
-                last_read = datetime.now(UTC)
-                self.scene_db.update_last_read(conn, scene_id, last_read)
+            last_read = datetime.now(UTC)
+            if self.read_tracker.record(scene_id, reader_id, last_read):
+                self.read_tracker.flush(self.db_ops)
 
-                logger.info(
-                    f"Scene read: {scene_id.key}",
-                    reader_id=reader_id,
-                    last_read=last_read.isoformat(),
-                )
+            logger.info(
+                f"Scene read: {scene_id.key}",
+                reader_id=reader_id,
+                last_read=last_read.isoformat(),
+            )
 
-                return ReadSceneResult(
-                    success=True,
-                    error=None,
-                    scene=scene,
-                    last_read=last_read,
-                )
+            return ReadSceneResult(
+                success=True,
+                error=None,
+                scene=scene,
+                last_read=last_read,
+            )
 
         except Exception as e:
             logger.error(f"Failed to read scene {scene_id.key}: {e}")
@@ -133,7 +150,7 @@ class SceneManagementAPI:
 
                     # Get last modified time
                     last_modified = self.scene_db.get_last_modified(conn, scene_id)
-                    if last_modified and last_modified > last_read:
+                    if last_modified and _as_utc(last_modified) > _as_utc(last_read):
                         return UpdateSceneResult(
                             success=False,
                             error=(
@@ -52,6 +52,15 @@ class SceneIdentifier:
         raise ValueError(f"Invalid scene key format: {key}")
 
 
+@dataclass(frozen=True)
+class SceneRead:
+    """A read of a scene awaiting persistence."""
+
+    scene_id: SceneIdentifier
+    reader_id: str
+    read_at: datetime
+
+
 @dataclass
 class ValidationResult:
     """Result of scene content validation."""
@@ -0,0 +1,169 @@
+"""Batched last-read tracking for scene management.
+
+Reading a scene must not take the SQLite write lock: agents browse many scenes
+while ``watch`` and ``index`` write. Reads are therefore collected in memory,
+one entry per scene, and written in a single short transaction once enough of
+them are pending, once they are old enough, or when the process exits.
+
+Last-read timestamps are advisory. Conflict detection in
+:meth:`~scriptrag.api.scene_management.SceneManagementAPI.update_scene`
+compares the caller's read timestamp with ``scenes.updated_at`` and does not
+depend on them, so a failed flush only loses bookkeeping.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from datetime import datetime
+
+from scriptrag.api.database_operations import DatabaseOperations
+from scriptrag.api.scene_database import SceneDatabaseOperations
+from scriptrag.api.scene_models import SceneIdentifier, SceneRead
+from scriptrag.config import ScriptRAGSettings, get_logger
+
+logger = get_logger(__name__)
+
+SceneKey = tuple[str, int | None, int | None, int]
+
+
+class SceneReadTracker:
+    """Collects scene reads for one database and flushes them in batches."""
+
+    def __init__(
+        self,
+        settings: ScriptRAGSettings,
+        max_pending: int = 64,
+        flush_interval: float = 5.0,
+    ) -> None:
+        """Initialize the tracker.
+
+        Args:
+            settings: Configuration settings identifying the database
+            max_pending: Number of pending scenes that triggers a flush
+            flush_interval: Seconds after which pending reads are flushed
+        """
+        self.settings = settings
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self._pending: dict[SceneKey, SceneRead] = {}
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._scene_db = SceneDatabaseOperations()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of scenes with reads not yet written."""
+        with self._lock:
+            return len(self._pending)
+
+    def record(
+        self, scene_id: SceneIdentifier, reader_id: str, read_at: datetime
+    ) -> bool:
+        """Record a scene read in memory.
+
+        Args:
+            scene_id: Scene that was read
+            reader_id: ID of the reader/agent
+            read_at: Time of the read
+
+        Returns:
+            True if pending reads are due to be flushed
+        """
+        key = (
+            scene_id.project,
+            scene_id.season,
+            scene_id.episode,
+            scene_id.scene_number,
+        )
+        with self._lock:
+            previous = self._pending.get(key)
+            if previous is None or previous.read_at <= read_at:
+                self._pending[key] = SceneRead(scene_id, reader_id, read_at)
+            return (
+                len(self._pending) >= self.max_pending
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+
+    def drain(self) -> list[SceneRead]:
+        """Take all pending reads.
+
+        Returns:
+            Pending reads, one per scene
+        """
+        with self._lock:
+            reads = list(self._pending.values())
+            self._pending.clear()
+            self._last_flush = time.monotonic()
+        return reads
+
+    def flush(self, db_ops: DatabaseOperations | None = None) -> int:
+        """Write pending reads in one transaction.
+
+        Args:
+            db_ops: Database operations to write through; created from the
+                tracker's settings if omitted
+
+        Returns:
+            Number of reads written (0 if there were none or the write failed)
+        """
+        reads = self.drain()
+        if not reads:
+            return 0
+
+        try:
+            db_ops = db_ops or DatabaseOperations(self.settings)
+            with db_ops.transaction() as conn:
+                self._scene_db.record_reads(conn, reads)
+        except Exception as e:
+            logger.warning(
+                "Failed to flush scene reads", count=len(reads), error=str(e)
+            )
+            return 0
+
+        logger.debug("Flushed scene reads", count=len(reads))
+        return len(reads)
+
+
+_trackers: dict[str, SceneReadTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_scene_read_tracker(settings: ScriptRAGSettings) -> SceneReadTracker:
+    """Get the process-wide read tracker for a database.
+
+    Scene management APIs are created per request (CLI commands, MCP tools),
+    so trackers live at module level to batch reads across requests.
+
+    Args:
+        settings: Configuration settings identifying the database
+
+    Returns:
+        Shared read tracker
+    """
+    db_path = str(settings.database_path)
+    with _trackers_lock:
+        tracker = _trackers.get(db_path)
+        if tracker is None:
+            tracker = SceneReadTracker(settings)
+            _trackers[db_path] = tracker
+        return tracker
+
+
+def flush_scene_reads() -> int:
+    """Flush pending reads of all trackers whose database still exists.
+
+    Returns:
+        Number of reads written
+    """
+    with _trackers_lock:
+        trackers = list(_trackers.values())
+    return sum(
+        tracker.flush()
+        for tracker in trackers
+        if tracker.pending_count and tracker.settings.database_path.exists()
+    )
+
+
+atexit.register(flush_scene_reads)
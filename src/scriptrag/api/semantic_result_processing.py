@@ -8,14 +8,76 @@ the public dataclasses to prevent circular imports; callers pass a
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
 from typing import Any
 
+import numpy as np
+
+from scriptrag.common.profiling import timed
 from scriptrag.config import get_logger
 
 logger = get_logger(__name__)
 
 
+@timed("vector.shortlist")
+def shortlist_candidates(
+    candidates: Sequence[dict[str, Any]],
+    *,
+    query_embedding: list[float],
+    embedding_service: Any,
+    embedding_key: str,
+    limit: int,
+) -> list[dict[str, Any]]:
+    """Keep the ``limit`` candidates with the best approximate similarity.
+
+    All candidates are scored in one vectorised pass over their stored (and
+    possibly quantised) embeddings, so only the shortlist is decoded and
+    rescored exactly. Candidates that cannot be scored approximately are kept
+    so that the exact pass reports them as before.
+    """
+    if len(candidates) <= limit:
+        return list(candidates)
+
+    scores = embedding_service.approximate_similarities(
+        query_embedding, [candidate.get(embedding_key) for candidate in candidates]
+    )
+    return _best_candidates(candidates, scores, limit)
+
+
+@timed("vector.shortlist")
+def shortlist_candidate_sets(
+    candidates: Sequence[dict[str, Any]],
+    *,
+    query_embeddings: list[list[float]],
+    embedding_service: Any,
+    embedding_key: str,
+    limit: int,
+) -> list[list[dict[str, Any]]]:
+    """Shortlist candidates for several queries with one matrix product.
+
+    Returns one shortlist per query, as :func:`shortlist_candidates` would
+    for each query on its own.
+    """
+    if len(candidates) <= limit:
+        return [list(candidates) for _ in query_embeddings]
+
+    scores = embedding_service.approximate_similarities(
+        query_embeddings, [candidate.get(embedding_key) for candidate in candidates]
+    )
+    return [_best_candidates(candidates, row, limit) for row in scores]
+
+
+def _best_candidates(
+    candidates: Sequence[dict[str, Any]], scores: np.ndarray, limit: int
+) -> list[dict[str, Any]]:
+    """Candidates with the ``limit`` best scores plus any unscored ones."""
+    unscored = np.isnan(scores)
+    ranked = np.argsort(-np.where(unscored, -np.inf, scores), kind="stable")
+    keep = set(ranked[:limit].tolist()) | set(np.flatnonzero(unscored).tolist())
+    return [candidate for i, candidate in enumerate(candidates) if i in keep]
+
+
+@timed("vector.score")
 def build_scene_results(
     candidates: Iterable[dict[str, Any]],
     *,
@@ -80,6 +142,24 @@ def build_scene_results(
     return results
 
 
+def hydrate_scene_results(
+    results: Iterable[Any], details: dict[int, dict[str, Any]]
+) -> None:
+    """Copy batched scene details onto scene results in place.
+
+    ``details`` maps scene IDs to the columns returned by
+    ``DatabaseOperations.get_scene_details``; results without an entry are
+    left unchanged.
+    """
+    for result in results:
+        detail = details.get(result.scene_id)
+        if detail is None:
+            continue
+        for name, value in detail.items():
+            setattr(result, name, value)
+
+
+@timed("vector.score")
 def build_bible_results(
     chunks: Iterable[dict[str, Any]],
     *,
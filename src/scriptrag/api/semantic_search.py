@@ -6,6 +6,7 @@ operations to internal helpers to keep this file lean and maintainable.
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 
@@ -23,10 +24,31 @@ from scriptrag.api.semantic_result_processing import (
 from scriptrag.api.semantic_result_processing import (
     build_scene_results as _build_scene_results,
 )
+from scriptrag.api.semantic_result_processing import (
+    hydrate_scene_results as _hydrate_scene_results,
+)
+from scriptrag.api.semantic_result_processing import (
+    shortlist_candidate_sets as _shortlist_candidate_sets,
+)
+from scriptrag.api.semantic_result_processing import (
+    shortlist_candidates as _shortlist_candidates,
+)
 from scriptrag.config import ScriptRAGSettings, get_logger
+from scriptrag.embeddings.ann_index import AnnIndexStore, get_ann_store
 
 logger = get_logger(__name__)
 
+# Candidates kept per requested result by the ANN index and by approximate
+# scoring; they are rescored exactly, so oversampling trades a little latency
+# for recall
+RESCORE_CANDIDATE_FACTOR = 4
+RESCORE_MIN_CANDIDATES = 50
+
+
+def _rescore_limit(top_k: int) -> int:
+    """Number of candidates to rescore exactly for ``top_k`` results."""
+    return max(top_k * RESCORE_CANDIDATE_FACTOR, RESCORE_MIN_CANDIDATES)
+
 
 @dataclass
 class SceneSearchResult:
@@ -39,6 +61,12 @@ class SceneSearchResult:
     content: str
     similarity_score: float
     metadata: dict[str, Any] | None = None
+    scene_number: int | None = None
+    time_of_day: str | None = None
+    script_title: str | None = None
+    script_author: str | None = None
+    season: int | None = None
+    episode: int | None = None
 
 
 @dataclass
@@ -75,6 +103,45 @@ class SemanticSearchService:
         self.settings = settings
         self.db_ops = db_ops or DatabaseOperations(settings)
         self.embedding_service = embedding_service or EmbeddingService(settings)
+        self.ann_store: AnnIndexStore | None = get_ann_store(settings)
+
+    def _ann_candidate_ids(
+        self,
+        conn: Any,
+        entity_type: str,
+        model: str,
+        query_embedding: list[float],
+        top_k: int,
+    ) -> list[int] | None:
+        """Get candidate IDs from the ANN index, or None to search exactly.
+
+        Exact search is used when the index is disabled, missing, stale or
+        built for vectors of another dimensionality.
+        """
+        if self.ann_store is None:
+            return None
+        index = self.ann_store.fresh_index(conn, entity_type, model)
+        if index is None:
+            return None
+        try:
+            neighbours = index.search(
+                query_embedding, _rescore_limit(top_k), self.ann_store.probes
+            )
+        except ValueError:
+            return None
+        return [entity_id for entity_id, _score in neighbours]
+
+    def _sync_ann_index(self, entity_type: str, model: str) -> None:
+        """Apply new embeddings to the ANN index after they were committed."""
+        if self.ann_store is None:
+            return
+        with self.db_ops.transaction() as conn:
+            self.ann_store.sync(
+                conn,
+                entity_type,
+                model,
+                decode=self.embedding_service.decode_embedding_from_db,
+            )
 
     async def search_similar_scenes(
         self,
@@ -83,6 +150,7 @@ class SemanticSearchService:
         top_k: int = 10,
         threshold: float = 0.5,
         model: str | None = None,
+        query_embedding: list[float] | None = None,
     ) -> list[SceneSearchResult]:
         """Search for scenes similar to a query text.
 
@@ -92,6 +160,8 @@ class SemanticSearchService:
             top_k: Number of top results to return
             threshold: Minimum similarity threshold
             model: Embedding model to use (defaults to service default)
+            query_embedding: Precomputed embedding of the query, to share one
+                embedding request between several searches
 
         Returns:
             List of scene search results sorted by similarity
@@ -99,20 +169,21 @@ class SemanticSearchService:
         model = model or self.embedding_service.default_model
 
         # Generate embedding for query with error handling
-        try:
-            query_embedding: list[
-                float
-            ] = await self.embedding_service.generate_embedding(query, model)
-        except Exception as e:
-            logger.error(
-                "Failed to generate embedding for query",
-                query=query[:100],  # Truncate long queries for logging
-                model=model,
-                error=str(e),
-            )
-            raise ValueError(
-                f"Failed to generate embedding for search query: {e}"
-            ) from e
+        if query_embedding is None:
+            try:
+                query_embedding = await self.embedding_service.generate_embedding(
+                    query, model
+                )
+            except Exception as e:
+                logger.error(
+                    "Failed to generate embedding for query",
+                    query=query[:100],  # Truncate long queries for logging
+                    model=model,
+                    error=str(e),
+                )
+                raise ValueError(
+                    f"Failed to generate embedding for search query: {e}"
+                ) from e
 
         # Encode embedding for database storage
         try:
@@ -129,10 +200,31 @@ class SemanticSearchService:
                 f"Failed to encode embedding for database storage: {e}"
             ) from e
 
-        # Search in database and process results
+        # Search in database and process results on a worker thread so that
+        # concurrent searches are not blocked by SQLite and vector scoring
+        return await asyncio.to_thread(
+            self._score_scenes,
+            query_bytes,
+            query_embedding,
+            script_id,
+            model,
+            threshold,
+            top_k,
+        )
+
+    def _score_scenes(
+        self,
+        query_bytes: bytes,
+        query_embedding: list[float],
+        script_id: int | None,
+        model: str,
+        threshold: float,
+        top_k: int,
+    ) -> list[SceneSearchResult]:
+        """Fetch candidate scenes and rank them by similarity to the query."""
         with self.db_ops.transaction() as conn:
-            candidates: list[dict[str, Any]] = self.db_ops.search_similar_scenes(
-                conn, query_bytes, script_id, model, limit=100
+            candidates: list[dict[str, Any]] = self._scene_candidates(
+                conn, query_bytes, query_embedding, script_id, model, top_k
             )
 
             results: list[SceneSearchResult] = _build_scene_results(
@@ -141,8 +233,179 @@ class SemanticSearchService:
                 embedding_service=self.embedding_service,
                 threshold=threshold,
                 builder=SceneSearchResult,
+            )[:top_k]
+            _hydrate_scene_results(
+                results,
+                self.db_ops.get_scene_details(conn, [r.scene_id for r in results]),
             )
-            return results[:top_k]
+            return results
+
+    def _scene_candidates(
+        self,
+        conn: Any,
+        query_bytes: bytes,
+        query_embedding: list[float],
+        script_id: int | None,
+        model: str,
+        top_k: int,
+    ) -> list[dict[str, Any]]:
+        """Fetch scenes to rescore exactly.
+
+        Candidates come from the ANN index when possible; otherwise every
+        stored embedding is scored approximately and the best are kept.
+        """
+        if script_id is None:
+            candidate_ids = self._ann_candidate_ids(
+                conn, "scene", model, query_embedding, top_k
+            )
+            if candidate_ids is not None:
+                return self.db_ops.get_scene_candidates(conn, candidate_ids, model)
+        candidates = self.db_ops.search_similar_scenes(
+            conn, query_bytes, script_id, model, limit=None
+        )
+        return _shortlist_candidates(
+            candidates,
+            query_embedding=query_embedding,
+            embedding_service=self.embedding_service,
+            embedding_key="_embedding",
+            limit=_rescore_limit(top_k),
+        )
+
+    async def search_similar_scenes_batch(
+        self,
+        queries: list[str],
+        script_id: int | None = None,
+        top_k: int = 10,
+        threshold: float = 0.5,
+        model: str | None = None,
+        query_embeddings: list[list[float]] | None = None,
+    ) -> list[list[SceneSearchResult]]:
+        """Search for scenes similar to each of several query texts.
+
+        All queries are embedded with one request and scored against the
+        stored embeddings together, which is much cheaper than calling
+        :meth:`search_similar_scenes` once per query.
+
+        Args:
+            queries: Query texts to search for
+            script_id: Optional script ID to limit search
+            top_k: Number of top results to return per query
+            threshold: Minimum similarity threshold
+            model: Embedding model to use (defaults to service default)
+            query_embeddings: Precomputed embeddings of the queries
+
+        Returns:
+            One list of scene search results per query, in query order
+        """
+        if not queries:
+            return []
+        model = model or self.embedding_service.default_model
+
+        if query_embeddings is None:
+            try:
+                query_embeddings = (
+                    await self.embedding_service.generate_query_embeddings(
+                        queries, model
+                    )
+                )
+            except Exception as e:
+                logger.error(
+                    "Failed to generate embeddings for queries",
+                    queries=len(queries),
+                    model=model,
+                    error=str(e),
+                )
+                raise ValueError(
+                    f"Failed to generate embeddings for search queries: {e}"
+                ) from e
+        if len(query_embeddings) != len(queries):
+            raise ValueError(
+                f"Expected {len(queries)} query embeddings, got {len(query_embeddings)}"
+            )
+
+        return await asyncio.to_thread(
+            self._score_scene_batch,
+            query_embeddings,
+            script_id,
+            model,
+            threshold,
+            top_k,
+        )
+
+    def _score_scene_batch(
+        self,
+        query_embeddings: list[list[float]],
+        script_id: int | None,
+        model: str,
+        threshold: float,
+        top_k: int,
+    ) -> list[list[SceneSearchResult]]:
+        """Rank candidate scenes for every query in one transaction."""
+        with self.db_ops.transaction() as conn:
+            candidate_sets = self._scene_candidate_sets(
+                conn, query_embeddings, script_id, model, top_k
+            )
+
+            batches: list[list[SceneSearchResult]] = [
+                _build_scene_results(
+                    candidates,
+                    query_embedding=query_embedding,
+                    embedding_service=self.embedding_service,
+                    threshold=threshold,
+                    builder=SceneSearchResult,
+                )[:top_k]
+                for query_embedding, candidates in zip(
+                    query_embeddings, candidate_sets, strict=True
+                )
+            ]
+            details = self.db_ops.get_scene_details(
+                conn, list({r.scene_id for results in batches for r in results})
+            )
+            for results in batches:
+                _hydrate_scene_results(results, details)
+            return batches
+
+    def _scene_candidate_sets(
+        self,
+        conn: Any,
+        query_embeddings: list[list[float]],
+        script_id: int | None,
+        model: str,
+        top_k: int,
+    ) -> list[list[dict[str, Any]]]:
+        """Fetch scenes to rescore exactly for each query.
+
+        With a fresh ANN index the union of every query's candidates is
+        fetched at once; otherwise the stored embeddings are read once and
+        scored approximately against all queries in one matrix product.
+        """
+        if script_id is None:
+            id_sets: list[list[int]] = []
+            for query_embedding in query_embeddings:
+                candidate_ids = self._ann_candidate_ids(
+                    conn, "scene", model, query_embedding, top_k
+                )
+                if candidate_ids is None:
+                    break
+                id_sets.append(candidate_ids)
+            else:
+                union = sorted({i for ids in id_sets for i in ids})
+                rows = {
+                    row["id"]: row
+                    for row in self.db_ops.get_scene_candidates(conn, union, model)
+                }
+                return [[rows[i] for i in ids if i in rows] for ids in id_sets]
+
+        candidates = self.db_ops.search_similar_scenes(
+            conn, b"", script_id, model, limit=None
+        )
+        return _shortlist_candidate_sets(
+            candidates,
+            query_embeddings=query_embeddings,
+            embedding_service=self.embedding_service,
+            embedding_key="_embedding",
+            limit=_rescore_limit(top_k),
+        )
 
     async def find_related_scenes(
         self,
@@ -192,8 +455,13 @@ class SemanticSearchService:
                 return []
 
             # Get scenes with embeddings
-            candidates: list[dict[str, Any]] = self.db_ops.search_similar_scenes(
-                conn, source_embedding_bytes, script_id, model, limit=100
+            candidates: list[dict[str, Any]] = self._scene_candidates(
+                conn,
+                source_embedding_bytes,
+                source_embedding,
+                script_id,
+                model,
+                top_k + 1,
             )
 
             results: list[SceneSearchResult] = _build_scene_results(
@@ -203,8 +471,12 @@ class SemanticSearchService:
                 threshold=threshold,
                 builder=SceneSearchResult,
                 skip_id=scene_id,
+            )[:top_k]
+            _hydrate_scene_results(
+                results,
+                self.db_ops.get_scene_details(conn, [r.scene_id for r in results]),
             )
-            return results[:top_k]
+            return results
 
     async def generate_missing_embeddings(
         self,
@@ -233,6 +505,7 @@ class SemanticSearchService:
                 script_id=script_id,
                 batch_size=batch_size,
             )
+        self._sync_ann_index("scene", model)
         # Parity with old logging paths: log per-error inside generator not available,
         # but aggregate counts are returned here to callers/tests.
         return processed, generated
@@ -244,6 +517,7 @@ class SemanticSearchService:
         top_k: int = 10,
         threshold: float = 0.5,
         model: str | None = None,
+        query_embedding: list[float] | None = None,
     ) -> list[BibleSearchResult]:
         """Search for bible content similar to a query text.
 
@@ -253,6 +527,8 @@ class SemanticSearchService:
             top_k: Number of top results to return
             threshold: Minimum similarity threshold
             model: Embedding model to use (defaults to service default)
+            query_embedding: Precomputed embedding of the query, to share one
+                embedding request between several searches
 
         Returns:
             List of bible search results sorted by similarity
@@ -260,27 +536,65 @@ class SemanticSearchService:
         model = model or self.embedding_service.default_model
 
         # Generate embedding for query with error handling
-        try:
-            query_embedding: list[
-                float
-            ] = await self.embedding_service.generate_embedding(query, model)
-        except Exception as e:
-            logger.error(
-                "Failed to generate embedding for bible search query",
-                query=query[:100],
-                model=model,
-                error=str(e),
-            )
-            raise ValueError(
-                f"Failed to generate embedding for bible search: {e}"
-            ) from e
+        if query_embedding is None:
+            try:
+                query_embedding = await self.embedding_service.generate_embedding(
+                    query, model
+                )
+            except Exception as e:
+                logger.error(
+                    "Failed to generate embedding for bible search query",
+                    query=query[:100],
+                    model=model,
+                    error=str(e),
+                )
+                raise ValueError(
+                    f"Failed to generate embedding for bible search: {e}"
+                ) from e
 
         # Note: query_bytes not used in this method as we fetch all chunks
         # and calculate similarity in Python rather than using database search
-
+        return await asyncio.to_thread(
+            self._score_bible_chunks,
+            query_embedding,
+            script_id,
+            model,
+            threshold,
+            top_k,
+        )
+
+    def _score_bible_chunks(
+        self,
+        query_embedding: list[float],
+        script_id: int | None,
+        model: str,
+        threshold: float,
+        top_k: int,
+    ) -> list[BibleSearchResult]:
+        """Fetch embedded bible chunks and rank them by similarity to the query."""
         with self.db_ops.transaction() as conn:
             # Get bible chunks with embeddings from the embeddings table
-            if script_id:
+            candidate_ids = (
+                self._ann_candidate_ids(
+                    conn, "bible_chunk", model, query_embedding, top_k
+                )
+                if script_id is None
+                else None
+            )
+            if candidate_ids is not None:
+                placeholders = ",".join("?" * len(candidate_ids))
+                query_sql = f"""
+                    SELECT bc.*, sb.title as bible_title, sb.script_id, e.embedding
+                    FROM bible_chunks bc
+                    JOIN script_bibles sb ON bc.bible_id = sb.id
+                    JOIN embeddings e ON e.entity_id = bc.id
+                    WHERE bc.id IN ({placeholders})
+                    AND e.entity_type = 'bible_chunk'
+                    AND e.embedding_model = ?
+                    AND e.embedding IS NOT NULL
+                """
+                params: tuple[Any, ...] = (*candidate_ids, model)
+            elif script_id:
                 query_sql = """
                     SELECT bc.*, sb.title as bible_title, sb.script_id, e.embedding
                     FROM bible_chunks bc
@@ -291,7 +605,7 @@ class SemanticSearchService:
                     AND e.embedding_model = ?
                     AND e.embedding IS NOT NULL
                 """
-                params: tuple[Any, ...] = (script_id, model)
+                params = (script_id, model)
             else:
                 query_sql = """
                     SELECT bc.*, sb.title as bible_title, sb.script_id, e.embedding
@@ -305,7 +619,13 @@ class SemanticSearchService:
                 params = (model,)
 
             cursor = conn.execute(query_sql, params)
-            chunks: list[dict[str, Any]] = cursor.fetchall()
+            chunks: list[dict[str, Any]] = _shortlist_candidates(
+                cursor.fetchall(),
+                query_embedding=query_embedding,
+                embedding_service=self.embedding_service,
+                embedding_key="embedding",
+                limit=_rescore_limit(top_k),
+            )
 
             results: list[BibleSearchResult] = _build_bible_results(
                 chunks,
@@ -343,4 +663,5 @@ class SemanticSearchService:
                 script_id=script_id,
                 batch_size=batch_size,
             )
+        self._sync_ann_index("bible_chunk", model)
         return processed, generated
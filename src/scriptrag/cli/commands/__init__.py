@@ -1,16 +1,39 @@
-"""ScriptRAG CLI commands."""
+"""ScriptRAG CLI commands.
+
+Command modules import their API dependencies at module level, so they are
+only loaded when one of the names below is first accessed.
+"""
 
 from __future__ import annotations
 
-from scriptrag.cli.commands.analyze import analyze_command
-from scriptrag.cli.commands.index import index_command
-from scriptrag.cli.commands.init import init_command
-from scriptrag.cli.commands.list import list_command
-from scriptrag.cli.commands.mcp import mcp_command
-from scriptrag.cli.commands.pull import pull_command
-from scriptrag.cli.commands.query import create_query_app, get_query_app
-from scriptrag.cli.commands.search import search_command
-from scriptrag.cli.commands.watch import watch_command
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+from typing import Any as _Any
+
+if _TYPE_CHECKING:
+    from scriptrag.cli.commands.analyze import analyze_command
+    from scriptrag.cli.commands.index import index_command
+    from scriptrag.cli.commands.init import init_command
+    from scriptrag.cli.commands.list import list_command
+    from scriptrag.cli.commands.mcp import mcp_command
+    from scriptrag.cli.commands.pull import pull_command
+    from scriptrag.cli.commands.query import create_query_app, get_query_app
+    from scriptrag.cli.commands.search import search_command
+    from scriptrag.cli.commands.watch import watch_command
+
+# Exported name -> defining module; imported on first attribute access
+_EXPORTS = {
+    "analyze_command": "scriptrag.cli.commands.analyze",
+    "create_query_app": "scriptrag.cli.commands.query",
+    "get_query_app": "scriptrag.cli.commands.query",
+    "index_command": "scriptrag.cli.commands.index",
+    "init_command": "scriptrag.cli.commands.init",
+    "list_command": "scriptrag.cli.commands.list",
+    "mcp_command": "scriptrag.cli.commands.mcp",
+    "pull_command": "scriptrag.cli.commands.pull",
+    "search_command": "scriptrag.cli.commands.search",
+    "watch_command": "scriptrag.cli.commands.watch",
+}
 
 __all__ = [
     "analyze_command",
@@ -24,3 +47,18 @@ __all__ = [
     "search_command",
     "watch_command",
 ]
+
+
+def __getattr__(name: str) -> _Any:
+    """Import command functions on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily imported exports."""
+    return sorted({*globals(), *_EXPORTS})
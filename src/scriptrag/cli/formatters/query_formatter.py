@@ -7,6 +7,7 @@ from typing import Any
 
 from scriptrag.cli.formatters.base import OutputFormat, OutputFormatter
 from scriptrag.cli.formatters.table_formatter import TableFormatter
+from scriptrag.common.profiling import timed
 
 
 class QueryResultFormatter(OutputFormatter[list[dict[str, Any]]]):
@@ -17,6 +18,7 @@ class QueryResultFormatter(OutputFormatter[list[dict[str, Any]]]):
         super().__init__()
         self.table_formatter = TableFormatter()
 
+    @timed("format")
     def format(
         self, data: list[dict[str, Any]], format_type: OutputFormat = OutputFormat.TABLE
     ) -> str:
@@ -2,58 +2,116 @@
 
 from __future__ import annotations
 
+import importlib
+import json
 import sys
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any, ClassVar
 
+import click
 import typer
 from rich.console import Console
-
-from scriptrag.cli.commands import (
-    analyze_command,
-    index_command,
-    pull_command,
-    watch_command,
+from rich.table import Table
+from typer.core import TyperGroup
+from typer.main import get_command_from_info, get_group_from_info
+from typer.models import CommandInfo, TyperInfo
+
+from scriptrag.common.profiling import (
+    get_profile_path,
+    get_profiler,
+    load_profile,
+    save_profile,
 )
-from scriptrag.cli.commands.config import config_app
-from scriptrag.cli.commands.init import init_command
-from scriptrag.cli.commands.list import list_command
-from scriptrag.cli.commands.mcp import mcp_command
-from scriptrag.cli.commands.query import get_query_app
-from scriptrag.cli.commands.scene import scene_app
-from scriptrag.cli.commands.search import search_command
-from scriptrag.cli.formatters.json_formatter import JsonFormatter
-from scriptrag.cli.utils.cli_handler import CLIHandler
 from scriptrag.config import get_logger, get_settings
 
 logger = get_logger(__name__)
 console = Console()
+# Profiles go to stderr so they never mix with --json output
+err_console = Console(stderr=True)
+
+
+class LazyGroup(TyperGroup):
+    """Root command group that imports subcommand modules on first use.
+
+    Command modules pull in the API layer (and with it numpy, sqlite-vec,
+    GitPython, the LLM clients and the MCP server), so they are only imported
+    once a command is actually resolved, e.g. to run it or render its help.
+    """
+
+    # Command name -> (module, attribute holding the command function)
+    lazy_commands: ClassVar[dict[str, tuple[str, str]]] = {
+        "init": ("scriptrag.cli.commands.init", "init_command"),
+        "index": ("scriptrag.cli.commands.index", "index_command"),
+        "list": ("scriptrag.cli.commands.list", "list_command"),
+        "ls": ("scriptrag.cli.commands.list", "list_command"),  # Alias for list
+        "search": ("scriptrag.cli.commands.search", "search_command"),
+        "analyze": ("scriptrag.cli.commands.analyze", "analyze_command"),
+        "watch": ("scriptrag.cli.commands.watch", "watch_command"),
+        "pull": ("scriptrag.cli.commands.pull", "pull_command"),
+        "mcp": ("scriptrag.cli.commands.mcp", "mcp_command"),
+    }
+
+    # Subapp name -> (module, attribute holding the Typer app or its factory)
+    lazy_groups: ClassVar[dict[str, tuple[str, str]]] = {
+        "config": ("scriptrag.cli.commands.config", "config_app"),
+        "query": ("scriptrag.cli.commands.query", "create_query_app"),
+        "scene": ("scriptrag.cli.commands.scene", "scene_app"),
+    }
 
-# Create main app with improved configuration
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List command names without importing any command module."""
+        return [
+            *self.lazy_commands,
+            *(name for name in super().list_commands(ctx) if name not in self.lazy),
+            *self.lazy_groups,
+        ]
+
+    @property
+    def lazy(self) -> dict[str, tuple[str, str]]:
+        """All lazily loaded commands and subapps."""
+        return {**self.lazy_commands, **self.lazy_groups}
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Resolve a command, importing its module if needed."""
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy:
+            return command
+
+        command = self._load_command(cmd_name)
+        self.add_command(command, cmd_name)
+        return command
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """Import a lazily registered command and convert it to Click."""
+        module_name, attribute = self.lazy[cmd_name]
+        logger.debug("Loading CLI command", command=cmd_name, module=module_name)
+        target = getattr(importlib.import_module(module_name), attribute)
+
+        if cmd_name in self.lazy_commands:
+            return get_command_from_info(
+                CommandInfo(name=cmd_name, callback=target),
+                pretty_exceptions_short=True,
+                rich_markup_mode=self.rich_markup_mode,
+            )
+
+        sub_app = target if isinstance(target, typer.Typer) else target()
+        return get_group_from_info(
+            TyperInfo(sub_app, name=cmd_name),
+            pretty_exceptions_short=True,
+            rich_markup_mode=self.rich_markup_mode,
+        )
+
+
+# Create main app with improved configuration; subcommands load lazily
 app = typer.Typer(
     name="scriptrag",
     help="Git-native screenplay analysis with temporal navigation",
     pretty_exceptions_enable=False,
     add_completion=False,
     rich_markup_mode="rich",
+    cls=LazyGroup,
 )
 
-# Add subcommands with clean separation
-app.command(name="init")(init_command)
-app.command(name="index")(index_command)
-app.command(name="list")(list_command)
-app.command(name="ls")(list_command)  # Alias for list command
-app.command(name="search")(search_command)
-app.command(name="analyze")(analyze_command)
-app.command(name="watch")(watch_command)
-app.command(name="pull")(pull_command)
-app.command(name="mcp")(mcp_command)
-
-# Register subapps
-app.add_typer(config_app, name="config")  # Config management subapp
-app.add_typer(get_query_app(), name="query")  # Query subapp - use lazy loading
-app.add_typer(scene_app, name="scene")  # Scene subapp
-
 
 @app.command()
 def status(
@@ -61,14 +119,25 @@ def status(
     verbose: Annotated[
         bool, typer.Option("--verbose", "-v", help="Show detailed status")
     ] = False,
+    perf: Annotated[
+        bool,
+        typer.Option("--perf", help="Show timings from the last --profile run"),
+    ] = False,
 ) -> None:
     """Show ScriptRAG status and configuration."""
+    from scriptrag.cli.formatters.json_formatter import JsonFormatter
+    from scriptrag.cli.utils.cli_handler import CLIHandler
+
     handler = CLIHandler(console)
     formatter = JsonFormatter()
 
     try:
         settings = get_settings()
 
+        if perf:
+            _show_last_profile(settings.database_path, json_output)
+            return
+
         # Collect status information
         status_info = {
             "version": "2.0.0",
@@ -111,6 +180,77 @@ def status(
         handler.handle_error(e, json_output)
 
 
+def _profile_table(summary: dict[str, Any], title: str) -> Table:
+    """Render a profile summary as a table of spans."""
+    table = Table(title=title, show_header=True, header_style="bold magenta")
+    table.add_column("Span")
+    for column in ("Count", "Total ms", "Mean ms", "Min ms", "Max ms"):
+        table.add_column(column, justify="right")
+    for stats in summary.get("spans", []):
+        table.add_row(
+            stats["name"],
+            str(stats["count"]),
+            f"{stats['total_ms']:.2f}",
+            f"{stats['mean_ms']:.2f}",
+            f"{stats['min_ms']:.2f}",
+            f"{stats['max_ms']:.2f}",
+        )
+    return table
+
+
+def _show_last_profile(database_path: Path, json_output: bool) -> None:
+    """Print the profile stored by the last ``--profile`` run."""
+    summary = load_profile(get_profile_path(database_path))
+    if json_output:
+        sys.stdout.write(json.dumps(summary or {}, indent=2) + "\n")
+        sys.stdout.flush()
+        return
+    if not summary:
+        console.print(
+            "[yellow]No profile recorded yet.[/yellow] "
+            "Run a command with [cyan]scriptrag --profile <command>[/cyan]."
+        )
+        return
+    command = summary.get("command") or "unknown command"
+    console.print(_profile_table(summary, f"Last profiled run: {command}"))
+
+
+def _start_profile(trace_path: Path | None) -> None:
+    """Start a profiled run, reported once the subcommand has finished."""
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return
+
+    profiler = get_profiler()
+    profiler.reset()
+    profiler.enable_tracing(trace_path is not None)
+    # Runs on context close, so failed commands are reported as well
+    ctx.call_on_close(
+        lambda: _finish_profile(
+            get_settings().database_path, ctx.invoked_subcommand, trace_path
+        )
+    )
+
+
+def _finish_profile(
+    database_path: Path, command: str | None, trace_path: Path | None
+) -> None:
+    """Report, store and optionally export the profile of this run."""
+    profiler = get_profiler()
+    summary = {**profiler.summary(), "command": command}
+    err_console.print(_profile_table(summary, f"Profile: {command}"))
+
+    try:
+        save_profile(get_profile_path(database_path), summary)
+    except OSError as e:
+        logger.warning("Could not store profile", error=str(e))
+
+    if trace_path is not None:
+        count = profiler.export_chrome_trace(trace_path)
+        err_console.print(f"[dim]Wrote {count} trace events to {trace_path}[/dim]")
+    profiler.enable_tracing(False)
+
+
 @app.command()
 def version(
     json_output: Annotated[bool, typer.Option("--json", help="Output as JSON")] = False,
@@ -123,6 +263,8 @@ def version(
     }
 
     if json_output:
+        from scriptrag.cli.formatters.json_formatter import JsonFormatter
+
         formatter = JsonFormatter()
         # Output pure JSON without ANSI escape codes
         sys.stdout.write(formatter.format(version_info) + "\n")
@@ -150,6 +292,20 @@ def main_callback(
         bool,
         typer.Option("--debug", help="Enable debug logging", envvar="SCRIPTRAG_DEBUG"),
     ] = False,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile", help="Time pipeline stages and print a summary on exit"
+        ),
+    ] = False,
+    trace: Annotated[
+        Path | None,
+        typer.Option(
+            "--trace",
+            help="Write a Chrome trace (chrome://tracing) of the run; "
+            "implies --profile",
+        ),
+    ] = None,
 ) -> None:
     """Configure global options."""
     from scriptrag.config import clear_settings_cache, get_settings, set_settings
@@ -200,6 +356,9 @@ def main_callback(
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}")
 
+    if profile or trace is not None:
+        _start_profile(trace)
+
 
 def main() -> None:
     """Main CLI entry point."""
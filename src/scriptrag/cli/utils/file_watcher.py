@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-import queue
+import hashlib
 import threading
 import time
 from pathlib import Path
@@ -33,8 +33,24 @@ class StatusCallback(Protocol):
         ...
 
 
+def _content_hash(path: Path) -> str | None:
+    """Hash a file's content, or return None if it cannot be read."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
 class FountainFileHandler(FileSystemEventHandler):
-    """Handler for Fountain file changes with async processing support."""
+    """Handler for Fountain file changes with async processing support.
+
+    Events are coalesced per path and processed in batches by one worker
+    thread that runs a long-lived event loop. The worker keeps its analyze and
+    index commands, with their analyzers and LLM clients, for the whole watch
+    session, indexes each batch in one transaction, and ignores events for
+    files whose content is unchanged since it last processed them, such as
+    the boneyard metadata written back by analyze.
+    """
 
     def __init__(
         self,
@@ -52,22 +68,27 @@ class FountainFileHandler(FileSystemEventHandler):
             force: Force re-processing (only affects analyze, not index)
             batch_size: Batch size for indexing
             callback: Callback for status updates
-            max_queue_size: Maximum queue size for pending events
+            max_queue_size: Number of pending files at which a batch is
+                processed without waiting for the batch timeout
             batch_timeout: Timeout for batch processing in seconds
         """
         self.settings = settings
         self.force = force
         self.batch_size = batch_size
         self.callback = callback
-        self.processing: set[str] = set()
-        self.last_processed: dict[str, float] = {}
-        self.debounce_seconds = 2.0
-
-        # Event queue for async processing
-        self.event_queue: queue.Queue[Path] = queue.Queue(maxsize=max_queue_size)
+        self.max_queue_size = max_queue_size
         self.batch_timeout = batch_timeout
+
+        # Pending files in arrival order; repeated events for a file coalesce
+        self.pending: dict[str, Path] = {}
+        self.pending_changed = threading.Condition()
+        # Content hash of each file when the worker last finished with it
+        self.content_hashes: dict[str, str] = {}
+
         self.shutdown_event = threading.Event()
         self.processor_thread: threading.Thread | None = None
+        self._analyze_cmd: AnalyzeCommand | None = None
+        self._index_cmd: IndexCommand | None = None
 
     def start_processing(self) -> None:
         """Start the async event processor thread."""
@@ -85,6 +106,8 @@ class FountainFileHandler(FileSystemEventHandler):
             timeout: Maximum time to wait for thread shutdown
         """
         self.shutdown_event.set()
+        with self.pending_changed:
+            self.pending_changed.notify_all()
         if self.processor_thread and self.processor_thread.is_alive():
             self.processor_thread.join(timeout=timeout)
 
@@ -97,17 +120,7 @@ class FountainFileHandler(FileSystemEventHandler):
         Returns:
             True if file should be processed
         """
-        # Check if it's a Fountain file
-        if path.suffix.lower() not in [".fountain", ".spmd"]:
-            return False
-
-        # Check if it's already being processed
-        if str(path) in self.processing:
-            return False
-
-        # Check debounce
-        last_time = self.last_processed.get(str(path), 0)
-        return time.time() - last_time >= self.debounce_seconds
+        return path.suffix.lower() in [".fountain", ".spmd"]
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification events.
@@ -139,117 +152,190 @@ class FountainFileHandler(FileSystemEventHandler):
             if self.should_process(path):
                 self._queue_file(path)
 
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle file move events, such as editors saving via a rename.
+
+        Args:
+            event: Filesystem event
+        """
+        if event.is_directory:
+            return
+
+        dest_path = getattr(event, "dest_path", None)
+        if isinstance(dest_path, str):
+            path = Path(dest_path)
+            if self.should_process(path):
+                self._queue_file(path)
+
     def _queue_file(self, path: Path) -> None:
         """Queue a file for processing.
 
+        A file that is already pending keeps its place in the queue, so
+        bursts of events for one file are processed once.
+
         Args:
             path: Path to queue
         """
-        try:
-            self.event_queue.put_nowait(path)
-        except queue.Full:
-            logger.warning("Event queue is full, dropping event", path=str(path))
+        with self.pending_changed:
+            self.pending.setdefault(str(path), path)
+            self.pending_changed.notify_all()
 
-    def _process_events(self) -> None:
-        """Process events from the queue in batches."""
-        batch: list[Path] = []
-        last_batch_time = time.time()
+    def _next_batch(self) -> list[Path]:
+        """Wait for the next batch of pending files.
 
-        while not self.shutdown_event.is_set():
-            try:
-                # Try to get an event with timeout
-                path = self.event_queue.get(timeout=0.5)
-                batch.append(path)
-
-                # Process batch if it's full or timeout reached
-                if batch and (
-                    len(batch) >= self.batch_size
-                    or time.time() - last_batch_time >= self.batch_timeout
-                ):
-                    self._process_batch(batch)
-                    batch = []
-                    last_batch_time = time.time()
-
-            except queue.Empty:
-                # Process any remaining batch on timeout
-                if batch and time.time() - last_batch_time >= self.batch_timeout:
-                    self._process_batch(batch)
-                    batch = []
-                    last_batch_time = time.time()
-
-        # Process any remaining items on shutdown
-        if batch:
-            self._process_batch(batch)
-
-    def _process_batch(self, paths: list[Path]) -> None:
-        """Process a batch of files.
+        Waits until a file is pending, then up to ``batch_timeout`` seconds
+        for ``batch_size`` files to gather (or ``max_queue_size`` files when
+        that is smaller). On shutdown the remaining files are returned without
+        waiting.
 
-        Args:
-            paths: List of paths to process
+        Returns:
+            Files to process, empty once shut down with nothing pending
         """
-        # Deduplicate paths
-        unique_paths = list(set(paths))
-
-        for path in unique_paths:
-            str_path = str(path)
-            if str_path not in self.processing:
-                self.processing.add(str_path)
-                try:
-                    self._process_file_sync(path)
-                finally:
-                    self.processing.discard(str_path)
-                    self.last_processed[str_path] = time.time()
-
-    def _process_file_sync(self, path: Path) -> None:
-        """Process a single file synchronously.
+        with self.pending_changed:
+            while not self.pending and not self.shutdown_event.is_set():
+                self.pending_changed.wait(timeout=0.5)
+
+            deadline = time.time() + self.batch_timeout
+            target = min(self.batch_size, self.max_queue_size)
+            while (
+                len(self.pending) < target
+                and not self.shutdown_event.is_set()
+                and (remaining := deadline - time.time()) > 0
+            ):
+                self.pending_changed.wait(timeout=remaining)
+
+            keys = list(self.pending)[: self.batch_size]
+            return [self.pending.pop(key) for key in keys]
+
+    def _process_events(self) -> None:
+        """Process pending files in batches on a long-lived event loop."""
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                batch = self._next_batch()
+                if batch:
+                    loop.run_until_complete(self._process_batch(batch))
+                elif self.shutdown_event.is_set():
+                    break
+        finally:
+            loop.run_until_complete(self._close_commands())
+            loop.close()
+
+    async def _process_batch(self, paths: list[Path]) -> None:
+        """Analyze a batch of files, then index them together.
 
         Args:
-            path: Path to the Fountain file
+            paths: Files to process
         """
-        try:
-            if self.callback:
-                self.callback("processing", path)
+        changed = []
+        for path in paths:
+            content_hash = _content_hash(path)
+            if content_hash is None:
+                logger.debug(f"Skipping unreadable file {path}")
+            elif content_hash == self.content_hashes.get(str(path)):
+                logger.debug(f"Skipping {path}: unchanged since last processed")
+            else:
+                changed.append(path)
+        if not changed:
+            return
 
-            # Run the pull workflow using asyncio.run() for proper event loop management
-            # This ensures thread safety and proper cleanup
-            asyncio.run(self._pull_single_file(path))
+        try:
+            analyze_cmd, index_cmd = await self._get_commands()
+        except Exception as e:
+            logger.error(f"Failed to prepare watch worker: {e}")
+            for path in changed:
+                self._notify("error", path, str(e))
+            return
 
-            if self.callback:
-                self.callback("completed", path)
+        analyzed: dict[Path, str | None] = {}
+        for path in changed:
+            self._notify("processing", path)
+            try:
+                result = await analyze_cmd.analyze(
+                    path=path,
+                    recursive=False,
+                    force=self.force,
+                    dry_run=False,
+                )
+            except Exception as e:
+                logger.error(f"Error processing {path}: {e}")
+                self._notify("error", path, str(e))
+                continue
+            if result.errors:
+                self._notify("error", path, "; ".join(result.errors))
+                continue
+            # The content analyze left behind, including its metadata
+            # write-back, whose own change event is then ignored
+            analyzed[path] = _content_hash(path)
+
+        if not analyzed:
+            return
 
+        try:
+            index_result = await index_cmd.index_files(list(analyzed))
         except Exception as e:
-            logger.error(f"Error processing {path}: {e}")
-            if self.callback:
-                self.callback("error", path, str(e))
+            logger.error(f"Error indexing batch: {e}")
+            for path in analyzed:
+                self._notify("error", path, str(e))
+            return
+
+        failed = {
+            str(script.path): script.error
+            for script in index_result.scripts
+            if script.error
+        }
+        for path, content_hash in analyzed.items():
+            if str(path) in failed:
+                self._notify("error", path, failed[str(path)])
+            elif index_result.errors and not index_result.scripts:
+                self._notify("error", path, "; ".join(index_result.errors))
+            else:
+                if content_hash is not None:
+                    self.content_hashes[str(path)] = content_hash
+                self._notify("completed", path)
+
+    async def _get_commands(self) -> tuple[AnalyzeCommand, IndexCommand]:
+        """Return the worker's analyze and index commands, creating them once.
 
-    async def _pull_single_file(self, path: Path) -> None:
-        """Run pull workflow for a single file.
+        Returns:
+            Warmed-up analyze command and index command
+        """
+        if self._analyze_cmd is None or self._index_cmd is None:
+            # Ensure database exists
+            db_ops = DatabaseOperations(self.settings)
+            if not db_ops.check_database_exists():
+                from scriptrag.api import DatabaseInitializer
+
+                initializer = DatabaseInitializer()
+                initializer.initialize_database(settings=self.settings)
+
+            analyze_cmd = AnalyzeCommand.from_config()
+            await analyze_cmd.warm_up()
+            self._analyze_cmd = analyze_cmd
+            self._index_cmd = IndexCommand(settings=self.settings, db_ops=db_ops)
+        return self._analyze_cmd, self._index_cmd
+
+    async def _close_commands(self) -> None:
+        """Release the analyzers kept warm by the worker."""
+        if self._analyze_cmd is not None:
+            try:
+                await self._analyze_cmd.close()
+            except Exception as e:
+                logger.warning(f"Failed to clean up analyzers: {e}")
+            self._analyze_cmd = None
+        self._index_cmd = None
+
+    def _notify(self, status: str, path: Path, error: str | None = None) -> None:
+        """Report a status update to the callback, if any.
 
         Args:
-            path: Path to the specific Fountain file
+            status: Status type (processing, completed, error)
+            path: File path being processed
+            error: Optional error message
         """
-        # Ensure database exists
-        db_ops = DatabaseOperations(self.settings)
-        if not db_ops.check_database_exists():
-            from scriptrag.api import DatabaseInitializer
-
-            initializer = DatabaseInitializer()
-            initializer.initialize_database(settings=self.settings)
-
-        # Process the specific file directly
-        analyze_cmd = AnalyzeCommand.from_config()
-        await analyze_cmd.analyze(
-            path=path,  # Process specific file
-            recursive=False,
-            force=self.force,
-            dry_run=False,
-        )
-
-        # Index the specific file
-        index_cmd = IndexCommand.from_config()
-        await index_cmd.index(
-            path=path,  # Process specific file
-            recursive=False,
-            dry_run=False,
-            batch_size=1,  # Single file
-        )
+        if self.callback is None:
+            return
+        if error is None:
+            self.callback(status, path)
+        else:
+            self.callback(status, path, error)
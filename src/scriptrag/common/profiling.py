@@ -0,0 +1,313 @@
+"""Lightweight timing spans for ScriptRAG hot paths.
+
+Pipelines wrap their expensive steps (parsing, listing, analyzers, LLM and
+embedding calls, database writes, vector scoring, output formatting) in named
+spans. Each span adds its duration to a per-process aggregate of count, total,
+minimum and maximum; recording individual trace events is opt-in so that the
+always-on cost stays at two clock reads and a lock.
+
+Example:
+    >>> from scriptrag.common.profiling import span, timed
+    >>> with span("parse", file="pilot.fountain"):
+    ...     script = parser.parse_file(path)
+    >>> @timed("embedding.call")
+    ... async def embed(text: str) -> list[float]: ...
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Trace events kept in memory before further events are dropped
+MAX_TRACE_EVENTS = 200_000
+
+
+@dataclass
+class SpanStats:
+    """Aggregated timings for one span name."""
+
+    name: str
+    count: int = 0
+    total_ms: float = 0.0
+    min_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def add(self, duration_ms: float) -> None:
+        """Add one span duration to the aggregate."""
+        if self.count == 0 or duration_ms < self.min_ms:
+            self.min_ms = duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.count += 1
+        self.total_ms += duration_ms
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean span duration in milliseconds."""
+        return self.total_ms / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "name": self.name,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.mean_ms, 3),
+            "min_ms": round(self.min_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class Profiler:
+    """Thread-safe collector of span timings for one run."""
+
+    def __init__(self) -> None:
+        """Initialize an empty profiler with tracing disabled."""
+        self._lock = threading.Lock()
+        self._stats: dict[str, SpanStats] = {}
+        self._events: list[dict[str, Any]] = []
+        self._dropped_events = 0
+        self._tracing = False
+        self._started_at = time.time()
+        # Trace timestamps are relative to this point
+        self._origin = time.perf_counter()
+
+    @property
+    def tracing(self) -> bool:
+        """Whether individual span events are recorded for trace export."""
+        return self._tracing
+
+    def enable_tracing(self, enabled: bool = True) -> None:
+        """Start or stop recording individual span events.
+
+        Args:
+            enabled: True to record events for Chrome trace export
+        """
+        self._tracing = enabled
+
+    def reset(self) -> None:
+        """Drop all recorded timings and events, starting a new run."""
+        with self._lock:
+            self._stats.clear()
+            self._events.clear()
+            self._dropped_events = 0
+            self._started_at = time.time()
+            self._origin = time.perf_counter()
+
+    def record(
+        self,
+        name: str,
+        start: float,
+        end: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a finished span.
+
+        Args:
+            name: Span name, e.g. ``"parse"`` or ``"analyze.relationships"``
+            start: ``time.perf_counter()`` value when the span started
+            end: ``time.perf_counter()`` value when the span ended
+            args: Optional attributes attached to the trace event
+        """
+        duration_ms = (end - start) * 1000
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = SpanStats(name)
+            stats.add(duration_ms)
+
+            if not self._tracing:
+                return
+            if len(self._events) >= MAX_TRACE_EVENTS:
+                self._dropped_events += 1
+                return
+            event: dict[str, Any] = {
+                "name": name,
+                "cat": name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (start - self._origin) * 1_000_000,
+                "dur": (end - start) * 1_000_000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = {key: str(value) for key, value in args.items()}
+            self._events.append(event)
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Generator[None, None, None]:
+        """Time the enclosed block as a span.
+
+        Args:
+            name: Span name
+            **args: Attributes attached to the trace event when tracing
+
+        Yields:
+            None
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter(), args or None)
+
+    def get_stats(self) -> dict[str, SpanStats]:
+        """Get a snapshot of the aggregated span timings.
+
+        Returns:
+            Mapping of span name to a copy of its statistics
+        """
+        with self._lock:
+            return {
+                name: SpanStats(s.name, s.count, s.total_ms, s.min_ms, s.max_ms)
+                for name, s in self._stats.items()
+            }
+
+    def summary(self) -> dict[str, Any]:
+        """Summarize the current run.
+
+        Returns:
+            Dictionary with run start time, spans sorted by total time and
+            trace event counts
+        """
+        stats = sorted(
+            self.get_stats().values(), key=lambda s: s.total_ms, reverse=True
+        )
+        with self._lock:
+            events = len(self._events)
+            dropped = self._dropped_events
+        return {
+            "started_at": self._started_at,
+            "spans": [s.to_dict() for s in stats],
+            "trace_events": events,
+            "dropped_trace_events": dropped,
+        }
+
+    def export_chrome_trace(self, path: Path) -> int:
+        """Write recorded span events in Chrome trace event format.
+
+        The file can be opened in ``chrome://tracing`` or Perfetto.
+
+        Args:
+            path: Output file path
+
+        Returns:
+            Number of events written
+        """
+        with self._lock:
+            events = list(self._events)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}),
+            encoding="utf-8",
+        )
+        return len(events)
+
+
+_profiler = Profiler()
+
+
+def get_profiler() -> Profiler:
+    """Get the process-wide profiler."""
+    return _profiler
+
+
+def span(name: str, **args: Any) -> Any:
+    """Time a block as a span on the process-wide profiler.
+
+    Args:
+        name: Span name
+        **args: Attributes attached to the trace event when tracing
+
+    Returns:
+        Context manager timing the enclosed block
+    """
+    return _profiler.span(name, **args)
+
+
+def timed(name: str | None = None) -> Callable[[F], F]:
+    """Decorate a function or coroutine function so each call is a span.
+
+    Args:
+        name: Span name, defaults to the function's qualified name
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    _profiler.record(span_name, start, time.perf_counter())
+
+            return cast(F, async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _profiler.record(span_name, start, time.perf_counter())
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def get_profile_path(database_path: Path) -> Path:
+    """Get where the last profiled CLI run is stored for a database.
+
+    Args:
+        database_path: Path to the ScriptRAG database
+
+    Returns:
+        Path of the JSON profile next to the database
+    """
+    return database_path.with_name(f"{database_path.name}.profile.json")
+
+
+def save_profile(path: Path, summary: dict[str, Any]) -> None:
+    """Store a run summary so ``scriptrag status --perf`` can show it.
+
+    Args:
+        path: Output file path
+        summary: Summary from :meth:`Profiler.summary`
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+
+def load_profile(path: Path) -> dict[str, Any] | None:
+    """Load a stored run summary.
+
+    Args:
+        path: Profile file path
+
+    Returns:
+        Stored summary, or None if there is none or it is unreadable
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
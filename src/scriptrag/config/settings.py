@@ -158,6 +158,63 @@ class ScriptRAGSettings(BaseSettings):
         description="Timeout in seconds for search thread execution",
         ge=1.0,
     )
+    search_leg_timeout: float = Field(
+        default=10.0,
+        description=(
+            "Timeout in seconds for the bible and semantic search legs; a leg "
+            "that times out is left out of the results"
+        ),
+        gt=0.0,
+    )
+    search_fusion_method: str = Field(
+        default="rrf",
+        description=(
+            "How lexical and vector results are fused (rrf = reciprocal-rank "
+            "fusion, weighted = weighted min-max normalised scores)"
+        ),
+        pattern="^(rrf|weighted)$",
+    )
+    search_fusion_rrf_k: int = Field(
+        default=60,
+        description="Rank offset k of reciprocal-rank fusion, 1/(k + rank)",
+        ge=1,
+    )
+    search_fusion_vector_weight: float = Field(
+        default=0.5,
+        description=(
+            "Weight of vector results in fusion; lexical results get the rest"
+        ),
+        ge=0.0,
+        le=1.0,
+    )
+    search_ann_enabled: bool = Field(
+        default=False,
+        description=(
+            "Use an approximate nearest-neighbour (IVF) index for semantic "
+            "search over large embedding corpora"
+        ),
+    )
+    search_ann_min_vectors: int = Field(
+        default=10000,
+        description="Smallest number of embeddings per model worth an ANN index",
+        ge=1,
+    )
+    search_ann_probes: int = Field(
+        default=8,
+        description=(
+            "Number of IVF lists scanned per query; higher improves recall "
+            "at the cost of latency"
+        ),
+        ge=1,
+    )
+    result_cache_size: int = Field(
+        default=256,
+        description=(
+            "Maximum number of cached query/search results per engine "
+            "(0 disables the result cache)"
+        ),
+        ge=0,
+    )
 
     # LLM settings
     llm_provider: str | None = Field(
@@ -190,6 +247,14 @@ class ScriptRAGSettings(BaseSettings):
         default=None,
         description="Dimensions for embedding vectors (e.g., 1536)",
     )
+    embedding_storage_precision: str = Field(
+        default="float32",
+        description=(
+            "Precision of stored embeddings: float32, float16 or int8 with a "
+            "per-vector scale. Existing embeddings stay readable after a change"
+        ),
+        pattern="^(float32|float16|int8)$",
+    )
     llm_temperature: float = Field(
         default=0.7,
         description="Default temperature for completions",
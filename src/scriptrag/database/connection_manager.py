@@ -6,6 +6,7 @@ automatic health checks, and proper resource cleanup for ScriptRAG's database.
 
 from __future__ import annotations
 
+import itertools
 import sqlite3
 import threading
 import time
@@ -24,6 +25,10 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# Process-wide source of database generations. Values are never reused, so a
+# generation from a replaced manager can never match one from its successor.
+_generation_counter = itertools.count(1)
+
 
 class ConnectionPool:
     """Thread-safe connection pool for SQLite connections."""
@@ -428,6 +433,66 @@ class DatabaseConnectionManager:
         # Thread-local storage for async context awareness
         self._thread_local = threading.local()
 
+        # Write generation tracking for result caches. The generation advances
+        # on every commit made through this manager and whenever the watcher
+        # connection observes a new PRAGMA data_version, i.e. a commit made by
+        # any other connection, including other processes.
+        self._generation = next(_generation_counter)
+        self._generation_lock = threading.Lock()
+        self._watcher: sqlite3.Connection | None = None
+        self._watched_version: int | None = None
+
+    @property
+    def generation(self) -> int:
+        """Current database write generation."""
+        return self._generation
+
+    def bump_generation(self) -> int:
+        """Advance the write generation, invalidating cached results.
+
+        Returns:
+            The new generation
+        """
+        with self._generation_lock:
+            self._generation = next(_generation_counter)
+            return self._generation
+
+    def get_generation(self) -> int | None:
+        """Get the current write generation, detecting foreign commits.
+
+        A single long-lived watcher connection checks ``PRAGMA data_version``,
+        which changes whenever another connection (pooled, ad hoc or in another
+        process) commits. Pooled connections therefore never need their own
+        baselines, and new ones never invalidate cached results.
+
+        Returns:
+            Current generation, or None if it cannot be determined (in which
+            case results must not be cached)
+        """
+        with self._generation_lock:
+            try:
+                if self._watcher is None:
+                    self._watcher = sqlite3.connect(
+                        str(self.db_path),
+                        timeout=self.settings.database_timeout,
+                        check_same_thread=False,
+                    )
+                row = self._watcher.execute("PRAGMA data_version").fetchone()
+            except sqlite3.Error as e:
+                logger.debug(f"Could not read database data_version: {e}")
+                return None
+
+            version = row[0] if row is not None else None
+            if not isinstance(version, int):
+                return None
+            if self._watched_version is None:
+                # Seed the baseline; nothing has been observed to change yet
+                self._watched_version = version
+            elif version != self._watched_version:
+                self._watched_version = version
+                self._generation = next(_generation_counter)
+            return self._generation
+
     def get_connection(self, timeout: float | None = None) -> sqlite3.Connection:
         """Get a database connection from the pool.
 
@@ -472,6 +537,7 @@ class DatabaseConnectionManager:
 
             yield conn
             conn.commit()
+            self.bump_generation()
             # Force a checkpoint in WAL mode to ensure data is visible
             if self.settings.database_journal_mode == "WAL":
                 conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
@@ -522,6 +588,7 @@ class DatabaseConnectionManager:
             conn.execute("PRAGMA synchronous = OFF")
             yield conn
             conn.commit()
+            self.bump_generation()
         finally:
             # Restore normal settings
             conn.execute(f"PRAGMA cache_size = {self.settings.database_cache_size}")
@@ -600,6 +667,10 @@ class DatabaseConnectionManager:
         Args:
             force: If True, forcefully close even active connections
         """
+        with self._generation_lock:
+            if self._watcher is not None:
+                self._watcher.close()
+                self._watcher = None
         self._pool.close(force=force)
 
     def ensure_closed(self) -> bool:
@@ -678,6 +749,26 @@ def get_connection_manager(
     return _manager_instance
 
 
+def peek_connection_manager(
+    settings: ScriptRAGSettings,
+) -> DatabaseConnectionManager | None:
+    """Get the singleton connection manager only if it serves this database.
+
+    Unlike :func:`get_connection_manager`, this never creates a manager (and
+    therefore never creates a database file).
+
+    Args:
+        settings: Configuration settings identifying the database
+
+    Returns:
+        The existing manager for ``settings.database_path``, or None
+    """
+    manager = _manager_instance
+    if manager is None or manager.db_path != settings.database_path:
+        return None
+    return manager
+
+
 def close_connection_manager(force: bool = False) -> None:
     """Close the singleton connection manager.
 
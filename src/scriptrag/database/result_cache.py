@@ -0,0 +1,193 @@
+"""In-process LRU cache for read-only query results.
+
+Cached entries are tagged with the database write generation reported by
+:class:`~scriptrag.database.connection_manager.DatabaseConnectionManager`.
+Any committed write (in this process or, via ``PRAGMA data_version``, in
+another one) advances the generation, which makes older entries unreachable.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from scriptrag.config import ScriptRAGSettings, get_logger
+from scriptrag.database.connection_manager import peek_connection_manager
+
+logger = get_logger(__name__)
+
+
+class ResultCache:
+    """Thread-safe LRU cache keyed by (key, database generation)."""
+
+    def __init__(self, name: str, max_entries: int = 256) -> None:
+        """Initialize the result cache.
+
+        Args:
+            name: Cache name used in logs and statistics
+            max_entries: Maximum number of cached results (0 disables caching)
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[int, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable, generation: int) -> tuple[bool, Any]:
+        """Look up a cached result.
+
+        Args:
+            key: Cache key
+            generation: Current database generation
+
+        Returns:
+            Tuple of (hit, value); value is None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return False, None
+
+            cached_generation, value = entry
+            if cached_generation != generation:
+                # Written to since the entry was stored
+                del self._entries[key]
+                self._invalidations += 1
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, value
+
+    def put(self, key: Hashable, generation: int, value: Any) -> None:
+        """Store a result.
+
+        Args:
+            key: Cache key
+            generation: Database generation observed before the result was read
+            value: Result to cache
+        """
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (generation, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cached results (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with size, hit/miss counters and hit rate
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+
+def get_result_cache_size(settings: ScriptRAGSettings) -> int:
+    """Get the configured result cache size.
+
+    Args:
+        settings: Configuration settings
+
+    Returns:
+        Maximum number of cached results, 0 if caching is disabled or the
+        settings object does not define a size
+    """
+    size = getattr(settings, "result_cache_size", 0)
+    return size if isinstance(size, int) else 0
+
+
+def get_database_generation(
+    settings: ScriptRAGSettings, conn: sqlite3.Connection
+) -> int | None:
+    """Get the write generation for a read through a pooled connection.
+
+    Args:
+        settings: Configuration settings identifying the database
+        conn: Pooled connection the caller is reading through
+
+    Returns:
+        Current generation, or None if results should not be cached
+    """
+    # Only reads through real pooled connections are cacheable
+    if type(conn) is not sqlite3.Connection:
+        return None
+    manager = peek_connection_manager(settings)
+    if manager is None:
+        return None
+    return manager.get_generation()
+
+
+_caches: dict[tuple[str, str], ResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_result_cache(settings: ScriptRAGSettings, name: str) -> ResultCache:
+    """Get or create the process-wide result cache for a database.
+
+    Engines are cheap objects that are often created per request (CLI
+    commands, MCP tools), so caches live at module level to be shared. There
+    is one cache per name and database; its size is fixed when it is created.
+
+    Args:
+        settings: Configuration settings identifying the database and size
+        name: Cache name (e.g. ``"query"`` or ``"search"``)
+
+    Returns:
+        Shared result cache
+    """
+    db_path = str(settings.database_path)
+    with _caches_lock:
+        cache = _caches.get((name, db_path))
+        if cache is None:
+            cache = ResultCache(f"{name}:{db_path}", get_result_cache_size(settings))
+            _caches[(name, db_path)] = cache
+        return cache
+
+
+def get_result_cache_stats() -> dict[str, dict[str, Any]]:
+    """Get statistics for all result caches.
+
+    Returns:
+        Mapping of cache name to its statistics
+    """
+    with _caches_lock:
+        caches = list(_caches.values())
+    return {cache.name: cache.get_stats() for cache in caches}
+
+
+def clear_result_caches() -> None:
+    """Drop all result caches, including their statistics."""
+    with _caches_lock:
+        count = len(_caches)
+        _caches.clear()
+    logger.debug("Cleared result caches", count=count)
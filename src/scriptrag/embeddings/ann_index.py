@@ -0,0 +1,658 @@
+"""Approximate nearest-neighbour (IVF) index for large embedding corpora.
+
+Exact semantic search decodes and scores every stored embedding. For corpora
+with tens of thousands of vectors this module provides an inverted-file (IVF)
+index: vectors are clustered with spherical k-means and a query only scores
+the members of its ``probes`` closest clusters. Candidates returned by the
+index are rescored exactly by the caller, so the index only affects recall.
+
+Indexes are persisted per entity type and embedding model next to the
+database (``<db>.ann/``) and are kept in step with the ``embeddings`` table
+through an ``embedding_changes`` log maintained by triggers.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from scriptrag.config import get_logger
+from scriptrag.embeddings.vector_store import BinaryEmbeddingSerializer
+
+logger = get_logger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+
+# Rebuild when the corpus has grown or shrunk by this factor since training,
+# because the coarse centroids no longer describe it well
+REBUILD_FACTOR = 4
+
+# Training points per list used by k-means
+TRAINING_POINTS_PER_LIST = 256
+
+_CHANGE_TRACKING_SQL = (
+    """
+    CREATE TABLE IF NOT EXISTS embedding_changes (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        entity_type TEXT NOT NULL,
+        embedding_model TEXT NOT NULL,
+        entity_id INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_embedding_changes_model
+    ON embedding_changes (entity_type, embedding_model, seq)
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS track_embedding_insert
+    AFTER INSERT ON embeddings
+    BEGIN
+        INSERT INTO embedding_changes (entity_type, embedding_model, entity_id)
+        VALUES (NEW.entity_type, NEW.embedding_model, NEW.entity_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS track_embedding_update
+    AFTER UPDATE OF embedding, entity_id, entity_type, embedding_model
+    ON embeddings
+    BEGIN
+        INSERT INTO embedding_changes (entity_type, embedding_model, entity_id)
+        VALUES (OLD.entity_type, OLD.embedding_model, OLD.entity_id);
+        INSERT INTO embedding_changes (entity_type, embedding_model, entity_id)
+        VALUES (NEW.entity_type, NEW.embedding_model, NEW.entity_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS track_embedding_delete
+    AFTER DELETE ON embeddings
+    BEGIN
+        INSERT INTO embedding_changes (entity_type, embedding_model, entity_id)
+        VALUES (OLD.entity_type, OLD.embedding_model, OLD.entity_id);
+    END
+    """,
+)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length so dot products are cosine similarities."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    normalized: np.ndarray = (vectors / norms).astype(np.float32, copy=False)
+    return normalized
+
+
+def _nearest(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Assign each vector to its most similar centroid, in bounded chunks."""
+    assignments = np.empty(len(vectors), dtype=np.int32)
+    chunk = 4096
+    for start in range(0, len(vectors), chunk):
+        scores = vectors[start : start + chunk] @ centroids.T
+        assignments[start : start + chunk] = np.argmax(scores, axis=1)
+    return assignments
+
+
+def _kmeans(
+    vectors: np.ndarray, n_lists: int, iterations: int, seed: int
+) -> np.ndarray:
+    """Train unit-length centroids with spherical k-means on a sample."""
+    rng = np.random.default_rng(seed)
+    sample_size = min(len(vectors), n_lists * TRAINING_POINTS_PER_LIST)
+    sample = vectors[rng.choice(len(vectors), sample_size, replace=False)]
+    centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+
+    for _ in range(iterations):
+        assignments = _nearest(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, sample)
+        counts = np.bincount(assignments, minlength=n_lists)
+        empty = counts == 0
+        if empty.any():
+            # Re-seed empty lists from random training points
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+        centroids = _normalize(sums)
+
+    return centroids
+
+
+class IVFIndex:
+    """Inverted-file index over unit-normalised float32 vectors.
+
+    Vectors are stored sorted by list so that each list is a contiguous
+    slice; ``offsets[i]:offsets[i + 1]`` holds the members of list ``i``.
+    """
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        ids: np.ndarray,
+        vectors: np.ndarray,
+        lists: np.ndarray,
+        *,
+        seq: int = 0,
+        built_size: int | None = None,
+    ) -> None:
+        """Initialize the index from its arrays.
+
+        Args:
+            centroids: Unit-length centroids, one row per list
+            ids: Entity IDs of the indexed vectors
+            vectors: Unit-length vectors, one row per ID
+            lists: List assignment of each vector
+            seq: Last change-log sequence number applied to the index
+            built_size: Number of vectors the centroids were trained on
+        """
+        self.centroids = centroids.astype(np.float32, copy=False)
+        self.seq = seq
+        self.built_size = len(ids) if built_size is None else built_size
+        self._set_members(ids, vectors, lists)
+
+    @classmethod
+    def build(
+        cls,
+        ids: Sequence[int] | np.ndarray,
+        vectors: Sequence[Sequence[float]] | np.ndarray,
+        *,
+        n_lists: int | None = None,
+        iterations: int = 10,
+        seed: int = 0,
+    ) -> IVFIndex:
+        """Train centroids and assign vectors to them.
+
+        Args:
+            ids: Entity IDs, one per vector
+            vectors: Embedding vectors
+            n_lists: Number of lists (defaults to the square root of the size)
+            iterations: Number of k-means iterations
+            seed: Random seed for reproducible training
+
+        Returns:
+            A new index containing every vector
+
+        Raises:
+            ValueError: If there are no vectors or IDs and vectors differ in length
+        """
+        id_array = np.asarray(ids, dtype=np.int64)
+        matrix = _normalize(np.asarray(vectors, dtype=np.float32))
+        if matrix.ndim != 2 or len(matrix) == 0:
+            raise ValueError("Cannot build an ANN index without vectors")
+        if len(id_array) != len(matrix):
+            raise ValueError("Number of IDs does not match number of vectors")
+
+        if n_lists is None:
+            n_lists = int(np.sqrt(len(matrix)))
+        n_lists = max(1, min(n_lists, len(matrix)))
+        centroids = _kmeans(matrix, n_lists, iterations, seed)
+        return cls(centroids, id_array, matrix, _nearest(matrix, centroids))
+
+    @property
+    def dimensions(self) -> int:
+        """Dimensionality of the indexed vectors."""
+        return int(self.centroids.shape[1])
+
+    @property
+    def n_lists(self) -> int:
+        """Number of inverted lists."""
+        return int(self.centroids.shape[0])
+
+    def __len__(self) -> int:
+        """Number of indexed vectors."""
+        return len(self.ids)
+
+    @property
+    def needs_rebuild(self) -> bool:
+        """Whether the corpus drifted too far in size since training."""
+        size = max(len(self), 1)
+        built = max(self.built_size, 1)
+        return size > built * REBUILD_FACTOR or size * REBUILD_FACTOR < built
+
+    def _set_members(
+        self, ids: np.ndarray, vectors: np.ndarray, lists: np.ndarray
+    ) -> None:
+        order = np.argsort(lists, kind="stable")
+        self.ids = np.asarray(ids, dtype=np.int64)[order]
+        self.vectors = np.asarray(vectors, dtype=np.float32)[order]
+        self.lists = np.asarray(lists, dtype=np.int32)[order]
+        self.offsets = np.searchsorted(
+            self.lists, np.arange(self.n_lists + 1), side="left"
+        )
+
+    def copy(self) -> IVFIndex:
+        """Shallow copy; updates replace the arrays rather than mutate them."""
+        return IVFIndex(
+            self.centroids,
+            self.ids,
+            self.vectors,
+            self.lists,
+            seq=self.seq,
+            built_size=self.built_size,
+        )
+
+    def remove(self, ids: Iterable[int]) -> None:
+        """Drop vectors by entity ID; unknown IDs are ignored."""
+        drop = np.fromiter(ids, dtype=np.int64)
+        if len(drop) == 0:
+            return
+        keep = ~np.isin(self.ids, drop)
+        self._set_members(self.ids[keep], self.vectors[keep], self.lists[keep])
+
+    def upsert(
+        self,
+        ids: Sequence[int] | np.ndarray,
+        vectors: Sequence[Sequence[float]] | np.ndarray,
+    ) -> None:
+        """Insert vectors, replacing any already indexed under the same IDs.
+
+        Raises:
+            ValueError: If the vectors have the wrong dimensionality
+        """
+        id_array = np.asarray(ids, dtype=np.int64)
+        if len(id_array) == 0:
+            return
+        matrix = _normalize(np.asarray(vectors, dtype=np.float32))
+        if matrix.ndim != 2 or matrix.shape[1] != self.dimensions:
+            raise ValueError(
+                f"Expected {self.dimensions}-dimensional vectors for the ANN index"
+            )
+
+        keep = ~np.isin(self.ids, id_array)
+        self._set_members(
+            np.concatenate([self.ids[keep], id_array]),
+            np.concatenate([self.vectors[keep], matrix]),
+            np.concatenate([self.lists[keep], _nearest(matrix, self.centroids)]),
+        )
+
+    def search(
+        self, query: Sequence[float] | np.ndarray, k: int, probes: int = 8
+    ) -> list[tuple[int, float]]:
+        """Return up to ``k`` (entity ID, cosine similarity) pairs.
+
+        Args:
+            query: Query vector
+            k: Number of neighbours to return
+            probes: Number of closest lists to scan
+
+        Returns:
+            Neighbours sorted by similarity, highest first
+
+        Raises:
+            ValueError: If the query has the wrong dimensionality
+        """
+        vector = np.asarray(query, dtype=np.float32)
+        if vector.shape != (self.dimensions,):
+            raise ValueError(
+                f"Expected a {self.dimensions}-dimensional query for the ANN index"
+            )
+        if k <= 0 or len(self) == 0:
+            return []
+
+        vector = _normalize(vector)
+        probes = max(1, min(probes, self.n_lists))
+        centroid_scores = self.centroids @ vector
+        probed = np.argpartition(-centroid_scores, probes - 1)[:probes]
+
+        rows = np.concatenate(
+            [np.arange(self.offsets[i], self.offsets[i + 1]) for i in probed]
+        )
+        if len(rows) == 0:
+            return []
+
+        scores = self.vectors[rows] @ vector
+        if len(rows) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(rows))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(self.ids[rows[i]]), float(scores[i])) for i in top]
+
+    def save(self, path: Path) -> None:
+        """Write the index atomically, replacing any previous file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                np.savez(
+                    handle,
+                    version=np.array(INDEX_FORMAT_VERSION),
+                    centroids=self.centroids,
+                    ids=self.ids,
+                    vectors=self.vectors,
+                    lists=self.lists,
+                    seq=np.array(self.seq),
+                    built_size=np.array(self.built_size),
+                )
+            Path(tmp_name).replace(path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: Path) -> IVFIndex:
+        """Read an index written by :meth:`save`.
+
+        Raises:
+            ValueError: If the file has an unsupported format version
+        """
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"]) != INDEX_FORMAT_VERSION:
+                raise ValueError(f"Unsupported ANN index format in {path}")
+            return cls(
+                data["centroids"],
+                data["ids"],
+                data["vectors"],
+                data["lists"],
+                seq=int(data["seq"]),
+                built_size=int(data["built_size"]),
+            )
+
+
+# Loaded indexes shared by every store, keyed by file path
+_loaded: dict[Path, tuple[int, IVFIndex]] = {}
+_loaded_lock = threading.Lock()
+
+
+class AnnIndexStore:
+    """Persists one IVF index per entity type and embedding model."""
+
+    def __init__(
+        self, db_path: Path | str, *, min_vectors: int = 10000, probes: int = 8
+    ) -> None:
+        """Initialize the store for a database.
+
+        Args:
+            db_path: Path to the SQLite database the embeddings live in
+            min_vectors: Smallest corpus worth indexing; smaller corpora are
+                searched exactly
+            probes: Number of lists scanned per query
+        """
+        db_path = Path(db_path)
+        self.directory = db_path.with_name(f"{db_path.name}.ann")
+        self.min_vectors = min_vectors
+        self.probes = probes
+
+    def index_path(self, entity_type: str, model: str) -> Path:
+        """File holding the index for an entity type and model."""
+        slug = re.sub(r"[^A-Za-z0-9._-]+", "_", model)
+        return self.directory / f"{entity_type}-{slug}.npz"
+
+    def load(self, entity_type: str, model: str) -> IVFIndex | None:
+        """Load an index from disk, reusing the cached copy when unchanged."""
+        path = self.index_path(entity_type, model)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        with _loaded_lock:
+            cached = _loaded.get(path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+        try:
+            index = IVFIndex.load(path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(
+                "Ignoring unreadable ANN index", path=str(path), error=str(e)
+            )
+            return None
+
+        with _loaded_lock:
+            _loaded[path] = (mtime, index)
+        return index
+
+    def _save(self, entity_type: str, model: str, index: IVFIndex) -> None:
+        path = self.index_path(entity_type, model)
+        index.save(path)
+        with _loaded_lock:
+            _loaded[path] = (path.stat().st_mtime_ns, index)
+
+    def _discard(self, entity_type: str, model: str) -> None:
+        path = self.index_path(entity_type, model)
+        path.unlink(missing_ok=True)
+        with _loaded_lock:
+            _loaded.pop(path, None)
+
+    @staticmethod
+    def ensure_change_tracking(conn: sqlite3.Connection) -> None:
+        """Create the change log and the triggers that feed it.
+
+        Statements run one by one, unlike ``executescript``, so that the
+        caller's open transaction is not committed.
+        """
+        for statement in _CHANGE_TRACKING_SQL:
+            conn.execute(statement)
+
+    @staticmethod
+    def _latest_seq(conn: sqlite3.Connection, entity_type: str, model: str) -> int:
+        row = conn.execute(
+            """
+            SELECT MAX(seq) FROM embedding_changes
+            WHERE entity_type = ? AND embedding_model = ?
+            """,
+            (entity_type, model),
+        ).fetchone()
+        return int(row[0] or 0)
+
+    def fresh_index(
+        self, conn: sqlite3.Connection, entity_type: str, model: str
+    ) -> IVFIndex | None:
+        """Return the index if no embedding changed since it was synced.
+
+        Returns None when there is no index, change tracking is not set up, or
+        the index is stale; callers then fall back to exact search.
+        """
+        index = self.load(entity_type, model)
+        if index is None:
+            return None
+        try:
+            latest = self._latest_seq(conn, entity_type, model)
+        except sqlite3.OperationalError:
+            return None
+        return index if latest <= index.seq else None
+
+    def sync(
+        self,
+        conn: sqlite3.Connection,
+        entity_type: str,
+        model: str,
+        decode: Callable[[bytes], Sequence[float]] | None = None,
+    ) -> IVFIndex | None:
+        """Bring the index in line with the embeddings table.
+
+        Applies the logged changes incrementally, or rebuilds the index when
+        there is none yet or the corpus size drifted too far. Corpora smaller
+        than ``min_vectors`` have no index, as exact search is fast enough.
+
+        Args:
+            conn: Database connection
+            entity_type: Entity type of the embeddings (e.g. 'scene')
+            model: Embedding model name
+            decode: Decoder for stored embeddings
+
+        Returns:
+            The synced index, or None if the corpus is too small
+        """
+        decode = decode or BinaryEmbeddingSerializer().decode
+        self.ensure_change_tracking(conn)
+        latest = self._latest_seq(conn, entity_type, model)
+
+        (count,) = conn.execute(
+            """
+            SELECT COUNT(*) FROM embeddings
+            WHERE entity_type = ? AND embedding_model = ?
+            """,
+            (entity_type, model),
+        ).fetchone()
+
+        stored = index = None
+        if count >= self.min_vectors:
+            stored = index = self.load(entity_type, model)
+            if index is not None and index.seq < latest:
+                # Update a copy; searches may be reading the cached index
+                index = self._apply_changes(
+                    conn, index.copy(), entity_type, model, decode
+                )
+            if index is None or index.needs_rebuild:
+                index = self._rebuild(conn, entity_type, model, decode)
+
+        if index is None:
+            self._discard(entity_type, model)
+        elif index is not stored:
+            index.seq = latest
+            self._save(entity_type, model, index)
+
+        conn.execute(
+            """
+            DELETE FROM embedding_changes
+            WHERE entity_type = ? AND embedding_model = ? AND seq <= ?
+            """,
+            (entity_type, model, latest),
+        )
+        return index
+
+    def sync_all(
+        self,
+        conn: sqlite3.Connection,
+        entity_types: Iterable[str],
+        decode: Callable[[bytes], Sequence[float]] | None = None,
+    ) -> None:
+        """Sync the indexes of every embedding model of the given entity types."""
+        for entity_type in entity_types:
+            models = [
+                row[0]
+                for row in conn.execute(
+                    """
+                    SELECT DISTINCT embedding_model FROM embeddings
+                    WHERE entity_type = ?
+                    """,
+                    (entity_type,),
+                )
+            ]
+            for model in models:
+                self.sync(conn, entity_type, model, decode)
+
+    def _apply_changes(
+        self,
+        conn: sqlite3.Connection,
+        index: IVFIndex,
+        entity_type: str,
+        model: str,
+        decode: Callable[[bytes], Sequence[float]],
+    ) -> IVFIndex | None:
+        changed = [
+            row[0]
+            for row in conn.execute(
+                """
+                SELECT DISTINCT entity_id FROM embedding_changes
+                WHERE entity_type = ? AND embedding_model = ? AND seq > ?
+                """,
+                (entity_type, model, index.seq),
+            )
+        ]
+        ids, vectors = self._decode_rows(
+            self._fetch(conn, entity_type, model, changed), decode, index.dimensions
+        )
+        index.remove(changed)
+        try:
+            index.upsert(ids, vectors)
+        except ValueError:
+            return None
+        logger.debug(
+            "Applied embedding changes to ANN index",
+            entity_type=entity_type,
+            model=model,
+            changed=len(changed),
+        )
+        return index
+
+    def _rebuild(
+        self,
+        conn: sqlite3.Connection,
+        entity_type: str,
+        model: str,
+        decode: Callable[[bytes], Sequence[float]],
+    ) -> IVFIndex | None:
+        ids, vectors = self._decode_rows(
+            self._fetch(conn, entity_type, model), decode, None
+        )
+        if not ids:
+            return None
+        index = IVFIndex.build(ids, vectors)
+        logger.info(
+            "Built ANN index",
+            entity_type=entity_type,
+            model=model,
+            vectors=len(index),
+            lists=index.n_lists,
+        )
+        return index
+
+    @staticmethod
+    def _fetch(
+        conn: sqlite3.Connection,
+        entity_type: str,
+        model: str,
+        entity_ids: list[int] | None = None,
+    ) -> Iterable[tuple[int, bytes]]:
+        sql = """
+            SELECT entity_id, embedding FROM embeddings
+            WHERE entity_type = ? AND embedding_model = ?
+        """
+        if entity_ids is None:
+            return conn.execute(sql, (entity_type, model))
+        rows: list[tuple[int, bytes]] = []
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(entity_ids), 500):
+            batch = entity_ids[start : start + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows.extend(
+                conn.execute(
+                    f"{sql} AND entity_id IN ({placeholders})",
+                    (entity_type, model, *batch),
+                )
+            )
+        return rows
+
+    @staticmethod
+    def _decode_rows(
+        rows: Iterable[tuple[int, bytes]],
+        decode: Callable[[bytes], Sequence[float]],
+        dimensions: int | None,
+    ) -> tuple[list[int], list[Sequence[float]]]:
+        ids: list[int] = []
+        vectors: list[Sequence[float]] = []
+        for entity_id, blob in rows:
+            try:
+                vector = decode(blob)
+            except ValueError:
+                # Undecodable rows are skipped by exact search as well
+                continue
+            if dimensions is None:
+                dimensions = len(vector)
+            if len(vector) != dimensions:
+                continue
+            ids.append(int(entity_id))
+            vectors.append(vector)
+        return ids, vectors
+
+
+def get_ann_store(settings: Any) -> AnnIndexStore | None:
+    """Return the ANN index store for the configured database, if enabled.
+
+    Settings are read defensively so that partial settings objects simply
+    leave the index disabled.
+    """
+    if getattr(settings, "search_ann_enabled", False) is not True:
+        return None
+    return AnnIndexStore(
+        settings.database_path,
+        min_vectors=int(getattr(settings, "search_ann_min_vectors", 10000)),
+        probes=int(getattr(settings, "search_ann_probes", 8)),
+    )
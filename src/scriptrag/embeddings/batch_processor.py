@@ -155,6 +155,93 @@ class BatchProcessor:
             metadata=item.metadata,
         )
 
+    async def process_combined(
+        self,
+        items: list[BatchItem],
+        model: str,
+        dimensions: int | None = None,
+    ) -> list[BatchResult]:
+        """Embed all items with a single request to the provider.
+
+        Suited to many short texts, such as search queries, where one round
+        trip is much cheaper than one request per item. The whole request is
+        retried on failure.
+
+        Args:
+            items: Items to process
+            model: Embedding model to use
+            dimensions: Optional embedding dimensions
+
+        Returns:
+            Batch results in the order of ``items``
+        """
+        if not items:
+            return []
+
+        last_error = None
+
+        async with self._semaphore:
+            for attempt in range(self.retry_attempts):
+                try:
+                    request = EmbeddingRequest(
+                        model=model,
+                        input=[item.text for item in items],
+                        dimensions=dimensions,
+                    )
+
+                    response = await self.llm_client.embed(request)
+
+                    embeddings: dict[int, list[float]] = {}
+                    for position, data in enumerate(response.data or []):
+                        if data.get("embedding"):
+                            index = data.get("index", position)
+                            embeddings[index] = list(data["embedding"])
+                    missing = len(items) - len(embeddings.keys() & range(len(items)))
+                    if missing:
+                        raise EmbeddingResponseError(
+                            message=(
+                                f"{missing} of {len(items)} embeddings missing "
+                                "from response"
+                            ),
+                            hint="Check that the LLM provider supports batch "
+                            "embedding input",
+                            details={"model": model, "items": len(items)},
+                        )
+                    return [
+                        BatchResult(
+                            id=item.id,
+                            embedding=embeddings[i],
+                            metadata=item.metadata,
+                        )
+                        for i, item in enumerate(items)
+                    ]
+
+                except Exception as e:
+                    last_error = str(e)
+                    logger.warning(
+                        "Attempt %d/%d failed for batch of %d: %s",
+                        attempt + 1,
+                        self.retry_attempts,
+                        len(items),
+                        e,
+                    )
+
+                    # Exponential backoff
+                    if attempt < self.retry_attempts - 1:
+                        delay = self.retry_delay * (2**attempt)
+                        await asyncio.sleep(delay)
+
+        # All attempts failed
+        return [
+            BatchResult(
+                id=item.id,
+                embedding=None,
+                error=last_error,
+                metadata=item.metadata,
+            )
+            for item in items
+        ]
+
     async def process_stream(
         self,
         items: AsyncIterator[BatchItem],
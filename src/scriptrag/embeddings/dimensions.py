@@ -48,6 +48,58 @@ class EmbeddingModel(Enum):
         self.dimensions = dimensions
 
 
+class StoragePrecision(Enum):
+    """Precisions for stored embedding vectors.
+
+    Each member carries its name, the format code written into the stored
+    header and the bytes used per dimension. ``INT8`` also stores one float32
+    scale per vector.
+    """
+
+    FLOAT32 = ("float32", 0, 4)
+    FLOAT16 = ("float16", 1, 2)
+    INT8 = ("int8", 2, 1)
+
+    def __init__(
+        self, precision_name: str, format_code: int, bytes_per_dimension: int
+    ) -> None:
+        """Initialize precision enum.
+
+        Args:
+            precision_name: Name used in settings
+            format_code: Code stored in the embedding header
+            bytes_per_dimension: Bytes used per vector component
+        """
+        self.precision_name = precision_name
+        self.format_code = format_code
+        self.bytes_per_dimension = bytes_per_dimension
+
+    @classmethod
+    def from_name(cls, name: str) -> StoragePrecision:
+        """Look up a precision by its settings name.
+
+        Raises:
+            ValueError: If the name is unknown
+        """
+        for precision in cls:
+            if precision.precision_name == name:
+                return precision
+        raise ValueError(f"Unknown embedding storage precision: {name}")
+
+    @classmethod
+    def from_code(cls, code: int) -> StoragePrecision | None:
+        """Look up a precision by its header format code."""
+        for precision in cls:
+            if precision.format_code == code:
+                return precision
+        return None
+
+    def vector_bytes(self, dimensions: int) -> int:
+        """Bytes needed for one vector, excluding the header."""
+        scale_bytes = 4 if self is StoragePrecision.INT8 else 0
+        return dimensions * self.bytes_per_dimension + scale_bytes
+
+
 @dataclass
 class ModelInfo:
     """Information about an embedding model."""
@@ -306,13 +358,17 @@ class DimensionManager:
         return candidates[0] if candidates else None
 
     def estimate_storage_size(
-        self, model_name: str, num_embeddings: int
+        self,
+        model_name: str,
+        num_embeddings: int,
+        precision: StoragePrecision = StoragePrecision.FLOAT32,
     ) -> dict[str, Any]:
         """Estimate storage requirements for embeddings.
 
         Args:
             model_name: Name of the model
             num_embeddings: Number of embeddings
+            precision: Storage precision of the vectors
 
         Returns:
             Dictionary with storage estimates
@@ -321,12 +377,12 @@ class DimensionManager:
         if not dimensions:
             dimensions = 1536  # Default estimate
 
-        # Assume float32 storage (4 bytes per dimension)
-        bytes_per_embedding = dimensions * 4
+        bytes_per_embedding = precision.vector_bytes(dimensions)
         total_bytes = bytes_per_embedding * num_embeddings
 
         return {
             "dimensions": dimensions,
+            "precision": precision.precision_name,
             "bytes_per_embedding": bytes_per_embedding,
             "total_bytes": total_bytes,
             "total_mb": total_bytes / (1024 * 1024),
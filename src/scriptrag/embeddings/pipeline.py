@@ -400,6 +400,52 @@ class EmbeddingPipeline:
 
         return final_results
 
+    async def generate_combined(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several short texts with one request.
+
+        Cached texts and duplicates are not sent to the provider. Unlike
+        :meth:`generate_batch`, texts are not chunked and the call fails as
+        a whole.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            One embedding vector per text
+
+        Raises:
+            ValueError: If any embedding could not be generated
+        """
+        processed_texts = []
+        for text in texts:
+            processed_text = self.preprocessor.process(text)
+            if len(processed_text) > self.config.max_text_length:
+                processed_text = processed_text[: self.config.max_text_length] + "..."
+            processed_texts.append(processed_text)
+
+        embeddings: dict[str, list[float]] = {}
+        if self.cache and self.config.use_cache:
+            for processed_text in processed_texts:
+                cached = self.cache.get(processed_text, self.config.model)
+                if cached is not None:
+                    embeddings[processed_text] = cached
+
+        pending = list(dict.fromkeys(t for t in processed_texts if t not in embeddings))
+        if pending:
+            results = await self.batch_processor.process_combined(
+                [BatchItem(id=str(i), text=text) for i, text in enumerate(pending)],
+                self.config.model,
+                self.config.dimensions,
+            )
+            for text, result in zip(pending, results, strict=True):
+                if not result.embedding:
+                    raise ValueError(f"Failed to generate embeddings: {result.error}")
+                embeddings[text] = result.embedding
+                if self.cache and self.config.use_cache:
+                    self.cache.put(text, self.config.model, result.embedding)
+
+        return [embeddings[processed_text] for processed_text in processed_texts]
+
     async def generate_for_scenes(
         self,
         scenes: list[dict[str, Any]],
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import struct
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any, Protocol
 
 import numpy as np
 
 from scriptrag.config import get_logger
+from scriptrag.embeddings.dimensions import StoragePrecision
 
 logger = get_logger(__name__)
 
@@ -26,8 +28,42 @@ class EmbeddingSerializer(Protocol):
         ...
 
 
+# The high byte of the 4-byte header holds the storage precision's format
+# code and the low bytes the dimension. float32 embeddings written before
+# quantised storage existed have a zero high byte and read unchanged.
+_FORMAT_SHIFT = 24
+_DIMENSION_MASK = (1 << _FORMAT_SHIFT) - 1
+_MAX_DIMENSION = 10000
+
+_DTYPES: dict[StoragePrecision, np.dtype[Any]] = {
+    StoragePrecision.FLOAT32: np.dtype("<f4"),
+    StoragePrecision.FLOAT16: np.dtype("<f2"),
+    StoragePrecision.INT8: np.dtype("i1"),
+}
+
+
 class BinaryEmbeddingSerializer:
-    """Binary serializer for efficient embedding storage."""
+    """Binary serializer for efficient embedding storage.
+
+    Vectors are stored as float32, float16 or int8 components after a 4-byte
+    header. int8 vectors also store a float32 scale, ``value = code * scale``,
+    chosen so that the largest component maps to 127.
+    """
+
+    def __init__(
+        self, precision: StoragePrecision | str = StoragePrecision.FLOAT32
+    ) -> None:
+        """Initialize the serializer.
+
+        Args:
+            precision: Precision used when encoding; any precision decodes
+
+        Raises:
+            ValueError: If the precision name is unknown
+        """
+        if isinstance(precision, str):
+            precision = StoragePrecision.from_name(precision)
+        self.precision = precision
 
     def encode(self, embedding: list[float]) -> bytes:
         """Encode embedding vector for database storage.
@@ -39,17 +75,24 @@ class BinaryEmbeddingSerializer:
             Binary representation of embedding
         """
         dimension = len(embedding)
-        format_str = f"<I{dimension}f"  # I = unsigned int, f = float
-        return struct.pack(format_str, dimension, *embedding)
+        if self.precision is StoragePrecision.FLOAT32:
+            format_str = f"<I{dimension}f"  # I = unsigned int, f = float
+            return struct.pack(format_str, dimension, *embedding)
 
-    def decode(self, data: bytes) -> list[float]:
-        """Decode embedding vector from database storage.
+        header = struct.pack(
+            "<I", dimension | (self.precision.format_code << _FORMAT_SHIFT)
+        )
+        values = np.asarray(embedding, dtype=np.float32)
+        if self.precision is StoragePrecision.FLOAT16:
+            return header + values.astype("<f2").tobytes()
 
-        Args:
-            data: Binary embedding data
+        peak = float(np.max(np.abs(values))) if dimension else 0.0
+        scale = peak / 127 if peak > 0 else 0.0
+        codes = np.round(values / scale) if scale else np.zeros(dimension)
+        return header + struct.pack("<f", scale) + codes.astype(np.int8).tobytes()
 
-        Returns:
-            Embedding vector
+    def _parse(self, data: bytes) -> tuple[StoragePrecision, float, np.ndarray]:
+        """Split stored data into precision, scale and raw components.
 
         Raises:
             ValueError: If data is malformed or corrupted
@@ -59,33 +102,128 @@ class BinaryEmbeddingSerializer:
                 f"Embedding data too short: expected at least 4 bytes, got {len(data)}"
             )
 
-        dimension = struct.unpack("<I", data[:4])[0]
+        header = struct.unpack("<I", data[:4])[0]
+        precision = StoragePrecision.from_code(header >> _FORMAT_SHIFT)
+        if precision is None or precision is StoragePrecision.FLOAT32:
+            precision = StoragePrecision.FLOAT32
+            dimension = header
+        else:
+            dimension = header & _DIMENSION_MASK
 
         # Validate dimension
-        max_dimension = 10000
         if dimension == 0:
             raise ValueError("Embedding dimension cannot be zero")
-        if dimension > max_dimension:
+        if dimension > _MAX_DIMENSION:
             raise ValueError(
                 f"Embedding dimension {dimension} exceeds "
-                f"maximum allowed {max_dimension}"
+                f"maximum allowed {_MAX_DIMENSION}"
             )
 
         # Validate data length
-        expected_size = 4 + dimension * 4
+        expected_size = 4 + precision.vector_bytes(dimension)
         if len(data) != expected_size:
             raise ValueError(
                 f"Embedding data size mismatch: expected exactly "
                 f"{expected_size} bytes, got {len(data)}"
             )
 
-        # Unpack values
-        format_str = f"<{dimension}f"
-        try:
-            values = struct.unpack(format_str, data[4 : 4 + dimension * 4])
-            return list(values)
-        except struct.error as e:
-            raise ValueError(f"Failed to decode embedding data: {e}") from e
+        offset = 4
+        scale = 1.0
+        if precision is StoragePrecision.INT8:
+            scale = struct.unpack("<f", data[4:8])[0]
+            offset = 8
+        components = np.frombuffer(
+            data, dtype=_DTYPES[precision], count=dimension, offset=offset
+        )
+        return precision, scale, components
+
+    def decode(self, data: bytes) -> list[float]:
+        """Decode embedding vector from database storage.
+
+        Args:
+            data: Binary embedding data
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            ValueError: If data is malformed or corrupted
+        """
+        precision, scale, components = self._parse(data)
+        if precision is StoragePrecision.INT8:
+            values: list[float] = (components.astype(np.float32) * scale).tolist()
+        else:
+            values = components.astype(np.float32, copy=False).tolist()
+        return values
+
+    def approximate_similarities(
+        self,
+        blobs: Sequence[bytes],
+        query: Sequence[float] | Sequence[Sequence[float]] | np.ndarray,
+    ) -> np.ndarray:
+        """Estimate the cosine similarity of many stored vectors to queries.
+
+        Vectors are scored in their stored precision with one matrix product
+        per precision: int8 codes against int8-quantised queries (the
+        per-vector scales cancel out of the cosine), float16 and float32
+        components in float32. Blobs that cannot be decoded or whose
+        dimension differs from the queries score NaN.
+
+        Args:
+            blobs: Stored embeddings
+            query: Query vector, or a matrix with one query per row
+
+        Returns:
+            One estimate per blob, or one row of estimates per query when
+            ``query`` is a matrix
+        """
+        queries = np.asarray(query, dtype=np.float32)
+        single = queries.ndim == 1
+        queries = np.atleast_2d(queries)
+        scores = np.full((len(queries), len(blobs)), np.nan, dtype=np.float32)
+
+        # Blobs sharing a header and length share a layout, so each group is
+        # validated once and viewed as one matrix without per-blob decoding
+        layouts: dict[tuple[bytes, int], list[int]] = {}
+        for position, blob in enumerate(blobs):
+            if isinstance(blob, bytes) and len(blob) >= 4:
+                layouts.setdefault((blob[:4], len(blob)), []).append(position)
+
+        for rows in layouts.values():
+            try:
+                precision, _scale, components = self._parse(blobs[rows[0]])
+            except ValueError:
+                continue
+            if len(components) != queries.shape[1]:
+                continue
+
+            offset = len(blobs[rows[0]]) - components.nbytes
+            raw = np.frombuffer(b"".join(blobs[i] for i in rows), dtype=np.uint8)
+            matrix = (
+                np.ascontiguousarray(raw.reshape(len(rows), -1)[:, offset:])
+                .view(_DTYPES[precision])
+                .astype(np.float32)
+            )
+
+            targets = queries
+            if precision is StoragePrecision.INT8:
+                peaks = np.max(np.abs(queries), axis=1, keepdims=True)
+                targets = np.round(
+                    np.divide(
+                        queries * 127,
+                        peaks,
+                        out=np.zeros_like(queries),
+                        where=peaks > 0,
+                    )
+                )
+            norms = np.outer(
+                np.linalg.norm(targets, axis=1), np.linalg.norm(matrix, axis=1)
+            )
+            dots = targets @ matrix.T
+            scores[:, rows] = np.divide(
+                dots, norms, out=np.zeros_like(dots), where=norms > 0
+            )
+        return scores[0] if single else scores
 
 
 class VectorStore(ABC):
@@ -186,17 +324,24 @@ class VectorStore(ABC):
 class GitLFSVectorStore(VectorStore):
     """Vector store implementation using Git LFS for persistence."""
 
-    def __init__(self, lfs_dir: Path | None = None):
+    def __init__(
+        self,
+        lfs_dir: Path | None = None,
+        precision: StoragePrecision = StoragePrecision.FLOAT32,
+    ):
         """Initialize Git LFS vector store.
 
         Args:
             lfs_dir: Directory for LFS-tracked embeddings
+            precision: Storage precision; ``.npy`` files have no room for an
+                int8 scale, so quantised precisions are written as float16
 
         Note:
             This store does not support similarity search operations.
             Use HybridVectorStore with a database backend for search capabilities.
         """
         self.lfs_dir = lfs_dir or Path(".embeddings")
+        self.dtype = np.float32 if precision is StoragePrecision.FLOAT32 else np.float16
         self._ensure_gitattributes()
 
         logger.info(
@@ -251,7 +396,7 @@ class GitLFSVectorStore(VectorStore):
         path.parent.mkdir(parents=True, exist_ok=True)
 
         # Save as numpy array
-        np_array = np.array(embedding, dtype=np.float32)
+        np_array = np.array(embedding, dtype=self.dtype)
         np.save(path, np_array)
 
         # Save metadata if provided
@@ -5,6 +5,7 @@ from __future__ import annotations
 import traceback
 from typing import Any, cast
 
+from scriptrag.common.profiling import timed
 from scriptrag.config import get_logger, get_settings
 from scriptrag.exceptions import LLMError, LLMProviderError
 from scriptrag.llm.base import BaseLLMProvider
@@ -224,6 +225,7 @@ class LLMClient:
                 return model.provider
         return None
 
+    @timed("llm.complete")
     async def complete(
         self,
         messages: list[dict[str, str]] | CompletionRequest,
@@ -459,6 +461,7 @@ class LLMClient:
                 details=dict(error_details),
             ) from e
 
+    @timed("llm.embed")
     async def embed(
         self,
         text: str | list[str] | EmbeddingRequest,
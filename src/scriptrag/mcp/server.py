@@ -21,16 +21,24 @@ def create_server() -> FastMCP:
     from scriptrag.mcp.tools.query import register_query_tools
     from scriptrag.mcp.tools.scene import register_scene_tools
     from scriptrag.mcp.tools.search import register_search_tool
+    from scriptrag.mcp.tools.semantic import register_semantic_batch_tool
+    from scriptrag.mcp.tools.stats import register_stats_tool
 
     # Register the search tool
     register_search_tool(mcp)
 
+    # Register the batch semantic search tool
+    register_semantic_batch_tool(mcp)
+
     # Register dynamic query tools
     register_query_tools(mcp)
 
     # Register scene management tools
     register_scene_tools(mcp)
 
+    # Register performance statistics tool
+    register_stats_tool(mcp)
+
     return mcp
 
 
@@ -0,0 +1,89 @@
+"""Batch semantic search tool for MCP server."""
+
+# NOTE: Cannot use 'from __future__ import annotations' here because
+# the MCP library uses issubclass() on type annotations during tool registration
+
+from typing import Any
+
+from mcp.server import FastMCP
+
+from scriptrag.api.semantic_search import SemanticSearchService
+from scriptrag.config import get_logger, get_settings
+
+logger = get_logger(__name__)
+
+
+def register_semantic_batch_tool(mcp: FastMCP) -> None:
+    """Register the batch semantic search tool with the MCP server.
+
+    Args:
+        mcp: FastMCP server instance
+    """
+
+    @mcp.tool()
+    async def scriptrag_semantic_search_batch(
+        queries: list[str],
+        script_id: int | None = None,
+        top_k: int = 5,
+        threshold: float = 0.5,
+    ) -> dict[str, Any]:
+        """Find the scenes most similar in meaning to each of several queries.
+
+        All queries are embedded with one request and scored against the
+        stored scene embeddings together, so this is much faster than running
+        one search per query (e.g. one per character or story beat). Scenes
+        must have embeddings, generated during analysis.
+
+        Args:
+            queries: Query texts to search for
+            script_id: Only search scenes of this script
+            top_k: Maximum number of scenes to return per query
+            threshold: Minimum similarity score (0 to 1) of returned scenes
+
+        Returns:
+            Dictionary with one list of matching scenes per query
+        """
+        try:
+            if not queries:
+                return {
+                    "error": "At least one query is required",
+                    "success": False,
+                }
+
+            service = SemanticSearchService(get_settings())
+            batches = await service.search_similar_scenes_batch(
+                queries, script_id=script_id, top_k=top_k, threshold=threshold
+            )
+
+            return {
+                "success": True,
+                "results": [
+                    {
+                        "query": query,
+                        "scenes": [
+                            {
+                                "scene_id": result.scene_id,
+                                "script_id": result.script_id,
+                                "script_title": result.script_title,
+                                "scene_number": result.scene_number,
+                                "scene_heading": result.heading,
+                                "scene_location": result.location,
+                                "scene_time": result.time_of_day,
+                                "scene_content": result.content,
+                                "season": result.season,
+                                "episode": result.episode,
+                                "similarity_score": result.similarity_score,
+                            }
+                            for result in results
+                        ],
+                    }
+                    for query, results in zip(queries, batches, strict=True)
+                ],
+            }
+
+        except Exception as e:
+            logger.error(f"Batch semantic search failed: {e}")
+            return {
+                "error": str(e),
+                "success": False,
+            }
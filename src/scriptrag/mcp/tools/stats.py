@@ -0,0 +1,58 @@
+"""Performance statistics tool for MCP server."""
+
+# NOTE: Cannot use 'from __future__ import annotations' here because
+# the MCP library uses issubclass() on type annotations during tool registration
+
+from typing import Any
+
+from mcp.server import FastMCP
+
+from scriptrag.common.profiling import get_profiler
+from scriptrag.config import get_logger
+from scriptrag.database.result_cache import get_result_cache_stats
+
+logger = get_logger(__name__)
+
+
+def register_stats_tool(mcp: FastMCP) -> None:
+    """Register the performance statistics tool with the MCP server.
+
+    Args:
+        mcp: FastMCP server instance
+    """
+
+    @mcp.tool()
+    async def scriptrag_perf_stats(reset: bool = False) -> dict[str, Any]:
+        """Report timings of ScriptRAG pipeline stages in this server process.
+
+        Span timings (count, total, mean, min and max milliseconds) are
+        aggregated for parsing, searching, query execution, analyzers, LLM and
+        embedding calls, database writes, vector scoring and formatting since
+        the server started or the last reset. Result cache statistics are
+        included as well.
+
+        Args:
+            reset: Clear the span timings after reporting them
+
+        Returns:
+            Dictionary with span timings and result cache statistics
+        """
+        try:
+            profiler = get_profiler()
+            summary = profiler.summary()
+            if reset:
+                profiler.reset()
+
+            return {
+                "success": True,
+                "started_at": summary["started_at"],
+                "spans": summary["spans"],
+                "result_caches": get_result_cache_stats(),
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to collect performance stats: {e}")
+            return {
+                "error": str(e),
+                "success": False,
+            }
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from .fountain_models import Dialogue, Scene, Script
+from .fountain_models import Dialogue, Scene, Script, SourceSpan
 from .fountain_parser import FountainParser
 
-__all__ = ["Dialogue", "FountainParser", "Scene", "Script"]
+__all__ = ["Dialogue", "FountainParser", "Scene", "Script", "SourceSpan"]
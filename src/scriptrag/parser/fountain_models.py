@@ -15,6 +15,21 @@ class Dialogue:
     parenthetical: str | None = None
 
 
+@dataclass(frozen=True)
+class SourceSpan:
+    """Location of a scene in the source text.
+
+    ``start`` and ``end`` index the decoded file text, so
+    ``text[start:end]`` is the scene's original text. Lines are 1-based and
+    inclusive.
+    """
+
+    start: int
+    end: int
+    start_line: int
+    end_line: int
+
+
 @dataclass
 class Scene:
     """Represents a scene in a screenplay."""
@@ -31,6 +46,7 @@ class Scene:
     action_lines: list[str] = field(default_factory=list)
     boneyard_metadata: dict[str, Any] | None = None
     has_new_metadata: bool = False
+    span: SourceSpan | None = None
 
     def update_boneyard(self, metadata: dict[str, Any]) -> None:
         """Update the boneyard metadata for this scene."""
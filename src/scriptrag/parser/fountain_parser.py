@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import os
 import re
+import stat
+import tempfile
 from pathlib import Path
 from typing import Any
 
 from jouvence.parser import JouvenceParser
 
+from scriptrag.common.profiling import timed
 from scriptrag.config import get_logger
 from scriptrag.exceptions import ParseError
 from scriptrag.parser.fountain_models import Scene, Script
-from scriptrag.parser.fountain_processor import SceneProcessor
+from scriptrag.parser.fountain_processor import SceneProcessor, locate_scene_spans
 
 logger = get_logger(__name__)
 
@@ -123,19 +127,25 @@ class FountainParser:
         Returns:
             List of processed Scene objects
         """
+        # Skip scenes without headers (like FADE IN sections)
+        doc_scenes = [
+            jouvence_scene
+            for jouvence_scene in getattr(doc, "scenes", [])
+            if getattr(jouvence_scene, "header", None)
+        ]
+        spans = locate_scene_spans(content, [s.header for s in doc_scenes])
+
         scenes = []
-        scene_number = 0
-        doc_scenes = getattr(doc, "scenes", [])
-        for jouvence_scene in doc_scenes:
-            # Skip scenes without headers (like FADE IN sections)
-            if hasattr(jouvence_scene, "header") and jouvence_scene.header:
-                scene_number += 1
-                scene = self.processor.process_jouvence_scene(
-                    scene_number, jouvence_scene, content
-                )
-                scenes.append(scene)
+        for scene_number, (jouvence_scene, span) in enumerate(
+            zip(doc_scenes, spans, strict=True), start=1
+        ):
+            scene = self.processor.process_jouvence_scene(
+                scene_number, jouvence_scene, content, span=span
+            )
+            scenes.append(scene)
         return scenes
 
+    @timed("parse")
     def parse(self, content: str) -> Script:
         """Parse Fountain content into structured format.
 
@@ -162,6 +172,7 @@ class FountainParser:
 
         return Script(title=title, author=author, scenes=scenes, metadata=metadata)
 
+    @timed("parse")
     def parse_file(self, file_path: Path) -> Script:
         """Parse a Fountain file.
 
@@ -214,6 +225,7 @@ class FountainParser:
 
         return script
 
+    @timed("file.write")
     def write_with_updated_scenes(
         self,
         file_path: Path,
@@ -223,6 +235,12 @@ class FountainParser:
     ) -> None:
         """Write the script back to file with updated boneyard metadata.
 
+        Updated scenes are spliced into the file in one pass using the source
+        spans recorded while parsing; scenes without a usable span are found
+        by their original text instead. The result is written to a temporary
+        file and renamed over the original, and nothing is written when the
+        file would not change.
+
         Args:
             file_path: Path to write to
             script: The script object
@@ -233,33 +251,90 @@ class FountainParser:
         if dry_run:
             return
 
-        content = file_path.read_text(encoding="utf-8")
+        original = file_path.read_bytes()
+        content = original.decode("utf-8")
 
         # Safety check: don't write if no scenes have new metadata
         # But still ensure newline at end of file
         if not any(getattr(s, "has_new_metadata", False) for s in updated_scenes):
             # Just ensure newline at end if needed
             if content and not content.endswith("\n"):
-                content += "\n"
-                file_path.write_text(content, encoding="utf-8")
+                self._replace_file(file_path, (content + "\n").encode("utf-8"))
             return
 
         # Create a map of scenes by content hash for quick lookup
         updated_by_hash = {s.content_hash: s for s in updated_scenes}
 
-        # Process each scene
+        # Collect replacements for scenes whose span still matches the file
+        splices: list[tuple[int, int, str]] = []
+        unanchored: list[tuple[str, dict[str, Any]]] = []
         for scene in script.scenes:
-            if scene.content_hash in updated_by_hash:
-                updated_scene = updated_by_hash[scene.content_hash]
-                if updated_scene.has_new_metadata and updated_scene.boneyard_metadata:
-                    content = self.processor.update_scene_boneyard(
-                        content,
-                        scene.original_text,
-                        updated_scene.boneyard_metadata,
+            updated_scene = updated_by_hash.get(scene.content_hash)
+            if (
+                updated_scene is None
+                or not updated_scene.has_new_metadata
+                or not updated_scene.boneyard_metadata
+            ):
+                continue
+            span = scene.span
+            if span is not None and content[span.start : span.end] == (
+                scene.original_text
+            ):
+                splices.append(
+                    (
+                        span.start,
+                        span.end,
+                        self.processor.render_scene_boneyard(
+                            scene.original_text, updated_scene.boneyard_metadata
+                        ),
                     )
+                )
+            else:
+                unanchored.append(
+                    (scene.original_text, updated_scene.boneyard_metadata)
+                )
+
+        if splices:
+            parts = []
+            position = 0
+            for start, end, text in sorted(splices, key=lambda splice: splice[0]):
+                parts.extend([content[position:start], text])
+                position = end
+            parts.append(content[position:])
+            content = "".join(parts)
+
+        for scene_text, metadata in unanchored:
+            content = self.processor.update_scene_boneyard(
+                content, scene_text, metadata
+            )
 
         # Write back with proper end-of-file newline
         if content and not content.endswith("\n"):
             content += "\n"
-        file_path.write_text(content, encoding="utf-8")
+        data = content.encode("utf-8")
+        if data == original:
+            logger.debug(f"Metadata in {file_path} is already up to date")
+            return
+        self._replace_file(file_path, data)
         logger.info(f"Updated {len(updated_scenes)} scenes in {file_path}")
+
+    @staticmethod
+    def _replace_file(file_path: Path, data: bytes) -> None:
+        """Atomically replace a file's contents, keeping its permissions.
+
+        The data is written to a temporary file next to the target, which is
+        then renamed over it, so readers never see a partially written file.
+        """
+        target = file_path.resolve()
+        fd, tmp_name = tempfile.mkstemp(
+            dir=target.parent, prefix=f".{target.name}.", suffix=".tmp"
+        )
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            tmp_path.chmod(stat.S_IMODE(target.stat().st_mode))
+            tmp_path.replace(target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
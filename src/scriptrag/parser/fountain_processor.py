@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 import re
+from bisect import bisect_right
+from collections.abc import Sequence
 from typing import Any
 
 from jouvence.document import (
@@ -14,11 +16,91 @@ from jouvence.document import (
 )
 
 from scriptrag.config import get_logger
-from scriptrag.parser.fountain_models import Dialogue, Scene
+from scriptrag.parser.fountain_models import Dialogue, Scene, SourceSpan
 from scriptrag.utils import ScreenplayUtils
 
 logger = get_logger(__name__)
 
+# Boneyard comments, which are removed before jouvence parses the content
+COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+
+def locate_scene_spans(
+    content: str, headings: Sequence[Any]
+) -> list[SourceSpan | None]:
+    """Find the span of every scene with one pass over the content.
+
+    jouvence parses the content with boneyard comments removed and reports
+    each scene header as its line without a forced-heading dot. Headings are
+    found in document order as whole lines of that text, each search
+    continuing where the previous heading was found, and mapped back to
+    offsets in ``content``; repeated headings therefore resolve to the right
+    scene. A scene runs until the next scene starts, without trailing
+    whitespace.
+
+    Args:
+        content: Full file content
+        headings: Scene headers reported by jouvence, in document order
+
+    Returns:
+        One span per heading, None where a heading could not be found
+    """
+    # Cleaned offsets at which boneyard comments were removed, and the number
+    # of characters removed up to each of them
+    removed_at: list[int] = []
+    removed_total: list[int] = []
+    parts = []
+    previous = 0
+    for match in COMMENT_PATTERN.finditer(content):
+        parts.append(content[previous : match.start()])
+        removed = removed_total[-1] if removed_total else 0
+        removed_at.append(match.start() - removed)
+        removed_total.append(removed + match.end() - match.start())
+        previous = match.end()
+    parts.append(content[previous:])
+
+    def original_offset(cleaned_offset: int) -> int:
+        position = bisect_right(removed_at, cleaned_offset)
+        return cleaned_offset + (removed_total[position - 1] if position else 0)
+
+    cleaned = "".join(parts)
+    starts: list[int | None] = []
+    cursor = 0
+    for heading in headings:
+        start = None
+        position = cleaned.find(heading, cursor) if isinstance(heading, str) else -1
+        while position != -1:
+            line_start = cleaned.rfind("\n", 0, position) + 1
+            line_end = cleaned.find("\n", position)
+            line_end = len(cleaned) if line_end == -1 else line_end
+            line = cleaned[line_start:line_end]
+            if line.rstrip("\r").lstrip(".") == heading:
+                start = original_offset(line_start)
+                cursor = line_end
+                break
+            position = cleaned.find(heading, position + 1)
+        starts.append(start)
+
+    found = [start for start in starts if start is not None]
+    line_starts = [0] + [match.end() for match in re.finditer("\n", content)]
+    spans: list[SourceSpan | None] = []
+    for start in starts:
+        if start is None:
+            spans.append(None)
+            continue
+        following = bisect_right(found, start)
+        end = found[following] if following < len(found) else len(content)
+        end = start + len(content[start:end].rstrip())
+        spans.append(
+            SourceSpan(
+                start=start,
+                end=end,
+                start_line=bisect_right(line_starts, start),
+                end_line=bisect_right(line_starts, max(end - 1, start)),
+            )
+        )
+    return spans
+
 
 class SceneProcessor:
     """Process and extract information from Fountain scenes."""
@@ -34,8 +116,14 @@ class SceneProcessor:
         number: int,
         jouvence_scene: Any,
         full_content: str,
+        span: SourceSpan | None = None,
     ) -> Scene:
-        """Process a jouvence scene into our Scene object."""
+        """Process a jouvence scene into our Scene object.
+
+        ``span`` locates the scene in ``full_content`` (see
+        :func:`locate_scene_spans`); without it the original text is just the
+        heading.
+        """
         heading = jouvence_scene.header if jouvence_scene.header else ""
 
         # Parse scene type and location from heading using ScreenplayUtils
@@ -95,19 +183,7 @@ class SceneProcessor:
                 i += 1
 
         # Get original scene text from content
-        # This is a simplified approach - in production you might want to
-        # track line numbers
-        scene_start = full_content.find(heading)
-        if scene_start == -1:
-            original_text = heading
-        else:
-            # Find the next scene heading or end of file
-            next_scene_pattern = re.compile(
-                r"^(INT\.|EXT\.|EST\.|INT\./EXT\.|I/E\.)", re.MULTILINE
-            )
-            match = next_scene_pattern.search(full_content, scene_start + len(heading))
-            scene_end = match.start() if match else len(full_content)
-            original_text = full_content[scene_start:scene_end].rstrip()
+        original_text = heading if span is None else full_content[span.start : span.end]
 
         # Extract boneyard metadata if present
         boneyard_metadata = None
@@ -142,6 +218,7 @@ class SceneProcessor:
             dialogue_lines=dialogue_lines,
             action_lines=action_lines,
             boneyard_metadata=boneyard_metadata,
+            span=span,
         )
 
     def update_scene_boneyard(
@@ -162,6 +239,26 @@ class SceneProcessor:
             logger.warning("Could not find scene in content for boneyard update")
             return content
 
+        # Replace scene in content
+        return (
+            content[:scene_start]
+            + self.render_scene_boneyard(scene_text, metadata)
+            + content[scene_start + len(scene_text) :]
+        )
+
+    def render_scene_boneyard(self, scene_text: str, metadata: dict[str, Any]) -> str:
+        """Return the scene text with its boneyard metadata updated.
+
+        Metadata is merged into an existing boneyard block, or a new block is
+        appended to the end of the scene.
+
+        Args:
+            scene_text: Original scene text
+            metadata: New metadata to add
+
+        Returns:
+            Updated scene text
+        """
         # Check if scene already has boneyard
         existing_boneyard = self.BONEYARD_PATTERN.search(scene_text)
 
@@ -175,26 +272,25 @@ class SceneProcessor:
                 # Invalid JSON in boneyard section - use fresh metadata dict
                 pass
 
-            # Replace existing boneyard
+            # Replace existing boneyard, keeping its trailing newline (or lack
+            # of one) so rewriting unchanged metadata leaves the text as is
             boneyard_json = json.dumps(metadata, indent=2)
             new_boneyard = (
-                f"/* SCRIPTRAG-META-START\n{boneyard_json}\nSCRIPTRAG-META-END */\n"
+                f"/* SCRIPTRAG-META-START\n{boneyard_json}\nSCRIPTRAG-META-END */"
             )
-            updated_scene = self.BONEYARD_PATTERN.sub(new_boneyard, scene_text)
-        else:
-            # Add new boneyard at the end of scene
-            boneyard_json = json.dumps(metadata, indent=2)
-            new_boneyard = (
-                f"/* SCRIPTRAG-META-START\n{boneyard_json}\nSCRIPTRAG-META-END */\n"
+            return self.BONEYARD_PATTERN.sub(
+                lambda match: (
+                    new_boneyard + ("\n" if match.group(0)[-1] == "\n" else "")
+                ),
+                scene_text,
             )
-            updated_scene = scene_text.rstrip() + "\n\n" + new_boneyard
 
-        # Replace scene in content
-        return (
-            content[:scene_start]
-            + updated_scene
-            + content[scene_start + len(scene_text) :]
+        # Add new boneyard at the end of scene
+        boneyard_json = json.dumps(metadata, indent=2)
+        new_boneyard = (
+            f"/* SCRIPTRAG-META-START\n{boneyard_json}\nSCRIPTRAG-META-END */\n"
         )
+        return scene_text.rstrip() + "\n\n" + new_boneyard
 
     def _extract_missed_characters(
         self, text: str, existing_dialogue: list[Dialogue]
@@ -4,10 +4,18 @@ from __future__ import annotations
 
 import sqlite3
 import time
+from collections.abc import Hashable
 from typing import Any
 
+from scriptrag.common.profiling import timed
 from scriptrag.config import ScriptRAGSettings, get_logger, get_settings
 from scriptrag.database.readonly import get_read_only_connection
+from scriptrag.database.result_cache import (
+    ResultCache,
+    get_database_generation,
+    get_result_cache,
+    get_result_cache_size,
+)
 from scriptrag.query.spec import QuerySpec
 
 logger = get_logger(__name__)
@@ -47,6 +55,29 @@ class QueryEngine:
         """
         return self.settings.database_path
 
+    @property
+    def result_cache(self) -> ResultCache:
+        """Get the process-wide query result cache."""
+        return get_result_cache(self.settings, "query")
+
+    def _cache_key(self, sql: str, params: dict[str, Any]) -> Hashable | None:
+        """Build a result cache key for a prepared statement.
+
+        Args:
+            sql: Final SQL statement
+            params: Bound parameters
+
+        Returns:
+            Hashable key, or None if the parameters cannot be hashed
+        """
+        key = (sql, tuple(sorted(params.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @timed("query")
     def execute(
         self,
         spec: QuerySpec,
@@ -127,6 +158,23 @@ class QueryEngine:
 
         # Execute query using the engine's settings
         with get_read_only_connection(self.settings) as conn:
+            # Serve repeated queries from the cache while nothing was written
+            cache_key = None
+            generation = None
+            if get_result_cache_size(self.settings) > 0:
+                generation = get_database_generation(self.settings, conn)
+                if generation is not None:
+                    cache_key = self._cache_key(sql, validated_params)
+            if cache_key is not None and generation is not None:
+                hit, cached = self.result_cache.get(cache_key, generation)
+                if hit:
+                    execution_time_ms = (time.time() - start_time) * 1000
+                    logger.info(
+                        f"Query '{spec.name}' served from cache: {len(cached)} rows "
+                        f"in {execution_time_ms:.2f}ms"
+                    )
+                    return [dict(row) for row in cached], execution_time_ms
+
             logger.debug(
                 f"Executing query '{spec.name}' with params: {validated_params}"
             )
@@ -142,6 +190,11 @@ class QueryEngine:
                 else:
                     result = []
 
+                if cache_key is not None and generation is not None:
+                    self.result_cache.put(
+                        cache_key, generation, [dict(row) for row in result]
+                    )
+
                 execution_time_ms = (time.time() - start_time) * 1000
                 logger.info(
                     f"Query '{spec.name}' executed: {len(result)} rows "
@@ -3,15 +3,25 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import dataclasses
 import queue
 import sqlite3
 import threading
 import time
-from collections.abc import Generator
+from collections.abc import Generator, Hashable
 from contextlib import contextmanager
+from typing import Any
 
+from scriptrag.common.profiling import timed
 from scriptrag.config import ScriptRAGSettings, get_logger
 from scriptrag.database.readonly import get_read_only_connection
+from scriptrag.database.result_cache import (
+    ResultCache,
+    get_database_generation,
+    get_result_cache,
+    get_result_cache_size,
+)
 from scriptrag.exceptions import DatabaseError
 from scriptrag.search.builder import QueryBuilder
 from scriptrag.search.filters import BibleContentFilter, DuplicateFilter
@@ -21,12 +31,64 @@ from scriptrag.search.models import (
     SearchResponse,
     SearchResult,
 )
-from scriptrag.search.rankers import BibleResultRanker, HybridRanker
+from scriptrag.search.rankers import BibleResultRanker, HybridRanker, RankFusion
 from scriptrag.search.semantic_adapter import SemanticSearchAdapter
 from scriptrag.search.utils import SearchResultUtils
 
 logger = get_logger(__name__)
 
+# Settings that change which results a search returns; part of the cache key
+_RESULT_SETTINGS = (
+    "search_vector_threshold",
+    "search_vector_similarity_threshold",
+    "search_vector_result_limit_factor",
+    "search_vector_min_results",
+    "llm_provider",
+    "llm_endpoint",
+    "llm_embedding_model",
+    "llm_embedding_dimensions",
+    "search_fusion_method",
+    "search_fusion_rrf_k",
+    "search_fusion_vector_weight",
+)
+
+
+def _get_leg_timeout(settings: ScriptRAGSettings) -> float | None:
+    """Get the timeout for the bible and semantic search legs.
+
+    Args:
+        settings: Configuration settings
+
+    Returns:
+        Timeout in seconds, or None if the settings object does not define one
+    """
+    timeout = getattr(settings, "search_leg_timeout", None)
+    return float(timeout) if isinstance(timeout, int | float) else None
+
+
+def _get_rank_fusion(settings: ScriptRAGSettings) -> RankFusion:
+    """Build the lexical/vector fusion stage from settings.
+
+    Args:
+        settings: Configuration settings
+
+    Returns:
+        Rank fusion configured from settings, with defaults for any fusion
+        setting the settings object does not define
+    """
+    method = getattr(settings, "search_fusion_method", None)
+    k = getattr(settings, "search_fusion_rrf_k", None)
+    weight = getattr(settings, "search_fusion_vector_weight", None)
+    return RankFusion(
+        method=method if method in RankFusion.METHODS else "rrf",
+        k=k if isinstance(k, int) and k >= 1 else 60,
+        vector_weight=(
+            float(weight)
+            if isinstance(weight, int | float) and 0.0 <= weight <= 1.0
+            else 0.5
+        ),
+    )
+
 
 class SearchEngine:
     """Execute search queries against the database."""
@@ -48,6 +110,7 @@ class SearchEngine:
         self.semantic_adapter = SemanticSearchAdapter(settings)
         self.result_utils = SearchResultUtils()
         self.ranker = HybridRanker()
+        self.fusion = _get_rank_fusion(settings)
         self.duplicate_filter = DuplicateFilter()
 
     @contextmanager
@@ -81,6 +144,35 @@ class SearchEngine:
                 # Re-raise other ValueErrors as-is
                 raise
 
+    @property
+    def result_cache(self) -> ResultCache:
+        """Get the process-wide search result cache."""
+        return get_result_cache(self.settings, "search")
+
+    def _cache_key(self, query: SearchQuery) -> Hashable:
+        """Build a result cache key for a search query.
+
+        Args:
+            query: Parsed search query
+
+        Returns:
+            Hashable key covering every query field, the search strategy and
+            the settings that affect results
+        """
+
+        def freeze(value: Any) -> Any:
+            if isinstance(value, list | tuple):
+                return tuple(freeze(item) for item in value)
+            return value
+
+        fields = tuple(
+            (f.name, freeze(getattr(query, f.name))) for f in dataclasses.fields(query)
+        )
+        result_settings = tuple(
+            (name, getattr(self.settings, name, None)) for name in _RESULT_SETTINGS
+        )
+        return (fields, query.needs_vector_search, result_settings)
+
     def _cleanup_event_loop(self, loop: asyncio.AbstractEventLoop) -> None:
         """Clean up an event loop by cancelling pending tasks.
 
@@ -179,6 +271,7 @@ class SearchEngine:
                 self._cleanup_event_loop(loop)
                 loop.close()
 
+    @timed("search")
     async def search_async(self, query: SearchQuery) -> SearchResponse:
         """Execute a search query asynchronously.
 
@@ -216,147 +309,235 @@ class SearchEngine:
                 },
             )
 
-        with self.get_read_only_connection() as conn:
-            results: list[SearchResult] = []
-            bible_results: list[BibleSearchResult] = []
-            total_count = 0
-            bible_total_count = 0
+        # Serve repeated searches from the cache while nothing was written
+        cache_key = None
+        generation = None
+        if get_result_cache_size(self.settings) > 0:
+            with self.get_read_only_connection() as conn:
+                generation = get_database_generation(self.settings, conn)
+            if generation is not None:
+                cache_key = self._cache_key(query)
+                hit, cached = self.result_cache.get(cache_key, generation)
+                if hit:
+                    response: SearchResponse = copy.deepcopy(cached)
+                    response.query = query
+                    response.execution_time_ms = (time.time() - start_time) * 1000
+                    response.metadata["cache_hit"] = True
+                    logger.info(
+                        f"Search served from cache: {len(response.results)} "
+                        f"scene and {len(response.bible_results)} bible results "
+                        f"in {response.execution_time_ms:.2f}ms"
+                    )
+                    return response
+
+        # Use configurable settings for semantic search
+        limit_factor = self.settings.search_vector_result_limit_factor
+        semantic_limit = max(
+            self.settings.search_vector_min_results,
+            int(query.limit * limit_factor),
+        )
+        leg_timeout = _get_leg_timeout(self.settings)
+
+        # Start the semantic leg first so the query embedding request is in
+        # flight while the SQL legs run on worker threads
+        search_methods = ["sql"]
+        semantic_leg: (
+            asyncio.Task[tuple[list[SearchResult], list[BibleSearchResult]]] | None
+        ) = None
+        if query.needs_vector_search:
+            search_methods.append("semantic")
+            logger.info("Performing semantic search to enhance results")
+            semantic_leg = asyncio.create_task(
+                asyncio.wait_for(
+                    self.semantic_adapter.search_semantic(query, semantic_limit),
+                    timeout=leg_timeout,
+                )
+            )
 
+        scene_leg = None
+        bible_leg = None
+        try:
             # Search script content unless only_bible is True
             if not query.only_bible:
-                # Build and execute search query
-                sql, params = self.query_builder.build_search_query(query)
-
-                logger.debug(f"Executing search query: {sql[:200]}...")
-                cursor = conn.execute(sql, params)
-                rows = cursor.fetchall()
-
-                # Build and execute count query for pagination
-                count_sql, count_params = self.query_builder.build_count_query(query)
-                count_cursor = conn.execute(count_sql, count_params)
-                count_result = count_cursor.fetchone()
-                # Handle None result or missing 'total' key gracefully
-                if count_result:
-                    try:
-                        total_count = count_result["total"] or 0
-                    except (KeyError, TypeError, IndexError):
-                        # Handle various cases where 'total' key is missing
-                        total_count = 0
-                else:
-                    total_count = 0
-
-                # Convert rows to SearchResult objects
-                for idx, row in enumerate(rows):
-                    # Parse metadata using utility
-                    metadata = self.result_utils.parse_metadata(
-                        row["script_metadata"],
-                        {"row_index": idx, "script_id": row["script_id"]},
+                scene_leg = asyncio.create_task(
+                    asyncio.to_thread(self._search_scenes, query)
+                )
+            # Search bible content if include_bible is True or only_bible is True
+            if query.include_bible or query.only_bible:
+                bible_leg = asyncio.create_task(
+                    asyncio.wait_for(
+                        asyncio.to_thread(self._search_bible_leg, query),
+                        timeout=leg_timeout,
                     )
+                )
 
-                    result = SearchResult(
-                        script_id=row["script_id"],
-                        script_title=row["script_title"],
-                        script_author=row["script_author"],
-                        scene_id=row["scene_id"],
-                        scene_number=row["scene_number"],
-                        scene_heading=row["scene_heading"],
-                        scene_location=row["scene_location"],
-                        scene_time=row["scene_time"],
-                        scene_content=row["scene_content"],
-                        season=metadata.get("season"),
-                        episode=metadata.get("episode"),
-                        match_type=self.result_utils.determine_match_type(query),
-                    )
-                    results.append(result)
+            results: list[SearchResult] = []
+            total_count = 0
+            if scene_leg is not None:
+                results, total_count = await scene_leg
+        except BaseException:
+            for leg in (semantic_leg, bible_leg):
+                if leg is not None:
+                    leg.cancel()
+            raise
+
+        degraded = False
+        semantic_results: list[SearchResult] = []
+        bible_results: list[BibleSearchResult] = []
+        bible_total_count = 0
+        if bible_leg is not None:
+            try:
+                bible_results, bible_total_count = await bible_leg
+            except TimeoutError:
+                logger.warning(
+                    "Bible search timed out, continuing without bible results",
+                    timeout=leg_timeout,
+                )
+                degraded = True
 
-            # Search bible content if include_bible is True or only_bible is True
-            if query.include_bible or query.only_bible:
-                bible_results, bible_total_count = self._search_bible_content(
-                    conn, query
+        if semantic_leg is not None:
+            try:
+                semantic_results, semantic_bible_results = await semantic_leg
+
+                # Merge semantic bible results with existing ones
+                if semantic_bible_results:
+                    # Add to existing bible results, avoiding duplicates
+                    existing_bible_ids = {br.chunk_id for br in bible_results}
+                    for sbr in semantic_bible_results:
+                        if sbr.chunk_id not in existing_bible_ids:
+                            bible_results.append(sbr)
+                            existing_bible_ids.add(sbr.chunk_id)
+
+            except Exception as e:
+                logger.error(
+                    "Semantic search failed, falling back to SQL results",
+                    error=str(e) or f"timed out after {leg_timeout}s",
+                    query=query.raw_query[:100] if query.raw_query else None,
+                    error_type=type(e).__name__,
                 )
+                # Continue with SQL results only - this is a graceful degradation
+                degraded = True
+
+        # Rank the lexical results, then fuse them with the vector results by
+        # rank; the scores of the two legs are not comparable
+        results = self.duplicate_filter.filter(results, query)
+        results = self.ranker.rank(results, query)
+        if semantic_results:
+            results = self.fusion.fuse(results, semantic_results, limit=query.limit)
+
+        # Rank bible results if present
+        if bible_results:
+            bible_results = BibleContentFilter.deduplicate(bible_results)
+            query_text = query.dialogue or query.action or query.text_query or ""
+            if query_text:
+                bible_results = BibleResultRanker.rank_by_relevance(
+                    bible_results, query_text
+                )
+            else:
+                bible_results = BibleResultRanker.rank_by_hierarchy(bible_results)
+
+        # Calculate execution time
+        execution_time_ms = (time.time() - start_time) * 1000
+
+        # Create response
+        total_results = len(results) + len(bible_results)
+        combined_total = total_count + bible_total_count
+        response = SearchResponse(
+            query=query,
+            results=results,
+            bible_results=bible_results,
+            total_count=total_count,
+            bible_total_count=bible_total_count,
+            has_more=(combined_total > query.offset + query.limit),
+            execution_time_ms=execution_time_ms,
+            search_methods=search_methods,
+            metadata={"cache_hit": False},
+        )
+
+        logger.info(
+            f"Search completed: {total_results} results found "
+            f"(scenes: {len(results)}, bible: {len(bible_results)}) "
+            f"in {execution_time_ms:.2f}ms"
+        )
+
+        # Degraded (timed out or SQL-only fallback) responses are not cached so
+        # that the next identical search retries the dropped legs
+        if cache_key is not None and generation is not None and not degraded:
+            self.result_cache.put(cache_key, generation, copy.deepcopy(response))
+
+        return response
+
+    def _search_scenes(self, query: SearchQuery) -> tuple[list[SearchResult], int]:
+        """Run the SQL scene search leg on its own read-only connection.
 
-            # Check if semantic search is needed
-            search_methods = ["sql"]
-            if query.needs_vector_search:
-                search_methods.append("semantic")
-                logger.info("Performing semantic search to enhance results")
+        Args:
+            query: Search query
 
-                # Enhance results with semantic search
-                try:
-                    # Use configurable settings for semantic search
-                    limit_factor = self.settings.search_vector_result_limit_factor
-                    semantic_limit = max(
-                        self.settings.search_vector_min_results,
-                        int(query.limit * limit_factor),
-                    )
-                    enhance = self.semantic_adapter.enhance_results_with_semantic_search
-                    (
-                        enhanced_results,
-                        semantic_bible_results,
-                    ) = await enhance(
-                        query=query,
-                        existing_results=results,
-                        limit=semantic_limit,
-                    )
-                    results = enhanced_results
+        Returns:
+            Tuple of (scene results, total count)
+        """
+        results: list[SearchResult] = []
+        with self.get_read_only_connection() as conn:
+            # Build and execute search query
+            sql, params = self.query_builder.build_search_query(query)
 
-                    # Merge semantic bible results with existing ones
-                    if semantic_bible_results:
-                        # Add to existing bible results, avoiding duplicates
-                        existing_bible_ids = {br.chunk_id for br in bible_results}
-                        for sbr in semantic_bible_results:
-                            if sbr.chunk_id not in existing_bible_ids:
-                                bible_results.append(sbr)
-                                existing_bible_ids.add(sbr.chunk_id)
+            logger.debug(f"Executing search query: {sql[:200]}...")
+            cursor = conn.execute(sql, params)
+            rows = cursor.fetchall()
 
-                except Exception as e:
-                    logger.error(
-                        "Semantic search failed, falling back to SQL results",
-                        error=str(e),
-                        query=query.raw_query[:100] if query.raw_query else None,
-                        error_type=type(e).__name__,
-                    )
-                    # Continue with SQL results only - this is a graceful degradation
-
-            # Apply duplicate filtering and ranking
-            results = self.duplicate_filter.filter(results, query)
-            results = self.ranker.rank(results, query)
-
-            # Rank bible results if present
-            if bible_results:
-                bible_results = BibleContentFilter.deduplicate(bible_results)
-                query_text = query.dialogue or query.action or query.text_query or ""
-                if query_text:
-                    bible_results = BibleResultRanker.rank_by_relevance(
-                        bible_results, query_text
-                    )
-                else:
-                    bible_results = BibleResultRanker.rank_by_hierarchy(bible_results)
-
-            # Calculate execution time
-            execution_time_ms = (time.time() - start_time) * 1000
-
-            # Create response
-            total_results = len(results) + len(bible_results)
-            combined_total = total_count + bible_total_count
-            response = SearchResponse(
-                query=query,
-                results=results,
-                bible_results=bible_results,
-                total_count=total_count,
-                bible_total_count=bible_total_count,
-                has_more=(combined_total > query.offset + query.limit),
-                execution_time_ms=execution_time_ms,
-                search_methods=search_methods,
+            # Build and execute count query for pagination
+            count_sql, count_params = self.query_builder.build_count_query(query)
+            count_cursor = conn.execute(count_sql, count_params)
+            count_result = count_cursor.fetchone()
+        # Handle None result or missing 'total' key gracefully
+        if count_result:
+            try:
+                total_count = count_result["total"] or 0
+            except (KeyError, TypeError, IndexError):
+                # Handle various cases where 'total' key is missing
+                total_count = 0
+        else:
+            total_count = 0
+
+        # Convert rows to SearchResult objects
+        for idx, row in enumerate(rows):
+            # Parse metadata using utility
+            metadata = self.result_utils.parse_metadata(
+                row["script_metadata"],
+                {"row_index": idx, "script_id": row["script_id"]},
             )
 
-            logger.info(
-                f"Search completed: {total_results} results found "
-                f"(scenes: {len(results)}, bible: {len(bible_results)}) "
-                f"in {execution_time_ms:.2f}ms"
+            result = SearchResult(
+                script_id=row["script_id"],
+                script_title=row["script_title"],
+                script_author=row["script_author"],
+                scene_id=row["scene_id"],
+                scene_number=row["scene_number"],
+                scene_heading=row["scene_heading"],
+                scene_location=row["scene_location"],
+                scene_time=row["scene_time"],
+                scene_content=row["scene_content"],
+                season=metadata.get("season"),
+                episode=metadata.get("episode"),
+                match_type=self.result_utils.determine_match_type(query),
             )
+            results.append(result)
+
+        return results, total_count
 
-            return response
+    def _search_bible_leg(
+        self, query: SearchQuery
+    ) -> tuple[list[BibleSearchResult], int]:
+        """Run the SQL bible search leg on its own read-only connection.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Tuple of (bible results, total count)
+        """
+        with self.get_read_only_connection() as conn:
+            return self._search_bible_content(conn, query)
 
     def _search_bible_content(
         self, conn: sqlite3.Connection, query: SearchQuery
@@ -8,6 +8,7 @@ from typing import Any
 from rich.console import Console
 from rich.panel import Panel
 
+from scriptrag.common.profiling import timed
 from scriptrag.config import get_logger
 from scriptrag.search.models import SearchQuery, SearchResponse, SearchResult
 
@@ -42,6 +43,7 @@ class ResultFormatter:
             return getattr(query, attr)
         return default
 
+    @timed("format")
     def format_results(self, response: SearchResponse, verbose: bool = False) -> None:
         """Format and display search results.
 
@@ -227,6 +229,7 @@ class ResultFormatter:
                 f"Use --offset {next_offset} to see more.[/yellow]"
             )
 
+    @timed("format")
     def format_brief(self, response: SearchResponse) -> str:
         """Format results as brief text summary.
 
@@ -264,6 +267,7 @@ class ResultFormatter:
 
         return "\n".join(lines)
 
+    @timed("format")
     def format_json(self, response: SearchResponse) -> str:
         """Format search results as JSON.
 
@@ -2,12 +2,58 @@
 
 from __future__ import annotations
 
+import heapq
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
 
 from scriptrag.search.models import BibleSearchResult, SearchQuery, SearchResult
 
 
+@dataclass(frozen=True)
+class TokenizedText:
+    """Lowercased text and its set of words."""
+
+    lower: str
+    words: frozenset[str]
+
+
+@lru_cache(maxsize=1024)
+def tokenize_text(text: str) -> TokenizedText:
+    """Tokenise text for the text rankers.
+
+    Cached, so the rankers of one search share the tokens of each result
+    instead of lowercasing and splitting the scene content again per ranker.
+
+    Args:
+        text: Text to tokenise
+
+    Returns:
+        Tokenised text
+    """
+    lower = text.lower()
+    return TokenizedText(lower=lower, words=frozenset(lower.split()))
+
+
+def find_positions(text: str, term: str) -> list[int]:
+    """Find the start offsets of non-overlapping occurrences of a term.
+
+    Args:
+        text: Text to search
+        term: Non-empty term to find
+
+    Returns:
+        Start offsets in ascending order
+    """
+    positions = []
+    idx = text.find(term)
+    while idx != -1:
+        positions.append(idx)
+        idx = text.find(term, idx + len(term))
+    return positions
+
+
 class SearchRanker(ABC):
     """Base class for search result ranking."""
 
@@ -71,28 +117,26 @@ class TextMatchRanker(SearchRanker):
         if not text or not query:
             return 0.0
 
-        text_lower = text.lower()
+        tokens = tokenize_text(text)
         query_lower = query.lower()
 
         # Build base score from matching signals
         score = 0.0
 
         # Exact match
-        if query_lower in text_lower:
+        if query_lower in tokens.lower:
             score += self.weights["exact_match"]
 
-        # Word-level matching
         query_words = query_lower.split()
-        text_words = text_lower.split()
-        word_matches = sum(1 for word in query_words if word in text_words)
         if query_words:
+            # Word-level matching
+            word_matches = sum(1 for word in query_words if word in tokens.words)
             score += self.weights["word_match"] * (word_matches / len(query_words))
 
-        # Partial word matching
-        partial_matches = sum(
-            1 for word in query_words if any(word in tw for tw in text_words)
-        )
-        if query_words:
+            # Partial word matching: neither a query word nor a text word
+            # contains whitespace, so a query word lies inside some text word
+            # exactly when it occurs in the text
+            partial_matches = sum(1 for word in query_words if word in tokens.lower)
             word_ratio = partial_matches / len(query_words)
             score += self.weights["partial_match"] * word_ratio
 
@@ -169,38 +213,41 @@ class ProximityRanker(SearchRanker):
             terms: Search terms
 
         Returns:
-            Proximity score (lower is better)
+            Proximity score between 0 and 1 (higher when the terms are closer)
         """
         if not text or len(terms) < 2:
             return 1.0
 
-        text_lower = text.lower()
-        positions: dict[str, list[int]] = {}
+        text_lower = tokenize_text(text).lower
+        distinct_terms = list(dict.fromkeys(t.lower() for t in terms if t))
 
         # Find positions of each term
-        for term in terms:
-            term_lower = term.lower()
-            positions[term] = []
-            idx = 0
-            while idx < len(text_lower):
-                idx = text_lower.find(term_lower, idx)
-                if idx == -1:
-                    break
-                positions[term].append(idx)
-                idx += len(term_lower)
-
-        # If any term is missing, no proximity signal
-        if any(not pos_list for pos_list in positions.values()):
-            return 0.0
-
-        # Calculate minimum distance between all terms
+        term_positions = []
+        for index, term in enumerate(distinct_terms):
+            positions = find_positions(text_lower, term)
+            # If any term is missing, no proximity signal
+            if not positions:
+                return 0.0
+            term_positions.append([(pos, index) for pos in positions])
+
+        # Smallest window containing every term, found in one sweep over the
+        # merged occurrences with a sliding left edge
+        counts = [0] * len(distinct_terms)
+        covered = 0
+        left = 0
+        merged = list(heapq.merge(*term_positions))
         min_distance = float("inf")
-        for i, term1 in enumerate(terms[:-1]):
-            for term2 in terms[i + 1 :]:
-                for pos1 in positions[term1]:
-                    for pos2 in positions[term2]:
-                        distance = abs(pos2 - pos1)
-                        min_distance = min(min_distance, distance)
+        for pos, index in merged:
+            if counts[index] == 0:
+                covered += 1
+            counts[index] += 1
+            while covered == len(distinct_terms):
+                start, first = merged[left]
+                min_distance = min(min_distance, pos - start)
+                counts[first] -= 1
+                if counts[first] == 0:
+                    covered -= 1
+                left += 1
 
         # Convert to score (inverse of distance, normalized)
         if min_distance == float("inf"):
@@ -301,6 +348,105 @@ class HybridRanker(SearchRanker):
         return sorted(results, key=lambda r: r.relevance_score, reverse=True)
 
 
+class RankFusion:
+    """Fuse ranked lexical and vector results into one ranking.
+
+    Lexical scores and vector similarities are not on a common scale, so the
+    two lists are combined either by rank (reciprocal-rank fusion) or by
+    scores min-max normalised within each list.
+    """
+
+    METHODS = ("rrf", "weighted")
+
+    def __init__(
+        self, method: str = "rrf", k: int = 60, vector_weight: float = 0.5
+    ) -> None:
+        """Initialize rank fusion.
+
+        Args:
+            method: "rrf" for reciprocal-rank fusion or "weighted" for
+                weighted normalised scores
+            k: Rank offset for reciprocal-rank fusion
+            vector_weight: Weight of the vector list; the lexical list gets
+                ``1 - vector_weight``
+
+        Raises:
+            ValueError: If the method or a parameter is invalid
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown fusion method: {method}")
+        if k < 1:
+            raise ValueError(f"RRF k must be at least 1, got {k}")
+        if not 0.0 <= vector_weight <= 1.0:
+            raise ValueError(f"Vector weight must be in [0, 1], got {vector_weight}")
+        self.method = method
+        self.k = k
+        self.vector_weight = vector_weight
+
+    def _scores(self, results: list[SearchResult]) -> list[float]:
+        """Score one ranked list on a 0-1 scale comparable across lists."""
+        if self.method == "rrf":
+            return [1.0 / (self.k + rank) for rank in range(1, len(results) + 1)]
+
+        raw = [r.relevance_score for r in results]
+        low, high = min(raw, default=0.0), max(raw, default=0.0)
+        if high == low:
+            return [1.0] * len(raw)
+        return [(score - low) / (high - low) for score in raw]
+
+    def fuse(
+        self,
+        lexical: list[SearchResult],
+        vector: list[SearchResult],
+        limit: int | None = None,
+    ) -> list[SearchResult]:
+        """Fuse lexical and vector results.
+
+        A scene found by both lists keeps its lexical result, which carries
+        the matched text. Each returned result's relevance score is set to
+        its fused score.
+
+        Args:
+            lexical: Lexical results, best first
+            vector: Vector results, best first
+            limit: Maximum number of fused results to return
+
+        Returns:
+            Fused results, best first
+        """
+        fused_scores: dict[int, float] = {}
+        fused_results: dict[int, SearchResult] = {}
+        for results, weight in (
+            (lexical, 1.0 - self.vector_weight),
+            (vector, self.vector_weight),
+        ):
+            # Only the best entry of a scene within one list counts
+            seen: set[int] = set()
+            unique = []
+            for result in results:
+                if result.scene_id not in seen:
+                    seen.add(result.scene_id)
+                    unique.append(result)
+
+            for result, score in zip(unique, self._scores(unique), strict=True):
+                fused_scores[result.scene_id] = (
+                    fused_scores.get(result.scene_id, 0.0) + weight * score
+                )
+                fused_results.setdefault(result.scene_id, result)
+
+        # Stable sort: ties keep lexical order, then vector order
+        ranked = sorted(fused_results, key=fused_scores.__getitem__, reverse=True)
+        if limit is not None:
+            ranked = ranked[:limit]
+
+        fused = []
+        for scene_id in ranked:
+            result = fused_results[scene_id]
+            result.relevance_score = fused_scores[scene_id]
+            fused.append(result)
+        return fused
+
+
 class BibleResultRanker:
     """Ranker for bible search results."""
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import struct
 
 import numpy as np
@@ -47,6 +48,135 @@ class SemanticSearchAdapter:
         """Clean up resources."""
         self._initialized = False
 
+    async def search_semantic(
+        self, query: SearchQuery, limit: int = 5
+    ) -> tuple[list[SearchResult], list[BibleSearchResult]]:
+        """Run the semantic search leg of a query.
+
+        The query is embedded once and the scene and bible similarity searches
+        then run concurrently. Errors propagate so that callers can decide how
+        to degrade.
+
+        Args:
+            query: Search query
+            limit: Maximum number of semantic results to add; twice as many
+                scene candidates are returned to allow for deduplication
+
+        Returns:
+            Tuple of (semantic scene results, semantic bible results)
+        """
+        # Extract query text for semantic search
+        query_text = query.dialogue or query.action or query.text_query or ""
+
+        if not query_text:
+            # No text to search with
+            return [], []
+
+        embedding_service = self.semantic_service.embedding_service
+        model = embedding_service.default_model
+        query_embedding = await embedding_service.generate_embedding(query_text, model)
+
+        scene_search = self.semantic_service.search_similar_scenes(
+            query=query_text,
+            script_id=None,  # Search across all scripts
+            top_k=limit * 2,  # Get more to allow for deduplication
+            threshold=self.settings.search_vector_similarity_threshold,
+            model=model,
+            query_embedding=query_embedding,
+        )
+        # Get semantic search results for bible content if needed
+        if query.include_bible or query.only_bible:
+            scene_search_results, bible_search_results = await asyncio.gather(
+                scene_search,
+                self.semantic_service.search_similar_bible_content(
+                    query=query_text,
+                    script_id=None,
+                    top_k=limit,
+                    threshold=self.settings.search_vector_similarity_threshold,
+                    model=model,
+                    query_embedding=query_embedding,
+                ),
+            )
+        else:
+            scene_search_results = await scene_search
+            bible_search_results = []
+
+        # Scene results arrive hydrated with script metadata from one batched
+        # lookup; fields stay at their defaults for scenes it did not cover
+        scene_results = []
+        for scene_result in scene_search_results:
+            scene_results.append(
+                SearchResult(
+                    script_id=scene_result.script_id,
+                    script_title=scene_result.script_title or "Unknown",
+                    script_author=scene_result.script_author,
+                    scene_id=scene_result.scene_id,
+                    scene_number=scene_result.scene_number or 0,
+                    scene_heading=scene_result.heading,
+                    scene_location=scene_result.location,
+                    scene_time=scene_result.time_of_day,
+                    scene_content=scene_result.content,
+                    season=scene_result.season,
+                    episode=scene_result.episode,
+                    match_type="semantic",
+                    relevance_score=scene_result.similarity_score,
+                )
+            )
+
+        bible_results = []
+        for br in bible_search_results:
+            # Convert to SearchEngine's BibleSearchResult format
+            bible_results.append(
+                BibleSearchResult(
+                    script_id=br.script_id,
+                    script_title=br.bible_title or "Unknown",  # Use bible_title
+                    bible_id=br.bible_id,
+                    bible_title=br.bible_title,
+                    chunk_id=br.chunk_id,
+                    chunk_heading=br.heading,  # br.heading, not br.chunk_heading
+                    chunk_level=br.level or 0,  # br.level, not br.chunk_level
+                    chunk_content=br.content,  # br.content, not br.chunk_content
+                    match_type="semantic",
+                    relevance_score=br.similarity_score,
+                )
+            )
+
+        return scene_results, bible_results
+
+    def merge_semantic_results(
+        self,
+        existing_results: list[SearchResult],
+        semantic_results: list[SearchResult],
+        limit: int = 5,
+    ) -> list[SearchResult]:
+        """Append semantic scene results not already found by SQL search.
+
+        Args:
+            existing_results: Results from SQL search
+            semantic_results: Results from :meth:`search_semantic`
+            limit: Maximum number of semantic results to add
+
+        Returns:
+            Existing results followed by up to ``limit`` new semantic results
+        """
+        # Create a set of existing scene IDs for deduplication
+        existing_scene_ids = {r.scene_id for r in existing_results}
+
+        # Add non-duplicate semantic results
+        added_count = 0
+        combined_results = list(existing_results)
+
+        for search_result in semantic_results:
+            if added_count >= limit:
+                break
+            if search_result.scene_id not in existing_scene_ids:
+                combined_results.append(search_result)
+                existing_scene_ids.add(search_result.scene_id)
+                added_count += 1
+
+        logger.info(f"Added {added_count} semantic scene results")
+        return combined_results
+
     async def enhance_results_with_semantic_search(
         self,
         query: SearchQuery,
@@ -66,87 +196,12 @@ class SemanticSearchAdapter:
         Returns:
             Tuple of (enhanced scene results, bible results)
         """
-        # Extract query text for semantic search
-        query_text = query.dialogue or query.action or query.text_query or ""
-
-        if not query_text:
-            # No text to search with
-            return existing_results, []
-
         try:
-            # Get semantic search results for scenes
-            scene_results = await self.semantic_service.search_similar_scenes(
-                query=query_text,
-                script_id=None,  # Search across all scripts
-                top_k=limit * 2,  # Get more to allow for deduplication
-                threshold=self.settings.search_vector_similarity_threshold,
-            )
-
-            # Get semantic search results for bible content if needed
-            bible_results = []
-            if query.include_bible or query.only_bible:
-                bible_search_results = (
-                    await self.semantic_service.search_similar_bible_content(
-                        query=query_text,
-                        script_id=None,
-                        top_k=limit,
-                        threshold=self.settings.search_vector_similarity_threshold,
-                    )
-                )
-
-                # Convert to SearchEngine's BibleSearchResult format
-                for br in bible_search_results:
-                    bible_result = BibleSearchResult(
-                        script_id=br.script_id,
-                        script_title=br.bible_title or "Unknown",  # Use bible_title
-                        bible_id=br.bible_id,
-                        bible_title=br.bible_title,
-                        chunk_id=br.chunk_id,
-                        chunk_heading=br.heading,  # br.heading, not br.chunk_heading
-                        chunk_level=br.level or 0,  # br.level, not br.chunk_level
-                        chunk_content=br.content,  # br.content, not br.chunk_content
-                        match_type="semantic",
-                        relevance_score=br.similarity_score,
-                    )
-                    bible_results.append(bible_result)
-
-            # Create a set of existing scene IDs for deduplication
-            existing_scene_ids = {r.scene_id for r in existing_results}
-
-            # Add non-duplicate semantic results
-            added_count = 0
-            combined_results = list(existing_results)
-
-            for scene_result in scene_results:
-                if scene_result.scene_id not in existing_scene_ids:
-                    # Convert to SearchEngine's SearchResult format
-                    # Note: semantic search results don't include script metadata
-                    # We'll need to fetch script info separately if needed
-                    search_result = SearchResult(
-                        script_id=scene_result.script_id,
-                        script_title="Unknown",  # Would need separate query to get this
-                        script_author="Unknown",  # Need separate query
-                        scene_id=scene_result.scene_id,
-                        scene_number=0,  # Not available in semantic result
-                        scene_heading=scene_result.heading,  # Use .heading
-                        scene_location=scene_result.location,  # Use .location
-                        scene_time=None,  # Not available in current semantic result
-                        scene_content=scene_result.content,  # Use .content
-                        season=None,  # Metadata not included in semantic result
-                        episode=None,  # Metadata not included in semantic result
-                        match_type="semantic",
-                        relevance_score=scene_result.similarity_score,
-                    )
-                    combined_results.append(search_result)
-                    existing_scene_ids.add(scene_result.scene_id)
-                    added_count += 1
-                    if added_count >= limit:
-                        break
-
-            logger.info(
-                f"Added {added_count} semantic scene results "
-                f"and {len(bible_results)} bible results"
+            scene_results, bible_results = await self.search_semantic(query, limit)
+            combined_results = self.merge_semantic_results(
+                existing_results, scene_results, limit
             )
+            logger.info(f"Added {len(bible_results)} semantic bible results")
             return combined_results, bible_results
 
         except Exception as e:
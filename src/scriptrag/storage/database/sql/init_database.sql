@@ -53,6 +53,15 @@ CREATE TABLE IF NOT EXISTS scenes (
 CREATE INDEX IF NOT EXISTS idx_scenes_script_id ON scenes (script_id);
 CREATE INDEX IF NOT EXISTS idx_scenes_location ON scenes (location);
 
+-- Scene reads table: latest read of each scene, written in batches
+-- (kept apart from scenes so reads never bump scenes.updated_at)
+CREATE TABLE IF NOT EXISTS scene_reads (
+    scene_id INTEGER PRIMARY KEY,
+    reader_id TEXT,
+    last_read_at TIMESTAMP NOT NULL,
+    FOREIGN KEY (scene_id) REFERENCES scenes (id) ON DELETE CASCADE
+);
+
 -- Characters table: stores character information
 CREATE TABLE IF NOT EXISTS characters (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -0,0 +1,234 @@
+"""Fixtures and baseline checks for the benchmark suite.
+
+Benchmarks only run when requested, e.g. ``make bench`` or
+``pytest tests/benchmarks --benchmark-only``. Each benchmark's median is
+compared with ``baseline.json``; a run slower than ``baseline * tolerance``
+fails. Set ``SCRIPTRAG_BENCHMARK_UPDATE=1`` (``make bench-baseline``) to
+rewrite the stored medians from the current run instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import shutil
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scriptrag.config import ScriptRAGSettings, set_settings
+from tests.benchmarks.corpus import MEDIUM, SMALL, hash_embedding, write_corpus
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:  # pragma: no cover - optional test dependency
+    collect_ignore_glob = ["test_*.py"]
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+UPDATE_ENV = "SCRIPTRAG_BENCHMARK_UPDATE"
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark benchmarks and skip them unless benchmarking was requested."""
+    requested = config.getoption("benchmark_only", False) or config.getoption(
+        "benchmark_enable", False
+    )
+    skip = pytest.mark.skip(reason="Benchmarks run with --benchmark-only")
+    bench_dir = Path(__file__).parent
+    for item in items:
+        if bench_dir not in Path(str(item.fspath)).parents:
+            continue
+        item.add_marker(pytest.mark.benchmark)
+        if not requested:
+            item.add_marker(skip)
+
+
+class Baseline:
+    """Stored benchmark medians with a regression tolerance."""
+
+    def __init__(self, path: Path) -> None:
+        """Load the baseline file.
+
+        Args:
+            path: Path to baseline.json
+        """
+        self.path = path
+        data = json.loads(path.read_text()) if path.exists() else {}
+        self.tolerance: float = data.get("tolerance", 2.0)
+        self.thresholds: dict[str, float] = data.get("thresholds", {})
+        self.medians: dict[str, float] = data.get("medians", {})
+        self.updating = os.environ.get(UPDATE_ENV) == "1"
+        self._recorded: dict[str, float] = {}
+
+    def check(self, name: str, median: float) -> None:
+        """Fail if a benchmark median regressed beyond its threshold.
+
+        Args:
+            name: Benchmark test id
+            median: Median run time in seconds
+        """
+        if self.updating:
+            self._recorded[name] = median
+            return
+
+        expected = self.medians.get(name)
+        if expected is None:
+            pytest.fail(f"No baseline for {name}; run `make bench-baseline`")
+        limit = expected * self.thresholds.get(name, self.tolerance)
+        assert median <= limit, (
+            f"{name} regressed: median {median * 1000:.2f}ms exceeds "
+            f"{limit * 1000:.2f}ms (baseline {expected * 1000:.2f}ms)"
+        )
+
+    def save(self) -> None:
+        """Write recorded medians back to the baseline file."""
+        if not self.updating or not self._recorded:
+            return
+        medians = {**self.medians, **self._recorded}
+        data = {
+            "tolerance": self.tolerance,
+            "thresholds": self.thresholds,
+            "medians": {name: round(medians[name], 6) for name in sorted(medians)},
+        }
+        self.path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+@pytest.fixture(scope="session")
+def baseline() -> Any:
+    """Session-wide baseline, saved at the end when updating."""
+    stored = Baseline(BASELINE_PATH)
+    yield stored
+    stored.save()
+
+
+@pytest.fixture
+def assert_within_baseline(request, baseline) -> Callable[[Any], None]:
+    """Compare a finished benchmark against the stored baseline."""
+
+    def check(benchmark: Any) -> None:
+        if benchmark.disabled or benchmark.stats is None:
+            return
+        baseline.check(request.node.name, benchmark.stats.stats.median)
+
+    return check
+
+
+@pytest.fixture(scope="session")
+def small_corpus(tmp_path_factory) -> Path:
+    """Small standalone corpus."""
+    root = tmp_path_factory.mktemp("small_corpus")
+    write_corpus(root, SMALL)
+    return root
+
+
+@pytest.fixture(scope="session")
+def medium_corpus(tmp_path_factory) -> Path:
+    """Medium series corpus with boneyard metadata."""
+    root = tmp_path_factory.mktemp("medium_corpus")
+    write_corpus(root, MEDIUM)
+    return root
+
+
+def make_settings(db_path: Path) -> ScriptRAGSettings:
+    """Settings for benchmark databases with result caching disabled."""
+    return ScriptRAGSettings(
+        database_path=db_path,
+        result_cache_size=0,
+        skip_boneyard_filter=True,
+        search_vector_similarity_threshold=0.1,
+    )
+
+
+def initialize_database(settings: ScriptRAGSettings) -> None:
+    """Create an empty database for the given settings."""
+    from scriptrag.api import DatabaseInitializer
+    from scriptrag.database.connection_manager import close_connection_manager
+
+    DatabaseInitializer().initialize_database(
+        db_path=settings.database_path, force=True, settings=settings
+    )
+    close_connection_manager(force=True)
+
+
+@pytest.fixture(scope="session")
+def indexed_db(tmp_path_factory, medium_corpus) -> Path:
+    """Database with the medium corpus indexed and scene embeddings stored."""
+    from scriptrag.api import IndexCommand
+    from scriptrag.database.connection_manager import close_connection_manager
+    from scriptrag.embeddings.vector_store import BinaryEmbeddingSerializer
+
+    db_path = tmp_path_factory.mktemp("indexed") / "bench.db"
+    settings = make_settings(db_path)
+    initialize_database(settings)
+    asyncio.run(IndexCommand(settings=settings).index(medium_corpus))
+    close_connection_manager(force=True)
+
+    serializer = BinaryEmbeddingSerializer()
+    conn = sqlite3.connect(db_path)
+    scenes = conn.execute("SELECT id, content FROM scenes").fetchall()
+    conn.executemany(
+        "INSERT INTO embeddings (entity_type, entity_id, embedding_model, embedding) "
+        "VALUES ('scene', ?, ?, ?)",
+        [
+            (scene_id, EMBEDDING_MODEL, serializer.encode(hash_embedding(content)))
+            for scene_id, content in scenes
+        ],
+    )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def write_embedded_scenes(
+    db_path: Path, vectors: Any, serializer: Any | None = None
+) -> None:
+    """Create a database with one scene per vector and its stored embedding."""
+    from scriptrag.database.connection_manager import close_connection_manager
+    from scriptrag.embeddings.vector_store import BinaryEmbeddingSerializer
+
+    serializer = serializer or BinaryEmbeddingSerializer()
+    initialize_database(make_settings(db_path))
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO scripts (id, title, file_path) VALUES (1, 'Bench', 'bench')"
+    )
+    conn.executemany(
+        "INSERT INTO scenes (id, script_id, scene_number, heading, content) "
+        "VALUES (?, 1, ?, ?, ?)",
+        [
+            (i, i, f"INT. ROOM {i} - DAY", f"Scene {i}")
+            for i in range(1, len(vectors) + 1)
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO embeddings (entity_type, entity_id, embedding_model, embedding) "
+        "VALUES ('scene', ?, ?, ?)",
+        [
+            (i, EMBEDDING_MODEL, serializer.encode(vector.tolist()))
+            for i, vector in enumerate(vectors, start=1)
+        ],
+    )
+    conn.commit()
+    conn.close()
+    close_connection_manager(force=True)
+
+
+@pytest.fixture
+def indexed_settings(indexed_db) -> ScriptRAGSettings:
+    """Settings pointing at the shared indexed database."""
+    settings = make_settings(indexed_db)
+    set_settings(settings)
+    return settings
+
+
+@pytest.fixture
+def corpus_copy(tmp_path, medium_corpus) -> Path:
+    """Writable copy of the medium corpus."""
+    target = tmp_path / "corpus"
+    shutil.copytree(medium_corpus, target)
+    return target
@@ -0,0 +1,224 @@
+"""Synthetic Fountain corpora for benchmarks.
+
+Scripts are generated deterministically from a seed so that runs on the same
+machine are comparable and stored baselines stay meaningful.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+LOCATIONS = [
+    "COFFEE SHOP",
+    "OFFICE",
+    "APARTMENT",
+    "PARKING GARAGE",
+    "ROOFTOP",
+    "HOSPITAL CORRIDOR",
+    "DINER",
+    "TRAIN STATION",
+    "POLICE PRECINCT",
+    "BEACH",
+]
+TIMES = ["DAY", "NIGHT", "MORNING", "EVENING", "CONTINUOUS"]
+FIRST_NAMES = [
+    "SARAH",
+    "JAMES",
+    "ELENA",
+    "MARCUS",
+    "PRIYA",
+    "TOMAS",
+    "GRACE",
+    "VIKTOR",
+    "NAOMI",
+    "OWEN",
+    "LUCIA",
+    "DEV",
+]
+WORDS = [
+    "coffee",
+    "rain",
+    "signal",
+    "window",
+    "letter",
+    "secret",
+    "train",
+    "engine",
+    "shadow",
+    "promise",
+    "river",
+    "ledger",
+    "camera",
+    "siren",
+    "garden",
+    "mirror",
+    "ticket",
+    "badge",
+    "lantern",
+    "storm",
+    "echo",
+    "harbor",
+    "candle",
+    "static",
+    "whisper",
+    "compass",
+    "glass",
+    "orbit",
+    "velvet",
+    "ember",
+]
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Shape of a synthetic screenplay corpus."""
+
+    scripts: int = 1
+    scenes_per_script: int = 20
+    characters: int = 6
+    dialogue_per_scene: int = 6  # Dialogue blocks per scene
+    action_per_scene: int = 2  # Action paragraphs per scene
+    words_per_line: int = 12
+    boneyard: bool = True  # Embed SCRIPTRAG-META boneyard blocks
+    seasons: int = 0  # 0 produces standalone scripts, otherwise a series
+    seed: int = 1234
+
+    @property
+    def total_scenes(self) -> int:
+        """Total number of scenes in the corpus."""
+        return self.scripts * self.scenes_per_script
+
+
+SMALL = CorpusSpec(scripts=2, scenes_per_script=15)
+MEDIUM = CorpusSpec(scripts=6, scenes_per_script=40, characters=10, seasons=2)
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    """Build a sentence from the shared vocabulary."""
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _boneyard(rng: random.Random) -> str:
+    """Build a boneyard metadata block like the one analyze writes."""
+    metadata = {
+        "content_hash": f"{rng.getrandbits(64):016x}",
+        "analyzed_at": "2025-01-01T00:00:00",
+        "analyzers": {"benchmark": {"version": "1.0.0", "result": {"ok": True}}},
+    }
+    return (
+        "/* SCRIPTRAG-META-START\n"
+        f"{json.dumps(metadata, indent=2)}\n"
+        "SCRIPTRAG-META-END */"
+    )
+
+
+def generate_script(spec: CorpusSpec, index: int) -> str:
+    """Generate the Fountain source for one script of the corpus.
+
+    Args:
+        spec: Corpus shape
+        index: Script index within the corpus
+
+    Returns:
+        Fountain text
+    """
+    rng = random.Random(spec.seed * 7919 + index)  # noqa: S311
+    cast = FIRST_NAMES[: max(1, min(spec.characters, len(FIRST_NAMES)))]
+
+    title = [f"Title: Benchmark Story {index + 1}", "Author: Bench Writer"]
+    if spec.seasons:
+        episodes_per_season = math.ceil(spec.scripts / spec.seasons)
+        title.append(f"Season: {index // episodes_per_season + 1}")
+        title.append(f"Episode: {index % episodes_per_season + 1}")
+    lines = [*title, "", "FADE IN:", ""]
+
+    for scene_number in range(1, spec.scenes_per_script + 1):
+        interior = "INT." if rng.random() < 0.6 else "EXT."
+        location = rng.choice(LOCATIONS)
+        lines.append(f"{interior} {location} - {rng.choice(TIMES)}")
+        lines.append("")
+        for _ in range(spec.action_per_scene):
+            lines.extend([_sentence(rng, spec.words_per_line), ""])
+        for _ in range(spec.dialogue_per_scene):
+            lines.append(rng.choice(cast))
+            if rng.random() < 0.2:
+                lines.append("(quietly)")
+            lines.extend([_sentence(rng, spec.words_per_line), ""])
+        if spec.boneyard:
+            lines.extend([_boneyard(rng), ""])
+        if scene_number % 10 == 0:
+            lines.extend(["CUT TO:", ""])
+
+    lines.append("FADE OUT.")
+    return "\n".join(lines) + "\n"
+
+
+def write_corpus(root: Path, spec: CorpusSpec) -> list[Path]:
+    """Write a synthetic corpus to disk.
+
+    Args:
+        root: Directory to write into (created if missing)
+        spec: Corpus shape
+
+    Returns:
+        Paths of the generated Fountain files
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index in range(spec.scripts):
+        path = root / f"story_{index + 1:03d}.fountain"
+        path.write_text(generate_script(spec, index), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def hash_embedding(text: str, dimensions: int = 64) -> list[float]:
+    """Deterministic bag-of-words embedding used instead of an LLM provider.
+
+    Texts sharing vocabulary get similar vectors, so semantic search returns
+    plausible matches without any network access.
+
+    Args:
+        text: Text to embed
+        dimensions: Vector size
+
+    Returns:
+        L2-normalised embedding
+    """
+    vector = [0.0] * dimensions
+    for token in text.lower().split():
+        bucket = zlib.crc32(token.strip(".,!?()").encode()) % dimensions
+        vector[bucket] += 1.0
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector]
+
+
+def clustered_embeddings(
+    count: int, dimensions: int = 128, clusters: int = 200, seed: int = 1
+) -> np.ndarray:
+    """Embeddings scattered around shared topic centres.
+
+    Real scene embeddings cluster by topic; the centres are fixed so that
+    vectors drawn with different seeds (e.g. scenes and queries) share them.
+
+    Args:
+        count: Number of vectors
+        dimensions: Vector size
+        clusters: Number of topic centres
+        seed: Seed for cluster membership and noise
+
+    Returns:
+        Array of shape (count, dimensions)
+    """
+    rng = np.random.default_rng(seed)
+    centres = np.random.default_rng(0).normal(size=(clusters, dimensions))
+    labels = rng.integers(0, clusters, size=count)
+    return centres[labels] + 0.5 * rng.normal(size=(count, dimensions))
@@ -0,0 +1,88 @@
+"""Recall and latency of the IVF index against exact semantic search."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from scriptrag.api.semantic_search import SemanticSearchService
+from scriptrag.config import ScriptRAGSettings
+from tests.benchmarks.conftest import (
+    EMBEDDING_MODEL,
+    make_settings,
+    write_embedded_scenes,
+)
+from tests.benchmarks.corpus import clustered_embeddings
+
+SCENES = 20000
+TOP_K = 10
+QUERIES = 20
+
+
+@pytest.fixture(scope="module")
+def ann_db(tmp_path_factory) -> Path:
+    """Database with many embedded scenes and a synced ANN index."""
+    db_path = tmp_path_factory.mktemp("ann") / "bench.db"
+    write_embedded_scenes(db_path, clustered_embeddings(SCENES))
+
+    service = SemanticSearchService(_settings(db_path, ann=True))
+    assert service.ann_store is not None
+    conn = sqlite3.connect(db_path)
+    assert service.ann_store.sync(conn, "scene", EMBEDDING_MODEL) is not None
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def _settings(db_path: Path, ann: bool) -> ScriptRAGSettings:
+    return make_settings(db_path).model_copy(
+        update={"search_ann_enabled": ann, "search_ann_min_vectors": 1000}
+    )
+
+
+def search_ids(service: SemanticSearchService, query: list[float]) -> list[int]:
+    """Top scene IDs for a precomputed query embedding."""
+    results = asyncio.run(
+        service.search_similar_scenes(
+            "query", top_k=TOP_K, threshold=0.0, query_embedding=query
+        )
+    )
+    return [result.scene_id for result in results]
+
+
+@pytest.fixture(scope="module")
+def queries() -> list[list[float]]:
+    """Query embeddings drawn from the same topics as the scenes."""
+    return [vector.tolist() for vector in clustered_embeddings(QUERIES, seed=2)]
+
+
+def test_semantic_exact(benchmark, assert_within_baseline, ann_db, queries):
+    """Exact search over every stored scene embedding."""
+    service = SemanticSearchService(_settings(ann_db, ann=False))
+
+    found = benchmark.pedantic(search_ids, args=(service, queries[0]), rounds=5)
+
+    assert len(found) == TOP_K
+    assert_within_baseline(benchmark)
+
+
+def test_semantic_ann(benchmark, assert_within_baseline, ann_db, queries):
+    """IVF candidates rescored exactly, with recall@10 against exact search."""
+    exact = SemanticSearchService(_settings(ann_db, ann=False))
+    service = SemanticSearchService(_settings(ann_db, ann=True))
+
+    recall = np.mean(
+        [
+            len(set(search_ids(service, q)) & set(search_ids(exact, q))) / TOP_K
+            for q in queries
+        ]
+    )
+    found = benchmark.pedantic(search_ids, args=(service, queries[0]), rounds=20)
+
+    assert len(found) == TOP_K
+    assert recall >= 0.9, f"recall@{TOP_K} {recall:.2f}"
+    assert_within_baseline(benchmark)
@@ -0,0 +1,90 @@
+"""Benchmarks for parsing and listing Fountain files."""
+
+from __future__ import annotations
+
+from itertools import pairwise
+
+from scriptrag.api.list import ScriptLister
+from scriptrag.parser import FountainParser
+from tests.benchmarks.corpus import CorpusSpec, write_corpus
+
+# One long script whose scene headings repeat many times
+LONG_SCRIPT = CorpusSpec(scenes_per_script=1000, dialogue_per_scene=3)
+
+
+def test_parse_file_small(benchmark, assert_within_baseline, small_corpus):
+    """Parse one short standalone script."""
+    path = sorted(small_corpus.glob("*.fountain"))[0]
+    parser = FountainParser()
+
+    script = benchmark(parser.parse_file, path)
+
+    assert len(script.scenes) == 15
+    assert_within_baseline(benchmark)
+
+
+def test_parse_file_medium(benchmark, assert_within_baseline, medium_corpus):
+    """Parse one episode with boneyard metadata on every scene."""
+    path = sorted(medium_corpus.glob("*.fountain"))[0]
+    parser = FountainParser()
+
+    script = benchmark(parser.parse_file, path)
+
+    assert len(script.scenes) == 40
+    assert script.metadata["season"] == 1
+    assert_within_baseline(benchmark)
+
+
+def test_parse_file_long(benchmark, assert_within_baseline, tmp_path):
+    """Parse a 1000-scene script; each scene maps to its own source span."""
+    (path,) = write_corpus(tmp_path, LONG_SCRIPT)
+    parser = FountainParser()
+
+    script = benchmark(parser.parse_file, path)
+
+    content = path.read_text(encoding="utf-8")
+    spans = [scene.span for scene in script.scenes]
+    assert len(script.scenes) == LONG_SCRIPT.scenes_per_script
+    assert all(span is not None for span in spans)
+    assert all(a.end < b.start for a, b in pairwise(spans))
+    assert all(
+        content[scene.span.start : scene.span.end] == scene.original_text
+        and scene.original_text.startswith(scene.heading)
+        for scene in script.scenes
+    )
+    assert_within_baseline(benchmark)
+
+
+def test_write_back_long(benchmark, assert_within_baseline, tmp_path):
+    """Write new boneyard metadata into every scene of a 1000-scene script."""
+    (path,) = write_corpus(tmp_path, LONG_SCRIPT)
+    original = path.read_text(encoding="utf-8")
+    parser = FountainParser()
+    script = parser.parse_file(path)
+    for scene in script.scenes:
+        scene.update_boneyard({"analyzed": True, "scene": scene.number})
+
+    def restore():
+        path.write_text(original, encoding="utf-8")
+        return (path, script, script.scenes), {}
+
+    benchmark.pedantic(parser.write_with_updated_scenes, setup=restore, rounds=10)
+
+    rewritten = parser.parse_file(path)
+    assert all(
+        after.boneyard_metadata == before.boneyard_metadata
+        and after.boneyard_metadata["scene"] == after.number
+        for before, after in zip(script.scenes, rewritten.scenes, strict=True)
+    )
+    assert_within_baseline(benchmark)
+
+
+def test_list_scripts(benchmark, assert_within_baseline, medium_corpus):
+    """Discover and read title pages of a series corpus."""
+    lister = ScriptLister()
+
+    scripts = benchmark(lister.list_scripts, medium_corpus)
+
+    assert len(scripts) == 6
+    assert all(script.has_boneyard for script in scripts)
+    assert_within_baseline(benchmark)
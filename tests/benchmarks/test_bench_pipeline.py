@@ -0,0 +1,66 @@
+"""Benchmarks for the index and analyze pipelines."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from scriptrag.analyzers.base import BaseSceneAnalyzer
+from scriptrag.api import AnalyzeCommand, IndexCommand
+from tests.benchmarks.conftest import initialize_database, make_settings
+from tests.benchmarks.corpus import MEDIUM
+
+
+class WordCountAnalyzer(BaseSceneAnalyzer):
+    """Cheap analyzer so the benchmark measures the pipeline, not the model."""
+
+    name = "bench_word_count"
+
+    async def analyze(self, scene: dict[str, Any]) -> dict[str, Any]:
+        """Count words and speaking characters."""
+        return {
+            "words": len(scene["content"].split()),
+            "speakers": sorted(scene["characters"]),
+        }
+
+
+class HeadingAnalyzer(BaseSceneAnalyzer):
+    """Second stub analyzer to exercise multi-analyzer metadata merging."""
+
+    name = "bench_heading"
+
+    async def analyze(self, scene: dict[str, Any]) -> dict[str, Any]:
+        """Split the scene heading."""
+        return {"heading": scene["heading"].split(" - ")}
+
+
+def test_index_corpus(benchmark, assert_within_baseline, tmp_path, medium_corpus):
+    """Index the medium corpus into a fresh database."""
+    settings = make_settings(tmp_path / "index.db")
+
+    def setup() -> tuple[tuple[Any, ...], dict[str, Any]]:
+        initialize_database(settings)
+        return (IndexCommand(settings=settings),), {}
+
+    def run(command: IndexCommand) -> Any:
+        return asyncio.run(command.index(medium_corpus))
+
+    result = benchmark.pedantic(run, setup=setup, rounds=3, iterations=1)
+
+    assert not result.errors
+    assert result.total_scenes_indexed == MEDIUM.total_scenes
+    assert_within_baseline(benchmark)
+
+
+def test_analyze_corpus(benchmark, assert_within_baseline, corpus_copy):
+    """Run stub analyzers over every scene and write metadata back."""
+    command = AnalyzeCommand(analyzers=[WordCountAnalyzer(), HeadingAnalyzer()])
+
+    def run() -> Any:
+        return asyncio.run(command.analyze(corpus_copy, force=True))
+
+    result = benchmark.pedantic(run, rounds=3, iterations=1)
+
+    assert not result.errors
+    assert result.total_scenes_updated == MEDIUM.total_scenes
+    assert_within_baseline(benchmark)
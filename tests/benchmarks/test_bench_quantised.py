@@ -0,0 +1,62 @@
+"""Latency and recall of semantic search over int8-quantised embeddings."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from scriptrag.api.semantic_search import SemanticSearchService
+from scriptrag.embeddings.vector_store import BinaryEmbeddingSerializer
+from tests.benchmarks.conftest import make_settings, write_embedded_scenes
+from tests.benchmarks.corpus import clustered_embeddings
+from tests.benchmarks.test_bench_ann import QUERIES, SCENES, TOP_K, search_ids
+
+
+@pytest.fixture(scope="module")
+def vectors() -> np.ndarray:
+    """Full-precision scene embeddings."""
+    return clustered_embeddings(SCENES)
+
+
+@pytest.fixture(scope="module")
+def int8_db(tmp_path_factory, vectors) -> Path:
+    """Database storing the scene embeddings as int8 codes."""
+    db_path = tmp_path_factory.mktemp("int8") / "bench.db"
+    write_embedded_scenes(db_path, vectors, BinaryEmbeddingSerializer("int8"))
+    return db_path
+
+
+def test_semantic_int8(benchmark, assert_within_baseline, int8_db, vectors):
+    """Approximate int8 scoring with exact rescoring of the shortlist."""
+    settings = make_settings(int8_db).model_copy(
+        update={"embedding_storage_precision": "int8"}
+    )
+    service = SemanticSearchService(settings)
+    queries = clustered_embeddings(QUERIES, seed=2)
+
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    recall = np.mean(
+        [
+            len(
+                set(search_ids(service, q.tolist()))
+                & {int(i) + 1 for i in np.argsort(-(unit @ q))[:TOP_K]}
+            )
+            / TOP_K
+            for q in queries
+        ]
+    )
+    found = benchmark.pedantic(
+        search_ids, args=(service, queries[0].tolist()), rounds=5
+    )
+
+    conn = sqlite3.connect(int8_db)
+    (size,) = conn.execute("SELECT MAX(LENGTH(embedding)) FROM embeddings").fetchone()
+    conn.close()
+
+    assert len(found) == TOP_K
+    assert size == 8 + vectors.shape[1]
+    assert recall >= 0.95, f"recall@{TOP_K} {recall:.2f}"
+    assert_within_baseline(benchmark)
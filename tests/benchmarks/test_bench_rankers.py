@@ -0,0 +1,69 @@
+"""Micro-benchmarks for the text rankers over long scenes."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from scriptrag.search.models import SearchQuery, SearchResult
+from scriptrag.search.rankers import HybridRanker, ProximityRanker, tokenize_text
+from tests.benchmarks.corpus import WORDS
+
+SCENES = 50
+WORDS_PER_SCENE = 3000
+
+
+@pytest.fixture(scope="module")
+def long_scenes() -> list[str]:
+    """Long scene texts drawn from the shared benchmark vocabulary."""
+    rng = random.Random(4321)  # noqa: S311 - deterministic benchmark data
+    return [
+        " ".join(rng.choice(WORDS) for _ in range(WORDS_PER_SCENE))
+        for _ in range(SCENES)
+    ]
+
+
+def _results(scenes: list[str]) -> list[SearchResult]:
+    return [
+        SearchResult(
+            script_id=1,
+            script_title="Bench",
+            script_author=None,
+            scene_id=index,
+            scene_number=index,
+            scene_heading=f"INT. OFFICE {index} - DAY",
+            scene_location=f"OFFICE {index}",
+            scene_time="DAY",
+            scene_content=content,
+        )
+        for index, content in enumerate(scenes)
+    ]
+
+
+def test_rank_long_scenes(benchmark, assert_within_baseline, long_scenes):
+    """Hybrid ranking of long scenes, tokenising each scene from scratch."""
+    ranker = HybridRanker()
+    query = SearchQuery(
+        raw_query="coffee signal storm", text_query="coffee signal storm"
+    )
+
+    def setup():
+        tokenize_text.cache_clear()
+        return (_results(long_scenes), query), {}
+
+    ranked = benchmark.pedantic(ranker.rank, setup=setup, rounds=20)
+
+    assert len(ranked) == SCENES
+    assert_within_baseline(benchmark)
+
+
+def test_proximity_long_scene(benchmark, assert_within_baseline, long_scenes):
+    """Minimum-window proximity of frequent terms in one long scene."""
+    ranker = ProximityRanker()
+    terms = ["coffee", "signal", "storm", "ember"]
+
+    score = benchmark(ranker.calculate_proximity_score, long_scenes[0], terms)
+
+    assert 0.0 < score <= 1.0
+    assert_within_baseline(benchmark)
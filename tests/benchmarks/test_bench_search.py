@@ -0,0 +1,79 @@
+"""Benchmarks for search and query execution against an indexed corpus."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import scriptrag
+from scriptrag.query.engine import QueryEngine
+from scriptrag.query.spec import HeaderParser
+from scriptrag.search.engine import SearchEngine
+from scriptrag.search.models import SearchMode, SearchQuery
+from tests.benchmarks.corpus import hash_embedding
+
+QUERY_DIR = Path(scriptrag.__file__).parent / "storage" / "database" / "queries"
+
+
+@pytest.fixture
+def search_engine(indexed_settings, monkeypatch) -> SearchEngine:
+    """Search engine whose query embeddings come from the hash embedder."""
+    engine = SearchEngine(indexed_settings)
+    service = engine.semantic_adapter.semantic_service.embedding_service
+
+    async def generate_embedding(text: str, model: str | None = None) -> list[float]:
+        return hash_embedding(text)
+
+    monkeypatch.setattr(service, "generate_embedding", generate_embedding)
+    return engine
+
+
+def test_search_text(benchmark, assert_within_baseline, search_engine):
+    """Full-text search over scene content."""
+    query = SearchQuery(raw_query="coffee", text_query="coffee", limit=10)
+
+    response = benchmark(search_engine.search, query)
+
+    assert response.results
+    assert_within_baseline(benchmark)
+
+
+def test_search_character(benchmark, assert_within_baseline, search_engine):
+    """Character-filtered search."""
+    query = SearchQuery(raw_query="SARAH", characters=["SARAH"], limit=10)
+
+    response = benchmark(search_engine.search, query)
+
+    assert response.results
+    assert_within_baseline(benchmark)
+
+
+def test_search_semantic(benchmark, assert_within_baseline, search_engine):
+    """SQL search enhanced with semantic matches from stored embeddings."""
+    query = SearchQuery(
+        raw_query="storm over the harbor lantern",
+        text_query="storm over the harbor lantern",
+        mode=SearchMode.FUZZY,
+        limit=10,
+    )
+
+    response = benchmark(search_engine.search, query)
+
+    assert "semantic" in response.search_methods
+    assert any(result.match_type == "semantic" for result in response.results)
+    assert_within_baseline(benchmark)
+
+
+def test_query_execute(benchmark, assert_within_baseline, indexed_settings):
+    """Execute a query from the bundled query library."""
+    path = QUERY_DIR / "character_stats.sql"
+    spec = HeaderParser.parse(path.read_text(), path)
+    engine = QueryEngine()
+
+    params = {"project": "Benchmark", "min_lines": 1, "limit": 20}
+
+    rows, _ = benchmark(engine.execute, spec, params)
+
+    assert rows
+    assert_within_baseline(benchmark)
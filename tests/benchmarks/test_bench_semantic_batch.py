@@ -0,0 +1,74 @@
+"""Latency of multi-query semantic search against one search per query."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from scriptrag.api.semantic_search import SceneSearchResult, SemanticSearchService
+from tests.benchmarks.conftest import make_settings, write_embedded_scenes
+from tests.benchmarks.corpus import clustered_embeddings
+from tests.benchmarks.test_bench_ann import QUERIES, SCENES, TOP_K
+
+
+@pytest.fixture(scope="module")
+def batch_db(tmp_path_factory) -> Path:
+    """Database with many embedded scenes."""
+    db_path = tmp_path_factory.mktemp("batch") / "bench.db"
+    write_embedded_scenes(db_path, clustered_embeddings(SCENES))
+    return db_path
+
+
+@pytest.fixture(scope="module")
+def queries() -> list[list[float]]:
+    """Query embeddings drawn from the same topics as the scenes."""
+    return [vector.tolist() for vector in clustered_embeddings(QUERIES, seed=2)]
+
+
+def _search_batch(
+    service: SemanticSearchService, queries: list[list[float]]
+) -> list[list[SceneSearchResult]]:
+    return asyncio.run(
+        service.search_similar_scenes_batch(
+            ["query"] * len(queries),
+            top_k=TOP_K,
+            threshold=0.0,
+            query_embeddings=queries,
+        )
+    )
+
+
+def _search_each(
+    service: SemanticSearchService, queries: list[list[float]]
+) -> list[list[SceneSearchResult]]:
+    async def run() -> list[list[SceneSearchResult]]:
+        return [
+            await service.search_similar_scenes(
+                "query", top_k=TOP_K, threshold=0.0, query_embedding=query
+            )
+            for query in queries
+        ]
+
+    return asyncio.run(run())
+
+
+def test_semantic_batch(benchmark, assert_within_baseline, batch_db, queries):
+    """Twenty queries scored together, with the same results as one by one."""
+    service = SemanticSearchService(make_settings(batch_db))
+
+    found = benchmark.pedantic(_search_batch, args=(service, queries), rounds=5)
+
+    assert found == _search_each(service, queries)
+    assert_within_baseline(benchmark)
+
+
+def test_semantic_per_query(benchmark, assert_within_baseline, batch_db, queries):
+    """The same twenty queries searched one at a time."""
+    service = SemanticSearchService(make_settings(batch_db))
+
+    found = benchmark.pedantic(_search_each, args=(service, queries), rounds=3)
+
+    assert [len(results) for results in found] == [TOP_K] * QUERIES
+    assert_within_baseline(benchmark)
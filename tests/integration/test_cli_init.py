@@ -68,6 +68,7 @@ class TestInitCommand:
             "embeddings",
             "scene_embeddings",
             "scene_graph_edges",
+            "scene_reads",
             "scenes",
             "schema_version",
             "script_bibles",
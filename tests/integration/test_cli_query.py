@@ -379,8 +379,8 @@ ORDER BY d.id""")
     ):
         """Test behavior when custom query directory is empty.
 
-        Note: The current design shows built-in queries even when a custom directory
-        is empty. This ensures users always have access to essential queries.
+        The query subapp is built when it is first invoked, so an explicitly
+        configured query directory is honored even when it is empty.
         """
         empty_dir = tmp_path / "empty_queries"
         empty_dir.mkdir()
@@ -392,6 +392,4 @@ ORDER BY d.id""")
         output = strip_ansi_codes(result.output)
 
         assert result.exit_code == 0
-        # Current behavior: built-in queries are always available to ensure
-        # users have access to essential functionality
-        assert "Available queries:" in output
+        assert "No queries available" in output
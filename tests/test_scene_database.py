@@ -2,13 +2,13 @@
 
 import hashlib
 import sqlite3
-from datetime import datetime
+from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from scriptrag.api.scene_database import SceneDatabaseOperations
-from scriptrag.api.scene_models import SceneIdentifier
+from scriptrag.api.scene_models import SceneIdentifier, SceneRead
 from scriptrag.parser import Scene
 
 
@@ -387,31 +387,56 @@ class TestSceneDatabaseOperations:
         query = call_args[0]
         assert "ORDER BY scene_number" in query
 
-    def test_update_last_read(self, db_ops, mock_conn):
-        """Test updating last read timestamp."""
-        scene_id = SceneIdentifier("test_project", 5)
-        timestamp = datetime.utcnow()
-
-        db_ops.update_last_read(mock_conn, scene_id, timestamp)
-
-        call_args = mock_conn.execute.call_args[0]
-        query = call_args[0]
-        params = call_args[1]
-        assert "UPDATE scenes" in query
-        assert "last_read_at = ?" in query
-        assert timestamp.isoformat() in params
+    @pytest.fixture
+    def scenes_conn(self):
+        """Create an in-memory database with one scene."""
+        conn = sqlite3.connect(":memory:")
+        conn.executescript(
+            """
+            CREATE TABLE scripts (id INTEGER PRIMARY KEY, title TEXT,
+                                  metadata JSON);
+            CREATE TABLE scenes (id INTEGER PRIMARY KEY, script_id INTEGER,
+                                 scene_number INTEGER, updated_at TIMESTAMP);
+            INSERT INTO scripts VALUES (1, 'test_project', NULL);
+            INSERT INTO scripts VALUES (2, 'test_show',
+                                        '{"season": 1, "episode": 2}');
+            INSERT INTO scenes VALUES (10, 1, 5, '2024-01-01 12:00:00');
+            INSERT INTO scenes VALUES (20, 2, 5, '2024-01-01 12:00:00');
+            """
+        )
+        yield conn
+        conn.close()
 
-    def test_update_last_read_with_season_episode(self, db_ops, mock_conn):
-        """Test updating last read with season/episode."""
-        scene_id = SceneIdentifier("test_show", 5, season=1, episode=2)
-        timestamp = datetime.utcnow()
+    def test_record_reads(self, db_ops, scenes_conn):
+        """Test recording reads keeps the newest read per scene."""
+        scene_id = SceneIdentifier("test_project", 5)
+        newer = datetime(2024, 1, 2, 12, 0, tzinfo=UTC)
+        older = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+
+        db_ops.record_reads(scenes_conn, [SceneRead(scene_id, "agent-a", newer)])
+        db_ops.record_reads(scenes_conn, [SceneRead(scene_id, "agent-b", older)])
+
+        rows = scenes_conn.execute(
+            "SELECT scene_id, reader_id, last_read_at FROM scene_reads"
+        ).fetchall()
+        assert rows == [(10, "agent-a", newer.isoformat())]
+        updated_at = scenes_conn.execute(
+            "SELECT updated_at FROM scenes WHERE id = 10"
+        ).fetchone()[0]
+        assert updated_at == "2024-01-01 12:00:00"
+
+    def test_record_reads_with_season_episode(self, db_ops, scenes_conn):
+        """Test recording reads matches season/episode."""
+        read_at = datetime(2024, 1, 2, 12, 0, tzinfo=UTC)
+        reads = [
+            SceneRead(SceneIdentifier("test_show", 5, 1, 2), "agent", read_at),
+            SceneRead(SceneIdentifier("test_show", 5, 1, 3), "agent", read_at),
+        ]
 
-        db_ops.update_last_read(mock_conn, scene_id, timestamp)
+        db_ops.record_reads(scenes_conn, reads)
 
-        call_args = mock_conn.execute.call_args[0]
-        params = call_args[1]
-        assert 1 in params  # season
-        assert 2 in params  # episode
+        rows = scenes_conn.execute("SELECT scene_id FROM scene_reads").fetchall()
+        assert rows == [(20,)]
 
     def test_get_last_modified_success(self, db_ops, mock_conn):
         """Test getting last modified timestamp."""
@@ -157,7 +157,7 @@ class TestSceneManagementAPI:
 
         with (
             patch.object(api.scene_db, "get_scene_by_id", return_value=mock_scene),
-            patch.object(api.scene_db, "update_last_read"),
+            patch.object(api.read_tracker, "record", return_value=False) as record,
         ):
             result = await api.read_scene(scene_id, "test_reader")
 
@@ -165,6 +165,7 @@ class TestSceneManagementAPI:
         assert result.error is None
         assert result.scene == mock_scene
         assert result.last_read is not None
+        record.assert_called_once_with(scene_id, "test_reader", result.last_read)
 
     @pytest.mark.asyncio
     async def test_read_scene_not_found(self, api):
@@ -252,10 +253,7 @@ Updated content."""
             content_hash="original_hash",
         )
 
-        with (
-            patch.object(api.scene_db, "get_scene_by_id", return_value=mock_scene),
-            patch.object(api.scene_db, "update_last_read"),
-        ):
+        with patch.object(api.scene_db, "get_scene_by_id", return_value=mock_scene):
             # Try to update with conflict checking but no last_read timestamp
             result = await api.update_scene(
                 scene_id, new_content, check_conflicts=True, last_read=None
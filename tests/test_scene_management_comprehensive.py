@@ -55,16 +55,14 @@ class TestReadSceneEdgeCases:
 
     @pytest.mark.asyncio
     async def test_read_scene_database_connection_error(self, api):
-        """Test read_scene when database connection fails during transaction."""
+        """Test read_scene when the read-only connection fails."""
         scene_id = SceneIdentifier("test_project", 1)
 
-        # Mock transaction context manager to raise on entry
-        mock_transaction = MagicMock(
-            spec=["content", "model", "provider", "usage", "__enter__", "__exit__"]
-        )
-        mock_transaction.__enter__.side_effect = sqlite3.Error("Connection failed")
+        # Mock read-only context manager to raise on entry
+        mock_readonly = MagicMock(spec=["__enter__", "__exit__"])
+        mock_readonly.__enter__.side_effect = sqlite3.Error("Connection failed")
 
-        with patch.object(api.db_ops, "transaction", return_value=mock_transaction):
+        with patch.object(api.db_ops, "readonly", return_value=mock_readonly):
             result = await api.read_scene(scene_id, "test_reader")
 
         assert result.success is False
@@ -73,8 +71,8 @@ class TestReadSceneEdgeCases:
         assert result.last_read is None
 
     @pytest.mark.asyncio
-    async def test_read_scene_update_last_read_fails(self, api):
-        """Test read_scene when updating last_read timestamp fails."""
+    async def test_read_scene_flush_failure_does_not_fail_read(self, api):
+        """Test read_scene succeeds when flushing batched reads fails."""
         scene_id = SceneIdentifier("test_project", 1)
 
         mock_scene = Scene(
@@ -85,32 +83,26 @@ class TestReadSceneEdgeCases:
             content_hash="hash123",
         )
 
-        with patch.object(api.db_ops, "transaction") as mock_trans:
-            mock_conn = mock_trans().__enter__()
-
-            with (
-                patch.object(api.scene_db, "get_scene_by_id", return_value=mock_scene),
-                patch.object(
-                    api.scene_db,
-                    "update_last_read",
-                    side_effect=sqlite3.Error("Update failed"),
-                ),
-            ):
-                result = await api.read_scene(scene_id, "test_reader")
+        with (
+            patch.object(api.db_ops, "readonly"),
+            patch.object(api.scene_db, "get_scene_by_id", return_value=mock_scene),
+            patch.object(api.read_tracker, "max_pending", 1),
+            patch.object(
+                api.db_ops, "transaction", side_effect=sqlite3.Error("Update failed")
+            ),
+        ):
+            result = await api.read_scene(scene_id, "test_reader")
 
-        # Should still fail because update_last_read failed
-        assert result.success is False
-        assert "Update failed" in result.error
-        assert result.scene is None
+        # Last-read bookkeeping is advisory, the read itself succeeds
+        assert result.success is True
+        assert result.scene is mock_scene
 
     @pytest.mark.asyncio
     async def test_read_scene_with_none_scene_id_key(self, api):
         """Test read_scene error message includes scene key properly."""
         scene_id = SceneIdentifier("test_project", 1)
 
-        with patch.object(api.db_ops, "transaction") as mock_trans:
-            mock_conn = mock_trans().__enter__()
-
+        with patch.object(api.db_ops, "readonly"):
             with patch.object(api.scene_db, "get_scene_by_id", return_value=None):
                 result = await api.read_scene(scene_id)
 
@@ -733,12 +725,10 @@ class TestLoggingAndTimestamps:
             content_hash="hash123",
         )
 
-        with patch.object(api.db_ops, "transaction") as mock_trans:
-            mock_conn = mock_trans().__enter__()
-
+        with patch.object(api.db_ops, "readonly"):
             with (
                 patch.object(api.scene_db, "get_scene_by_id", return_value=mock_scene),
-                patch.object(api.scene_db, "update_last_read"),
+                patch.object(api.read_tracker, "record", return_value=False),
                 patch("scriptrag.api.scene_management.logger") as mock_logger,
             ):
                 result = await api.read_scene(scene_id, "test_reader")
@@ -629,7 +629,7 @@ class TestSceneManagementAPIExtended:
         scene_id = SceneIdentifier("test", 1)
 
         with patch.object(
-            api.db_ops, "transaction", side_effect=Exception("Database error")
+            api.db_ops, "readonly", side_effect=Exception("Database error")
         ):
             result = await api.read_scene(scene_id)
 
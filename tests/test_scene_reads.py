@@ -0,0 +1,149 @@
+"""Tests for batched scene read tracking."""
+
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from scriptrag.api.database_operations import DatabaseOperations
+from scriptrag.api.scene_management import SceneManagementAPI
+from scriptrag.api.scene_models import SceneIdentifier
+from scriptrag.api.scene_reads import (
+    SceneReadTracker,
+    flush_scene_reads,
+    get_scene_read_tracker,
+)
+from scriptrag.config import ScriptRAGSettings
+
+
+@pytest.fixture
+def settings(tmp_path: Path) -> ScriptRAGSettings:
+    """Create settings with an initialized database holding one scene."""
+    from scriptrag.api import DatabaseInitializer
+
+    db_path = tmp_path / "test.db"
+    settings = ScriptRAGSettings(database_path=db_path)
+    DatabaseInitializer().initialize_database(db_path=db_path, settings=settings)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO scripts (id, title, file_path) VALUES (1, 'test', 'test.fountain')"
+    )
+    conn.execute(
+        "INSERT INTO scenes (id, script_id, scene_number, heading, content, "
+        "updated_at) VALUES (1, 1, 1, 'INT. ROOM - DAY', "
+        "'INT. ROOM - DAY\n\nA room.', '2024-01-01 12:00:00')"
+    )
+    conn.commit()
+    conn.close()
+    return settings
+
+
+def _read_rows(settings: ScriptRAGSettings) -> list[tuple]:
+    conn = sqlite3.connect(settings.database_path)
+    try:
+        return conn.execute(
+            "SELECT scene_id, reader_id FROM scene_reads ORDER BY scene_id"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+class TestSceneReadTracker:
+    """Test in-memory batching of scene reads."""
+
+    def test_record_keeps_latest_read_per_scene(self, settings):
+        tracker = SceneReadTracker(settings)
+        scene_id = SceneIdentifier("test", 1)
+        now = datetime.now(UTC)
+
+        tracker.record(scene_id, "a", now)
+        tracker.record(scene_id, "b", now - timedelta(seconds=1))
+        tracker.record(SceneIdentifier("test", 2), "c", now)
+
+        reads = {read.scene_id.scene_number: read for read in tracker.drain()}
+        assert reads[1].reader_id == "a"
+        assert len(reads) == 2
+        assert tracker.pending_count == 0
+
+    def test_record_signals_flush_when_full(self, settings):
+        tracker = SceneReadTracker(settings, max_pending=2, flush_interval=3600)
+        now = datetime.now(UTC)
+
+        assert tracker.record(SceneIdentifier("test", 1), "a", now) is False
+        assert tracker.record(SceneIdentifier("test", 2), "a", now) is True
+
+    def test_record_signals_flush_after_interval(self, settings):
+        tracker = SceneReadTracker(settings, flush_interval=0)
+        assert tracker.record(SceneIdentifier("test", 1), "a", datetime.now(UTC))
+
+    def test_flush_writes_pending_reads(self, settings):
+        tracker = SceneReadTracker(settings)
+        tracker.record(SceneIdentifier("test", 1), "agent", datetime.now(UTC))
+
+        assert tracker.flush() == 1
+        assert _read_rows(settings) == [(1, "agent")]
+        assert tracker.flush() == 0
+
+    def test_flush_failure_is_logged_not_raised(self, tmp_path):
+        settings = ScriptRAGSettings(database_path=tmp_path / "missing" / "x.db")
+        tracker = SceneReadTracker(settings)
+        tracker.record(SceneIdentifier("test", 1), "agent", datetime.now(UTC))
+
+        assert tracker.flush() == 0
+        assert tracker.pending_count == 0
+
+    def test_shared_tracker_per_database(self, settings, tmp_path):
+        other = ScriptRAGSettings(database_path=tmp_path / "other.db")
+        assert get_scene_read_tracker(settings) is get_scene_read_tracker(settings)
+        assert get_scene_read_tracker(settings) is not get_scene_read_tracker(other)
+
+    def test_flush_scene_reads_skips_missing_databases(self, settings, tmp_path):
+        missing = ScriptRAGSettings(database_path=tmp_path / "gone.db")
+        get_scene_read_tracker(missing).record(
+            SceneIdentifier("test", 1), "agent", datetime.now(UTC)
+        )
+        get_scene_read_tracker(settings).record(
+            SceneIdentifier("test", 1), "agent", datetime.now(UTC)
+        )
+
+        assert flush_scene_reads() == 1
+        assert _read_rows(settings) == [(1, "agent")]
+        assert not (tmp_path / "gone.db").exists()
+        get_scene_read_tracker(missing).drain()
+
+
+class TestReadSceneWithoutWrites:
+    """Test that reading scenes does not write to the database."""
+
+    @pytest.mark.asyncio
+    async def test_read_scene_does_not_write_until_flush(self, settings):
+        api = SceneManagementAPI(settings=settings)
+        api.read_tracker.drain()
+
+        result = await api.read_scene(SceneIdentifier("test", 1), "agent")
+
+        assert result.success is True
+        assert _read_rows(settings) == []
+        assert api.read_tracker.pending_count == 1
+
+        api.read_tracker.flush(DatabaseOperations(settings))
+        assert _read_rows(settings) == [(1, "agent")]
+
+    @pytest.mark.asyncio
+    async def test_flushed_reads_do_not_cause_conflicts(self, settings):
+        api = SceneManagementAPI(settings=settings)
+        scene_id = SceneIdentifier("test", 1)
+
+        read = await api.read_scene(scene_id, "agent")
+        api.read_tracker.flush(api.db_ops)
+
+        result = await api.update_scene(
+            scene_id,
+            "INT. ROOM - NIGHT\n\nThe room at night.",
+            check_conflicts=True,
+            last_read=read.last_read,
+        )
+
+        assert result.success is True, result.error
@@ -10,7 +10,7 @@ the uncovered lines identified in the coverage analysis:
 """
 
 import asyncio
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -213,8 +213,15 @@ class TestSearchEngineAsyncContextExecution:
             search_methods=["sql"],
         )
 
-        # Mock database connection for successful execution
-        with patch.object(engine, "get_read_only_connection") as mock_conn_mgr:
+        # Mock database connection for successful execution; search_async runs
+        # its SQL legs on worker threads, which cannot start while
+        # threading.Thread is mocked, so it is stubbed out as well
+        with (
+            patch.object(engine, "get_read_only_connection") as mock_conn_mgr,
+            patch.object(
+                engine, "search_async", AsyncMock(return_value=expected_response)
+            ),
+        ):
             mock_conn = Mock(spec=["execute", "close", "cursor"])
             mock_conn_mgr.return_value.__enter__ = Mock(return_value=mock_conn)
             mock_conn_mgr.return_value.__exit__ = Mock(return_value=None)
@@ -347,9 +354,9 @@ class TestSemanticSearchIntegration:
             ]
 
             with patch.object(
-                engine.semantic_adapter, "enhance_results_with_semantic_search"
-            ) as mock_enhance:
-                mock_enhance.return_value = (enhanced_results, enhanced_bible_results)
+                engine.semantic_adapter, "search_semantic"
+            ) as mock_semantic:
+                mock_semantic.return_value = (enhanced_results, enhanced_bible_results)
 
                 # Execute the search
                 result = asyncio.run(engine.search_async(query))
@@ -357,14 +364,9 @@ class TestSemanticSearchIntegration:
                 # Verify semantic search was triggered (line 272-273)
                 assert "semantic" in result.search_methods
 
-                # Verify enhance method was called with correct parameters
-                mock_enhance.assert_called_once()
-                call_kwargs = mock_enhance.call_args[1]
-                assert call_kwargs["query"] == query
-                assert call_kwargs["existing_results"] == []
-                assert call_kwargs["limit"] == max(
-                    5, int(10 * 0.8)
-                )  # min_results vs limit * factor
+                # Verify semantic leg was called with correct parameters
+                # (limit is min_results vs limit * factor)
+                mock_semantic.assert_called_once_with(query, max(5, int(10 * 0.8)))
 
                 # Verify results were enhanced (line 292)
                 assert result.results == enhanced_results
@@ -464,9 +466,9 @@ class TestSemanticSearchIntegration:
             ]
 
             with patch.object(
-                engine.semantic_adapter, "enhance_results_with_semantic_search"
-            ) as mock_enhance:
-                mock_enhance.return_value = ([], semantic_bible_results)
+                engine.semantic_adapter, "search_semantic"
+            ) as mock_semantic:
+                mock_semantic.return_value = ([], semantic_bible_results)
 
                 # Execute search
                 result = asyncio.run(engine.search_async(query))
@@ -512,10 +514,10 @@ class TestSemanticSearchIntegration:
 
             # Mock semantic adapter to raise exception
             with patch.object(
-                engine.semantic_adapter, "enhance_results_with_semantic_search"
-            ) as mock_enhance:
+                engine.semantic_adapter, "search_semantic"
+            ) as mock_semantic:
                 # This should trigger the exception handling in lines 303-311
-                mock_enhance.side_effect = ValueError("Semantic search failed")
+                mock_semantic.side_effect = ValueError("Semantic search failed")
 
                 # Execute search - should not fail due to graceful fallback
                 result = asyncio.run(engine.search_async(query))
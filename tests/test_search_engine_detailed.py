@@ -8,7 +8,7 @@ import asyncio
 import sqlite3
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -82,9 +82,9 @@ class TestSearchEngineConnectionManager:
             # The path gets normalized by Path, so expect the resolved path
             assert error.details["path"] == str(dangerous_path.resolve())
 
-    def test_get_read_only_connection_other_value_error_line_73_74(self):
+    def test_get_read_only_connection_other_value_error_line_73_74(self, tmp_path):
         """Test connection with non-path ValueError (covers lines 73-74)."""
-        settings = ScriptRAGSettings(database_path=Path("test.db"))
+        settings = ScriptRAGSettings(database_path=tmp_path / "test.db")
         engine = SearchEngine(settings)
 
         # Mock get_read_only_connection to raise ValueError without path message
@@ -159,7 +159,14 @@ class TestSearchSyncWrapperComplexPath:
 
         # Test the threading path - this is complex but tests the actual logic
         # For this test, we'll focus on the path structure rather than exact execution
-        with patch("threading.Thread") as mock_thread_class:
+        # search_async runs its SQL legs on worker threads, which cannot start
+        # while threading.Thread is mocked, so stub it out as well
+        with (
+            patch("threading.Thread") as mock_thread_class,
+            patch.object(
+                engine, "search_async", AsyncMock(return_value=expected_response)
+            ),
+        ):
             mock_thread = Mock(spec=["is_alive", "start", "join"])
             mock_thread_class.return_value = mock_thread
             mock_thread.is_alive.return_value = False
@@ -350,9 +357,9 @@ class TestSearchAsyncDatabaseErrors:
 class TestSearchResultParsing:
     """Test search result parsing and error handling (lines 222-226, 232-247)."""
 
-    def test_count_result_parsing_edge_cases_line_222_226(self):
+    def test_count_result_parsing_edge_cases_line_222_226(self, tmp_path):
         """Test count result parsing with various edge cases (covers lines 222-226)."""
-        settings = ScriptRAGSettings(database_path=Path("test.db"))
+        settings = ScriptRAGSettings(database_path=tmp_path / "test.db")
         engine = SearchEngine(settings)
         query = SearchQuery(raw_query="test")
 
@@ -577,9 +584,9 @@ class TestSemanticSearchIntegration:
                         # Mock semantic adapter
                         with patch.object(
                             engine.semantic_adapter,
-                            "enhance_results_with_semantic_search",
-                        ) as mock_enhance:
-                            mock_enhance.return_value = (
+                            "search_semantic",
+                        ) as mock_semantic:
+                            mock_semantic.return_value = (
                                 semantic_results,
                                 semantic_bible_results,
                             )
@@ -590,9 +597,7 @@ class TestSemanticSearchIntegration:
                             expected_limit = max(
                                 3, int(10 * 0.5)
                             )  # max(min_results, limit * factor)
-                            mock_enhance.assert_called_once_with(
-                                query=query, existing_results=[], limit=expected_limit
-                            )
+                            mock_semantic.assert_called_once_with(query, expected_limit)
 
                             # Verify results include semantic search
                             assert "semantic" in response.search_methods
@@ -645,9 +650,9 @@ class TestSemanticSearchIntegration:
                         # Mock semantic adapter to raise exception
                         with patch.object(
                             engine.semantic_adapter,
-                            "enhance_results_with_semantic_search",
-                        ) as mock_enhance:
-                            mock_enhance.side_effect = ValueError(
+                            "search_semantic",
+                        ) as mock_semantic:
+                            mock_semantic.side_effect = ValueError(
                                 "Semantic search failed"
                             )
 
@@ -676,9 +681,9 @@ class TestSemanticSearchIntegration:
 class TestBibleSearchFunctionality:
     """Test bible search functionality and error handling (lines 383-384, 412-434)."""
 
-    def test_bible_search_with_project_filter_line_383_384(self):
+    def test_bible_search_with_project_filter_line_383_384(self, tmp_path):
         """Test bible search with project filter (covers lines 383-384)."""
-        settings = ScriptRAGSettings(database_path=Path("test.db"))
+        settings = ScriptRAGSettings(database_path=tmp_path / "test.db")
         engine = SearchEngine(settings)
 
         # Create query with project filter
@@ -727,9 +732,9 @@ class TestBibleSearchFunctionality:
         assert "AND s.title = ?" in search_sql
         assert "Test Project" in search_params
 
-    def test_bible_search_database_error_line_425_433(self):
+    def test_bible_search_database_error_line_425_433(self, tmp_path):
         """Test bible search with database error (covers lines 425-433)."""
-        settings = ScriptRAGSettings(database_path=Path("test.db"))
+        settings = ScriptRAGSettings(database_path=tmp_path / "test.db")
         engine = SearchEngine(settings)
 
         query = SearchQuery(raw_query="test", include_bible=True)
@@ -750,9 +755,9 @@ class TestBibleSearchFunctionality:
             error_call = mock_logger.error.call_args
             assert "Database error during bible search" in error_call[0][0]
 
-    def test_bible_search_unexpected_error_line_434_441(self):
+    def test_bible_search_unexpected_error_line_434_441(self, tmp_path):
         """Test bible search with unexpected error (covers lines 434-441)."""
-        settings = ScriptRAGSettings(database_path=Path("test.db"))
+        settings = ScriptRAGSettings(database_path=tmp_path / "test.db")
         engine = SearchEngine(settings)
 
         query = SearchQuery(raw_query="test", include_bible=True)
@@ -0,0 +1,73 @@
+"""Import-time budget for the CLI entry point, measured with -X importtime."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules that only specific commands need; none may load on CLI import
+HEAVY_MODULES = [
+    "numpy",
+    "sqlite_vec",
+    "git",
+    "jouvence",
+    "httpx",
+    "mcp",
+    "watchdog",
+    "scriptrag.api",
+    "scriptrag.main",
+    "scriptrag.search",
+    "scriptrag.analyzers",
+    "scriptrag.cli.commands.analyze",
+    "scriptrag.cli.commands.query",
+]
+
+# Cumulative budget for `import scriptrag.cli.main` in microseconds. Typer,
+# rich, pydantic-settings and structlog account for most of it; loading the
+# API layer roughly doubles it.
+IMPORT_BUDGET_US = 1_500_000
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter and return cumulative times."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            continue  # Header line
+    return times
+
+
+@pytest.fixture(scope="module")
+def cli_import_times() -> dict[str, int]:
+    """Import times recorded while importing the CLI entry point."""
+    return _import_times("scriptrag.cli.main")
+
+
+def test_cli_import_skips_heavy_modules(cli_import_times):
+    """Importing the CLI must not load command modules or their dependencies."""
+    loaded = [module for module in HEAVY_MODULES if module in cli_import_times]
+    assert loaded == []
+
+
+def test_cli_import_within_budget(cli_import_times):
+    """Importing the CLI stays within the import-time budget."""
+    assert cli_import_times["scriptrag.cli.main"] < IMPORT_BUDGET_US
+
+
+def test_package_import_is_lazy():
+    """Importing the package does not load ScriptRAG or the API layer."""
+    times = _import_times("scriptrag")
+    assert "scriptrag.main" not in times
+    assert "scriptrag.api" not in times
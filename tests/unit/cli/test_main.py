@@ -4,6 +4,7 @@ import sqlite3
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import click
 import pytest
 import typer
 from typer.testing import CliRunner
@@ -31,7 +32,8 @@ class TestCLIMain:
 
     def test_app_has_commands(self):
         """Test that all expected commands are registered."""
-        command_names = [cmd.name for cmd in app.registered_commands]
+        group = typer.main.get_command(app)
+        command_names = group.list_commands(click.Context(group))
 
         # Check that main commands are registered
         assert "init" in command_names
@@ -42,8 +44,10 @@ class TestCLIMain:
 
     def test_app_has_query_subapp(self):
         """Test that query subapp is registered."""
-        subapps = [group.name for group in app.registered_groups]
-        assert "query" in subapps
+        group = typer.main.get_command(app)
+        query = group.get_command(click.Context(group), "query")
+        assert isinstance(query, click.Group)
+        assert "list" in query.list_commands(click.Context(query))
 
     def test_main_function_calls_app(self):
         """Test that main function calls the app."""
@@ -226,3 +230,47 @@ class TestCLIMain:
         from scriptrag.cli.main import cli
 
         assert cli == main
+
+
+class TestProfiling:
+    """Test --profile, --trace and status --perf."""
+
+    @pytest.fixture
+    def runner(self):
+        """Create a CLI test runner."""
+        return CliRunner()
+
+    @pytest.fixture
+    def settings(self, tmp_path):
+        """Point the CLI at a database path in a temporary directory."""
+        mock_settings = MagicMock(database_path=tmp_path / "scriptrag.db")
+        with patch("scriptrag.cli.main.get_settings", return_value=mock_settings):
+            yield mock_settings
+
+    def test_profile_stores_last_run(self, runner, settings, tmp_path):
+        result = runner.invoke(app, ["--profile", "version"])
+        assert result.exit_code == 0
+        assert "Profile: version" in strip_ansi_codes(result.output)
+
+        result = runner.invoke(app, ["status", "--perf", "--json"])
+        assert result.exit_code == 0
+
+        import json
+
+        data = json.loads(result.output)
+        assert data["command"] == "version"
+        assert "spans" in data
+
+    def test_trace_writes_chrome_trace(self, runner, settings, tmp_path):
+        trace_path = tmp_path / "trace.json"
+        result = runner.invoke(app, ["--trace", str(trace_path), "version"])
+        assert result.exit_code == 0
+
+        import json
+
+        assert "traceEvents" in json.loads(trace_path.read_text())
+
+    def test_status_perf_without_profile(self, runner, settings):
+        result = runner.invoke(app, ["status", "--perf"])
+        assert result.exit_code == 0
+        assert "No profile recorded yet" in strip_ansi_codes(result.output)
@@ -0,0 +1,166 @@
+"""Tests for timing spans and profile export."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from scriptrag.common.profiling import (
+    Profiler,
+    SpanStats,
+    get_profile_path,
+    get_profiler,
+    load_profile,
+    save_profile,
+    timed,
+)
+
+
+@pytest.fixture
+def profiler():
+    """Reset the process-wide profiler around each test."""
+    shared = get_profiler()
+    shared.reset()
+    yield shared
+    shared.enable_tracing(False)
+    shared.reset()
+
+
+class TestSpanStats:
+    """Test span aggregation."""
+
+    def test_add_tracks_count_total_min_max(self):
+        stats = SpanStats("parse")
+        for duration in (3.0, 1.0, 2.0):
+            stats.add(duration)
+
+        assert stats.count == 3
+        assert stats.total_ms == 6.0
+        assert stats.min_ms == 1.0
+        assert stats.max_ms == 3.0
+        assert stats.mean_ms == 2.0
+
+    def test_empty_mean_is_zero(self):
+        assert SpanStats("parse").mean_ms == 0.0
+
+
+class TestProfiler:
+    """Test the span profiler."""
+
+    def test_span_aggregates_by_name(self):
+        profiler = Profiler()
+        with profiler.span("parse"):
+            pass
+        with profiler.span("parse"):
+            pass
+        with profiler.span("list"):
+            pass
+
+        stats = profiler.get_stats()
+        assert stats["parse"].count == 2
+        assert stats["list"].count == 1
+
+    def test_span_records_on_error(self):
+        profiler = Profiler()
+        with pytest.raises(ValueError), profiler.span("db.write"):
+            raise ValueError("boom")
+        assert profiler.get_stats()["db.write"].count == 1
+
+    def test_summary_sorted_by_total_time(self):
+        profiler = Profiler()
+        profiler.record("fast", 0.0, 0.001)
+        profiler.record("slow", 0.0, 0.005)
+
+        summary = profiler.summary()
+        assert [s["name"] for s in summary["spans"]] == ["slow", "fast"]
+        assert summary["spans"][0]["total_ms"] == 5.0
+
+    def test_events_only_recorded_when_tracing(self):
+        profiler = Profiler()
+        profiler.record("parse", 0.0, 0.001)
+        assert profiler.summary()["trace_events"] == 0
+
+        profiler.enable_tracing()
+        profiler.record("parse", 0.0, 0.001)
+        assert profiler.summary()["trace_events"] == 1
+
+    def test_reset_clears_run(self):
+        profiler = Profiler()
+        profiler.enable_tracing()
+        profiler.record("parse", 0.0, 0.001)
+        profiler.reset()
+
+        summary = profiler.summary()
+        assert summary["spans"] == []
+        assert summary["trace_events"] == 0
+
+    def test_export_chrome_trace(self, tmp_path: Path):
+        profiler = Profiler()
+        profiler.enable_tracing()
+        with profiler.span("analyze.relationships", scene=3):
+            pass
+
+        path = tmp_path / "trace.json"
+        assert profiler.export_chrome_trace(path) == 1
+
+        event = json.loads(path.read_text())["traceEvents"][0]
+        assert event["name"] == "analyze.relationships"
+        assert event["cat"] == "analyze"
+        assert event["ph"] == "X"
+        assert event["dur"] >= 0
+        assert event["args"] == {"scene": "3"}
+
+
+class TestTimed:
+    """Test the timing decorator."""
+
+    def test_sync_function(self, profiler):
+        @timed("work")
+        def work(value: int) -> int:
+            return value * 2
+
+        assert work(2) == 4
+        assert profiler.get_stats()["work"].count == 1
+
+    def test_async_function(self, profiler):
+        @timed("async_work")
+        async def work(value: int) -> int:
+            return value + 1
+
+        assert asyncio.iscoroutinefunction(work)
+        assert asyncio.run(work(1)) == 2
+        assert profiler.get_stats()["async_work"].count == 1
+
+    def test_default_name_is_qualname(self, profiler):
+        @timed()
+        def helper() -> None:
+            pass
+
+        helper()
+        assert helper.__qualname__ in profiler.get_stats()
+
+    def test_parser_is_instrumented(self, profiler):
+        from scriptrag.parser import FountainParser
+
+        FountainParser().parse("INT. OFFICE - DAY\n\nWork happens.\n")
+        assert profiler.get_stats()["parse"].count == 1
+
+
+class TestStoredProfile:
+    """Test storing the last profiled run."""
+
+    def test_profile_path_next_to_database(self, tmp_path: Path):
+        db_path = tmp_path / "scriptrag.db"
+        assert get_profile_path(db_path) == tmp_path / "scriptrag.db.profile.json"
+
+    def test_save_and_load(self, tmp_path: Path):
+        path = tmp_path / "profile.json"
+        save_profile(path, {"command": "index", "spans": []})
+        assert load_profile(path) == {"command": "index", "spans": []}
+
+    def test_load_missing_or_invalid(self, tmp_path: Path):
+        assert load_profile(tmp_path / "missing.json") is None
+        invalid = tmp_path / "invalid.json"
+        invalid.write_text("not json")
+        assert load_profile(invalid) is None
@@ -0,0 +1,282 @@
+"""Unit tests for the generation-keyed result cache."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from scriptrag.api.database import DatabaseInitializer
+from scriptrag.config import ScriptRAGSettings
+from scriptrag.database.connection_manager import (
+    DatabaseConnectionManager,
+    close_connection_manager,
+)
+from scriptrag.database.result_cache import (
+    ResultCache,
+    clear_result_caches,
+    get_database_generation,
+    get_result_cache,
+    get_result_cache_size,
+    get_result_cache_stats,
+)
+from scriptrag.query.engine import QueryEngine
+from scriptrag.query.spec import QuerySpec
+from scriptrag.search.engine import SearchEngine
+from scriptrag.search.models import SearchMode, SearchQuery
+
+
+@pytest.fixture
+def settings(tmp_path: Path) -> ScriptRAGSettings:
+    """Create settings pointing at an initialized database with one scene."""
+    db_path = tmp_path / "test.db"
+    settings = ScriptRAGSettings(database_path=db_path, database_timeout=1.0)
+    DatabaseInitializer().initialize_database(db_path=db_path, settings=settings)
+    close_connection_manager(force=True)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO scripts (id, title, author, file_path, metadata) "
+        "VALUES (1, 'Pilot', 'Writer', 'pilot.fountain', '{}')"
+    )
+    conn.execute(
+        "INSERT INTO scenes (id, script_id, scene_number, heading, location, "
+        "time_of_day, content) "
+        "VALUES (1, 1, 1, 'INT. OFFICE - DAY', 'OFFICE', 'DAY', 'Coffee spills.')"
+    )
+    conn.commit()
+    conn.close()
+    return settings
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    """Reset shared caches and the connection manager around each test."""
+    clear_result_caches()
+    yield
+    clear_result_caches()
+    close_connection_manager(force=True)
+
+
+def _add_scene(db_path: Path, scene_id: int) -> None:
+    """Write a scene through a connection outside the pool."""
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO scenes (id, script_id, scene_number, heading, location, "
+        "time_of_day, content) "
+        "VALUES (?, 1, ?, 'EXT. ROOF - NIGHT', 'ROOF', 'NIGHT', 'Coffee again.')",
+        (scene_id, scene_id),
+    )
+    conn.commit()
+    conn.close()
+
+
+class TestResultCache:
+    """Test the LRU cache itself."""
+
+    def test_hit_and_miss(self) -> None:
+        cache = ResultCache("test", max_entries=2)
+        assert cache.get("a", 1) == (False, None)
+        cache.put("a", 1, [1])
+        assert cache.get("a", 1) == (True, [1])
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_generation_mismatch_invalidates(self) -> None:
+        cache = ResultCache("test")
+        cache.put("a", 1, "old")
+        assert cache.get("a", 2) == (False, None)
+        assert cache.get_stats()["invalidations"] == 1
+        assert cache.get_stats()["size"] == 0
+
+    def test_lru_eviction(self) -> None:
+        cache = ResultCache("test", max_entries=2)
+        cache.put("a", 1, "a")
+        cache.put("b", 1, "b")
+        cache.get("a", 1)  # a is now most recently used
+        cache.put("c", 1, "c")
+
+        assert cache.get("b", 1) == (False, None)
+        assert cache.get("a", 1) == (True, "a")
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_disabled_cache_stores_nothing(self) -> None:
+        cache = ResultCache("test", max_entries=0)
+        cache.put("a", 1, "a")
+        assert cache.get_stats()["size"] == 0
+
+    def test_shared_cache_per_database_with_fixed_size(
+        self, settings: ScriptRAGSettings, tmp_path: Path
+    ) -> None:
+        settings.result_cache_size = 3
+        cache = get_result_cache(settings, "test")
+
+        smaller = ScriptRAGSettings(
+            database_path=settings.database_path, result_cache_size=1
+        )
+        assert get_result_cache(smaller, "test") is cache
+        assert cache.max_entries == 3
+
+        other_db = ScriptRAGSettings(database_path=tmp_path / "other.db")
+        assert get_result_cache(other_db, "test") is not cache
+        assert f"test:{settings.database_path}" in get_result_cache_stats()
+
+    def test_cache_size_from_mock_settings(self) -> None:
+        assert get_result_cache_size(MagicMock(spec=ScriptRAGSettings)) == 0
+        assert get_result_cache_size(ScriptRAGSettings()) == 256
+
+
+class TestDatabaseGeneration:
+    """Test write generation tracking in the connection manager."""
+
+    def test_transaction_commit_bumps_generation(
+        self, settings: ScriptRAGSettings
+    ) -> None:
+        manager = DatabaseConnectionManager(settings, pool_size=(1, 2))
+        try:
+            before = manager.generation
+            with manager.transaction() as conn:
+                conn.execute("UPDATE scenes SET content = 'Tea.' WHERE id = 1")
+            assert manager.generation > before
+        finally:
+            manager.close(force=True)
+
+    def test_rolled_back_transaction_keeps_generation(
+        self, settings: ScriptRAGSettings
+    ) -> None:
+        manager = DatabaseConnectionManager(settings, pool_size=(1, 2))
+        try:
+            before = manager.generation
+            with pytest.raises(RuntimeError), manager.transaction():
+                raise RuntimeError("boom")
+            assert manager.generation == before
+        finally:
+            manager.close(force=True)
+
+    def test_foreign_commit_detected_via_data_version(
+        self, settings: ScriptRAGSettings
+    ) -> None:
+        manager = DatabaseConnectionManager(settings, pool_size=(1, 1))
+        try:
+            first = manager.get_generation()
+            assert manager.get_generation() == first
+
+            _add_scene(settings.database_path, 2)
+
+            assert manager.get_generation() != first
+        finally:
+            manager.close(force=True)
+
+    def test_new_pooled_connections_keep_generation(
+        self, settings: ScriptRAGSettings
+    ) -> None:
+        manager = DatabaseConnectionManager(settings, pool_size=(1, 3))
+        try:
+            first = manager.get_generation()
+            connections = [manager.get_connection() for _ in range(3)]
+            for conn in connections:
+                conn.execute("SELECT COUNT(*) FROM scenes").fetchone()
+                manager.release_connection(conn)
+            assert manager.get_generation() == first
+        finally:
+            manager.close(force=True)
+
+    def test_no_manager_is_created_for_generation(
+        self, settings: ScriptRAGSettings
+    ) -> None:
+        conn = sqlite3.connect(settings.database_path)
+        try:
+            assert get_database_generation(settings, conn) is None
+        finally:
+            conn.close()
+
+    def test_mock_connection_is_not_cacheable(
+        self, settings: ScriptRAGSettings
+    ) -> None:
+        assert get_database_generation(settings, MagicMock()) is None
+
+
+class TestEngineCaching:
+    """Test result caching in the query and search engines."""
+
+    def test_query_engine_serves_repeated_query_from_cache(
+        self, settings: ScriptRAGSettings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("scriptrag.query.engine.get_settings", lambda: settings)
+        engine = QueryEngine()
+        spec = QuerySpec(
+            name="scenes", description="All scenes", sql="SELECT id FROM scenes"
+        )
+
+        rows, _ = engine.execute(spec)
+        rows.append({"id": 99})  # Mutating the result must not touch the cache
+        cached_rows, _ = engine.execute(spec)
+
+        assert cached_rows == [{"id": 1}]
+        assert engine.result_cache.get_stats()["hits"] == 1
+
+    def test_query_engine_invalidated_by_write(
+        self, settings: ScriptRAGSettings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("scriptrag.query.engine.get_settings", lambda: settings)
+        engine = QueryEngine()
+        spec = QuerySpec(
+            name="scenes", description="All scenes", sql="SELECT id FROM scenes"
+        )
+
+        assert engine.execute(spec)[0] == [{"id": 1}]
+        _add_scene(settings.database_path, 2)
+        assert engine.execute(spec)[0] == [{"id": 1}, {"id": 2}]
+
+    def test_query_engine_cache_disabled(
+        self, settings: ScriptRAGSettings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        settings.result_cache_size = 0
+        monkeypatch.setattr("scriptrag.query.engine.get_settings", lambda: settings)
+        engine = QueryEngine()
+        spec = QuerySpec(name="scenes", description="", sql="SELECT id FROM scenes")
+
+        hits_before = engine.result_cache.get_stats()["hits"]
+        engine.execute(spec)
+        engine.execute(spec)
+
+        assert engine.result_cache.get_stats()["hits"] == hits_before
+
+    def test_search_engine_serves_repeated_search_from_cache(
+        self, settings: ScriptRAGSettings
+    ) -> None:
+        engine = SearchEngine(settings)
+        query = SearchQuery(
+            raw_query="coffee", text_query="coffee", mode=SearchMode.STRICT
+        )
+
+        first = engine.search(query)
+        second = engine.search(query)
+
+        assert [r.scene_id for r in second.results] == [1]
+        assert second.metadata["cache_hit"] is True
+        assert first.metadata["cache_hit"] is False
+        assert second.query is query
+
+        _add_scene(settings.database_path, 2)
+        third = engine.search(query)
+        assert sorted(r.scene_id for r in third.results) == [1, 2]
+        assert third.metadata["cache_hit"] is False
+
+    def test_search_cache_key_includes_result_settings(
+        self, settings: ScriptRAGSettings
+    ) -> None:
+        query = SearchQuery(
+            raw_query="coffee", text_query="coffee", mode=SearchMode.STRICT
+        )
+        strict = settings.model_copy(update={"search_vector_similarity_threshold": 0.9})
+
+        SearchEngine(settings).search(query)
+        response = SearchEngine(strict).search(query)
+
+        assert response.metadata["cache_hit"] is False
@@ -0,0 +1,229 @@
+"""Tests for the IVF approximate-nearest-neighbour index."""
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from scriptrag.embeddings.ann_index import AnnIndexStore, IVFIndex, get_ann_store
+from scriptrag.embeddings.vector_store import BinaryEmbeddingSerializer
+
+DIMENSIONS = 16
+
+
+def _clustered_vectors(count: int, seed: int = 0) -> np.ndarray:
+    """Vectors scattered around a handful of cluster centres."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(8, DIMENSIONS))
+    labels = rng.integers(0, len(centres), size=count)
+    return centres[labels] + 0.1 * rng.normal(size=(count, DIMENSIONS))
+
+
+def _exact_top(vectors: np.ndarray, query: np.ndarray, k: int) -> list[int]:
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = unit @ (query / np.linalg.norm(query))
+    return [int(i) for i in np.argsort(-scores)[:k]]
+
+
+class TestIVFIndex:
+    """Test building, searching and updating the index."""
+
+    def test_search_with_every_list_probed_is_exact(self):
+        vectors = _clustered_vectors(500)
+        index = IVFIndex.build(range(500), vectors, n_lists=10)
+        query = vectors[7] + 0.05
+
+        neighbours = index.search(query, k=10, probes=index.n_lists)
+
+        assert [entity_id for entity_id, _ in neighbours] == _exact_top(
+            vectors, query, 10
+        )
+        scores = [score for _, score in neighbours]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_search_with_few_probes_keeps_high_recall(self):
+        vectors = _clustered_vectors(2000)
+        index = IVFIndex.build(range(2000), vectors)
+
+        recalls = []
+        for query in vectors[:20]:
+            found = {entity_id for entity_id, _ in index.search(query, 10, probes=8)}
+            recalls.append(len(found & set(_exact_top(vectors, query, 10))) / 10)
+
+        assert np.mean(recalls) >= 0.9
+
+    def test_default_list_count_is_square_root_of_size(self):
+        index = IVFIndex.build(range(400), _clustered_vectors(400))
+        assert index.n_lists == 20
+        assert len(index) == 400
+
+    def test_upsert_replaces_existing_ids(self):
+        vectors = _clustered_vectors(100)
+        index = IVFIndex.build(range(100), vectors, n_lists=4)
+
+        index.upsert([5, 1000], [vectors[50], vectors[60]])
+
+        assert len(index) == 101
+        top_id, top_score = index.search(vectors[50], k=2, probes=4)[0]
+        assert top_id in {5, 50}
+        assert top_score == pytest.approx(1.0, abs=1e-5)
+
+    def test_remove_drops_ids(self):
+        vectors = _clustered_vectors(100)
+        index = IVFIndex.build(range(100), vectors, n_lists=4)
+
+        index.remove([3, 4, 999])
+
+        assert len(index) == 98
+        found = {entity_id for entity_id, _ in index.search(vectors[3], 100, 4)}
+        assert not found & {3, 4}
+
+    def test_dimension_mismatch_raises(self):
+        index = IVFIndex.build(range(10), _clustered_vectors(10), n_lists=2)
+        with pytest.raises(ValueError, match="16-dimensional"):
+            index.search([0.1, 0.2], k=1)
+        with pytest.raises(ValueError, match="16-dimensional"):
+            index.upsert([11], [[0.1, 0.2]])
+
+    def test_build_without_vectors_raises(self):
+        with pytest.raises(ValueError, match="without vectors"):
+            IVFIndex.build([], np.empty((0, DIMENSIONS)))
+
+    def test_needs_rebuild_after_large_growth(self):
+        vectors = _clustered_vectors(500)
+        index = IVFIndex.build(range(100), vectors[:100], n_lists=4)
+        assert not index.needs_rebuild
+
+        index.upsert(range(100, 500), vectors[100:])
+
+        assert index.needs_rebuild
+
+    def test_save_and_load_round_trip(self, tmp_path: Path):
+        vectors = _clustered_vectors(200)
+        index = IVFIndex.build(range(200), vectors, n_lists=8)
+        index.seq = 42
+        path = tmp_path / "index.npz"
+
+        index.save(path)
+        loaded = IVFIndex.load(path)
+
+        assert loaded.seq == 42
+        assert loaded.built_size == 200
+        assert loaded.search(vectors[9], 5, 8) == index.search(vectors[9], 5, 8)
+        assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.fixture
+def db(tmp_path: Path):
+    """Database with a minimal embeddings table."""
+    conn = sqlite3.connect(tmp_path / "test.db")
+    conn.execute(
+        """
+        CREATE TABLE embeddings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            entity_type TEXT NOT NULL,
+            entity_id INTEGER NOT NULL,
+            embedding_model TEXT NOT NULL,
+            embedding BLOB NOT NULL,
+            UNIQUE (entity_type, entity_id, embedding_model)
+        )
+        """
+    )
+    yield conn
+    conn.close()
+
+
+def _insert(conn: sqlite3.Connection, ids, vectors) -> None:
+    serializer = BinaryEmbeddingSerializer()
+    conn.executemany(
+        "INSERT OR REPLACE INTO embeddings "
+        "(entity_type, entity_id, embedding_model, embedding) "
+        "VALUES ('scene', ?, 'model/v1', ?)",
+        [
+            (int(i), serializer.encode(v.tolist()))
+            for i, v in zip(ids, vectors, strict=True)
+        ],
+    )
+
+
+class TestAnnIndexStore:
+    """Test persisting and syncing indexes with the embeddings table."""
+
+    def test_sync_builds_index_next_to_database(self, tmp_path, db):
+        _insert(db, range(50), _clustered_vectors(50))
+        store = AnnIndexStore(tmp_path / "test.db", min_vectors=10)
+
+        index = store.sync(db, "scene", "model/v1")
+
+        assert index is not None
+        assert len(index) == 50
+        path = store.index_path("scene", "model/v1")
+        assert path == tmp_path / "test.db.ann" / "scene-model_v1.npz"
+        assert path.exists()
+        assert store.fresh_index(db, "scene", "model/v1") is index
+
+    def test_changes_make_index_stale_until_synced(self, tmp_path, db):
+        vectors = _clustered_vectors(60)
+        _insert(db, range(50), vectors[:50])
+        store = AnnIndexStore(tmp_path / "test.db", min_vectors=10)
+        store.sync(db, "scene", "model/v1")
+
+        _insert(db, range(50, 60), vectors[50:])
+        db.execute("DELETE FROM embeddings WHERE entity_id = 0")
+
+        assert store.fresh_index(db, "scene", "model/v1") is None
+
+        index = store.sync(db, "scene", "model/v1")
+
+        assert index is not None
+        assert sorted(index.ids.tolist()) == list(range(1, 60))
+        assert store.fresh_index(db, "scene", "model/v1") is index
+        (pending,) = db.execute("SELECT COUNT(*) FROM embedding_changes").fetchone()
+        assert pending == 0
+
+    def test_small_corpus_has_no_index(self, tmp_path, db):
+        _insert(db, range(5), _clustered_vectors(5))
+        store = AnnIndexStore(tmp_path / "test.db", min_vectors=10)
+
+        assert store.sync(db, "scene", "model/v1") is None
+        assert store.fresh_index(db, "scene", "model/v1") is None
+        assert not store.index_path("scene", "model/v1").exists()
+
+    def test_fresh_index_without_change_tracking(self, tmp_path, db):
+        _insert(db, range(20), _clustered_vectors(20))
+        IVFIndex.build(range(20), _clustered_vectors(20), n_lists=2).save(
+            AnnIndexStore(tmp_path / "test.db").index_path("scene", "model/v1")
+        )
+
+        store = AnnIndexStore(tmp_path / "test.db")
+
+        assert store.fresh_index(db, "scene", "model/v1") is None
+
+    def test_sync_skips_undecodable_embeddings(self, tmp_path, db):
+        _insert(db, range(20), _clustered_vectors(20))
+        db.execute(
+            "INSERT INTO embeddings (entity_type, entity_id, embedding_model, "
+            "embedding) VALUES ('scene', 99, 'model/v1', ?)",
+            (b"raw",),
+        )
+        store = AnnIndexStore(tmp_path / "test.db", min_vectors=10)
+
+        index = store.sync(db, "scene", "model/v1")
+
+        assert index is not None
+        assert 99 not in index.ids.tolist()
+
+    def test_get_ann_store_respects_settings(self, tmp_path):
+        settings = MagicMock()
+        settings.search_ann_enabled = True
+        settings.search_ann_min_vectors = 100
+        settings.search_ann_probes = 4
+        settings.database_path = tmp_path / "test.db"
+
+        store = get_ann_store(settings)
+
+        assert store is not None
+        assert (store.min_vectors, store.probes) == (100, 4)
+        assert get_ann_store(object()) is None
@@ -375,6 +375,59 @@ class TestBatchProcessor:
         results = await batch_processor.process_parallel([], "test-model")
         assert results == []
 
+    @pytest.mark.asyncio
+    async def test_process_combined_single_request(
+        self, batch_processor, mock_llm_client, sample_batch_items
+    ):
+        """Test all items are embedded with one request, ordered by index."""
+        mock_llm_client.embed.return_value = EmbeddingResponse(
+            model="test-model",
+            data=[
+                {"index": 2, "embedding": [0.3]},
+                {"index": 0, "embedding": [0.1]},
+                {"index": 1, "embedding": [0.2]},
+            ],
+            provider=LLMProvider.OPENAI_COMPATIBLE,
+        )
+
+        results = await batch_processor.process_combined(
+            sample_batch_items, "test-model", 3
+        )
+
+        assert [r.embedding for r in results] == [[0.1], [0.2], [0.3]]
+        assert [r.id for r in results] == ["1", "2", "3"]
+        assert results[0].metadata == {"type": "scene"}
+        mock_llm_client.embed.assert_called_once()
+        request = mock_llm_client.embed.call_args.args[0]
+        assert request.input == ["First text", "Second text", "Third text"]
+        assert request.dimensions == 3
+
+    @pytest.mark.asyncio
+    async def test_process_combined_incomplete_response(
+        self, batch_processor, mock_llm_client, sample_batch_items
+    ):
+        """Test a response missing embeddings fails every item after retries."""
+        mock_llm_client.embed.return_value = EmbeddingResponse(
+            model="test-model",
+            data=[{"index": 0, "embedding": [0.1]}],
+            provider=LLMProvider.OPENAI_COMPATIBLE,
+        )
+
+        with patch("asyncio.sleep"):
+            results = await batch_processor.process_combined(
+                sample_batch_items, "test-model"
+            )
+
+        assert all(r.embedding is None for r in results)
+        assert "2 of 3 embeddings missing" in results[0].error
+        assert mock_llm_client.embed.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_process_combined_empty(self, batch_processor, mock_llm_client):
+        """Test combined processing with no items makes no request."""
+        assert await batch_processor.process_combined([], "test-model") == []
+        mock_llm_client.embed.assert_not_called()
+
     def test_estimate_tokens(self, batch_processor):
         """Test token estimation."""
         # Simple estimation: ~4 characters per token
@@ -6,6 +6,7 @@ from scriptrag.embeddings.dimensions import (
     DimensionManager,
     EmbeddingModel,
     ModelInfo,
+    StoragePrecision,
 )
 
 
@@ -452,6 +453,26 @@ class TestDimensionManager:
         assert estimate["total_mb"] > 1000  # Should be substantial
         assert estimate["total_gb"] > 1  # Should be multiple GB
 
+    @pytest.mark.parametrize(
+        ("precision", "bytes_per_embedding"),
+        [
+            (StoragePrecision.FLOAT32, 1536 * 4),
+            (StoragePrecision.FLOAT16, 1536 * 2),
+            (StoragePrecision.INT8, 1536 + 4),
+        ],
+    )
+    def test_estimate_storage_size_by_precision(
+        self, manager, precision, bytes_per_embedding
+    ):
+        """Test storage estimates for quantised precisions."""
+        estimate = manager.estimate_storage_size(
+            "text-embedding-3-small", 10, precision
+        )
+
+        assert estimate["precision"] == precision.precision_name
+        assert estimate["bytes_per_embedding"] == bytes_per_embedding
+        assert estimate["total_bytes"] == bytes_per_embedding * 10
+
     def test_load_default_models_openai_specifics(self, manager):
         """Test that OpenAI models are loaded with correct configurations."""
         # Test text-embedding-3-small
@@ -551,3 +572,18 @@ class TestDimensionManager:
         small_vector = [1, 2]
         result = manager.normalize_vector(small_vector, 5)
         assert result == [1, 2, 0.0, 0.0, 0.0]
+
+
+class TestStoragePrecision:
+    """Test StoragePrecision lookups."""
+
+    def test_from_name(self):
+        assert StoragePrecision.from_name("int8") is StoragePrecision.INT8
+
+    def test_from_name_unknown(self):
+        with pytest.raises(ValueError, match="Unknown embedding storage precision"):
+            StoragePrecision.from_name("bfloat16")
+
+    def test_from_code(self):
+        assert StoragePrecision.from_code(1) is StoragePrecision.FLOAT16
+        assert StoragePrecision.from_code(9) is None
@@ -894,6 +894,39 @@ class TestEmbeddingPipeline:
         results = await pipeline.generate_batch([])
         assert results == []
 
+    @pytest.mark.asyncio
+    async def test_generate_combined_skips_cached_and_duplicates(
+        self, pipeline, mock_llm_client
+    ):
+        """Test combined generation sends each uncached text once."""
+        pipeline.cache.put("cached", "test-model", [0.5, 0.25])
+
+        with patch.object(pipeline.batch_processor, "process_combined") as mock_process:
+            mock_process.return_value = [
+                MagicMock(id="0", embedding=[0.1, 0.2], error=None),
+                MagicMock(id="1", embedding=[0.3, 0.4], error=None),
+            ]
+
+            results = await pipeline.generate_combined(
+                ["First", "cached", "second", "FIRST"]
+            )
+
+            assert results == [[0.1, 0.2], [0.5, 0.25], [0.3, 0.4], [0.1, 0.2]]
+            items = mock_process.call_args.args[0]
+            assert [item.text for item in items] == ["first", "second"]
+            assert pipeline.cache.get("second", "test-model") is not None
+
+    @pytest.mark.asyncio
+    async def test_generate_combined_failure(self, pipeline, mock_llm_client):
+        """Test combined generation fails as a whole."""
+        with patch.object(pipeline.batch_processor, "process_combined") as mock_process:
+            mock_process.return_value = [
+                MagicMock(id="0", embedding=None, error="Rate limited"),
+            ]
+
+            with pytest.raises(ValueError, match="Rate limited"):
+                await pipeline.generate_combined(["text"])
+
     @pytest.mark.asyncio
     async def test_generate_for_scenes(self, pipeline, mock_llm_client):
         """Test scene-specific embedding generation."""
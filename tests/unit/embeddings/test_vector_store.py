@@ -7,6 +7,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 
+from scriptrag.embeddings.dimensions import StoragePrecision
 from scriptrag.embeddings.vector_store import (
     BinaryEmbeddingSerializer,
     GitLFSVectorStore,
@@ -251,6 +252,80 @@ class TestBinaryEmbeddingSerializer:
         assert pytest.approx(value) == 1.0
 
 
+class TestQuantisedSerialization:
+    """Test float16 and int8 storage precisions."""
+
+    @pytest.fixture
+    def embedding(self):
+        rng = np.random.default_rng(0)
+        return rng.normal(scale=0.05, size=1536).tolist()
+
+    @pytest.mark.parametrize(
+        ("precision", "size", "tolerance"),
+        [("float16", 4 + 1536 * 2, 1e-4), ("int8", 8 + 1536, 2e-3)],
+    )
+    def test_round_trip(self, embedding, precision, size, tolerance):
+        serializer = BinaryEmbeddingSerializer(precision)
+
+        encoded = serializer.encode(embedding)
+        decoded = serializer.decode(encoded)
+
+        assert len(encoded) == size
+        np.testing.assert_allclose(decoded, embedding, atol=tolerance)
+
+    def test_int8_zero_vector(self):
+        serializer = BinaryEmbeddingSerializer(StoragePrecision.INT8)
+
+        assert serializer.decode(serializer.encode([0.0, 0.0])) == [0.0, 0.0]
+
+    def test_any_precision_decodes_every_format(self, embedding):
+        float32 = BinaryEmbeddingSerializer().encode(embedding)
+        int8 = BinaryEmbeddingSerializer("int8").encode(embedding)
+
+        reader = BinaryEmbeddingSerializer("float16")
+
+        np.testing.assert_allclose(reader.decode(float32), embedding, rtol=1e-6)
+        np.testing.assert_allclose(reader.decode(int8), embedding, atol=2e-3)
+
+    def test_float32_format_is_unchanged(self):
+        encoded = BinaryEmbeddingSerializer("float32").encode([0.5, 0.25])
+        assert encoded == struct.pack("<I2f", 2, 0.5, 0.25)
+
+    def test_truncated_quantised_data_raises(self, embedding):
+        encoded = BinaryEmbeddingSerializer("int8").encode(embedding)
+        with pytest.raises(ValueError, match="size mismatch"):
+            BinaryEmbeddingSerializer().decode(encoded[:-1])
+
+    def test_unknown_precision_raises(self):
+        with pytest.raises(ValueError, match="Unknown embedding storage precision"):
+            BinaryEmbeddingSerializer("int4")
+
+    @pytest.mark.parametrize("precision", ["float32", "float16", "int8"])
+    def test_approximate_similarities(self, precision):
+        rng = np.random.default_rng(1)
+        vectors = rng.normal(size=(50, 64))
+        query = rng.normal(size=64)
+        serializer = BinaryEmbeddingSerializer(precision)
+
+        scores = serializer.approximate_similarities(
+            [serializer.encode(v.tolist()) for v in vectors], query.tolist()
+        )
+
+        exact = (
+            vectors @ query / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+        )
+        np.testing.assert_allclose(scores, exact, atol=0.02)
+
+    def test_approximate_similarities_marks_unscorable_blobs(self):
+        serializer = BinaryEmbeddingSerializer()
+        blobs = [serializer.encode([1.0, 0.0]), b"bad", serializer.encode([1.0])]
+
+        scores = serializer.approximate_similarities(blobs, [1.0, 0.0])
+
+        assert scores[0] == pytest.approx(1.0)
+        assert np.isnan(scores[1:]).all()
+
+
 class MockVectorStore(VectorStore):
     """Mock implementation of VectorStore for testing."""
 
@@ -320,7 +320,7 @@ class TestSearchEngine:
         # Mock semantic adapter to prevent actual async operations
         from unittest.mock import AsyncMock
 
-        engine.semantic_adapter.enhance_results_with_semantic_search = AsyncMock(
+        engine.semantic_adapter.search_semantic = AsyncMock(
             return_value=(
                 [],
                 [],
@@ -655,9 +655,9 @@ class TestSearchEngine:
 
             # Mock semantic adapter to return semantic results
             with patch.object(
-                engine.semantic_adapter, "enhance_results_with_semantic_search"
-            ) as mock_enhance:
-                mock_enhance.return_value = (
+                engine.semantic_adapter, "search_semantic"
+            ) as mock_semantic:
+                mock_semantic.return_value = (
                     [],
                     [semantic_bible_result_duplicate, semantic_bible_result_new],
                 )
@@ -706,10 +706,8 @@ class TestSearchEngine:
 
         # Mock semantic adapter to raise exception
         test_exception = RuntimeError("Semantic search failed")
-        with patch.object(
-            engine.semantic_adapter, "enhance_results_with_semantic_search"
-        ) as mock_enhance:
-            mock_enhance.side_effect = test_exception
+        with patch.object(engine.semantic_adapter, "search_semantic") as mock_semantic:
+            mock_semantic.side_effect = test_exception
 
             engine.db_path = engine.settings.database_path
             query = SearchQuery(
@@ -0,0 +1,233 @@
+"""Test concurrent search legs and per-leg timeouts in the search engine."""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scriptrag.config import ScriptRAGSettings
+from scriptrag.search.engine import SearchEngine
+from scriptrag.search.models import (
+    BibleSearchResult,
+    SearchMode,
+    SearchQuery,
+    SearchResult,
+)
+
+
+def _scene(scene_id: int, match_type: str = "text") -> SearchResult:
+    return SearchResult(
+        script_id=1,
+        script_title="Test Script",
+        script_author="Test Author",
+        scene_id=scene_id,
+        scene_number=scene_id,
+        scene_heading=f"INT. ROOM {scene_id} - DAY",
+        scene_location=f"ROOM {scene_id}",
+        scene_time="DAY",
+        scene_content="The room.",
+        match_type=match_type,
+    )
+
+
+def _chunk(chunk_id: int) -> BibleSearchResult:
+    return BibleSearchResult(
+        script_id=1,
+        script_title="Test Script",
+        bible_id=1,
+        bible_title="Bible",
+        chunk_id=chunk_id,
+        chunk_heading="Characters",
+        chunk_level=1,
+        chunk_content="Character notes.",
+    )
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> SearchEngine:
+    """Create a search engine with a short leg timeout and no result cache."""
+    db_path = tmp_path / "test.db"
+    db_path.touch()
+    settings = ScriptRAGSettings(
+        database_path=db_path, search_leg_timeout=0.2, result_cache_size=0
+    )
+    return SearchEngine(settings)
+
+
+@pytest.fixture
+def query() -> SearchQuery:
+    """Create a query that needs the semantic and bible legs."""
+    return SearchQuery(
+        raw_query="room",
+        text_query="room",
+        include_bible=True,
+        mode=SearchMode.FUZZY,
+    )
+
+
+class TestConcurrentLegs:
+    """Test that independent search legs overlap."""
+
+    @pytest.mark.asyncio
+    async def test_semantic_leg_runs_while_sql_leg_runs(self, engine, query):
+        semantic_started = threading.Event()
+
+        def search_scenes(_query):
+            # Fails unless the semantic leg started before the SQL leg finished
+            assert semantic_started.wait(timeout=5)
+            return [_scene(1)], 1
+
+        async def search_semantic(_query, _limit):
+            semantic_started.set()
+            return [_scene(2, "semantic")], []
+
+        with (
+            patch.object(engine, "_search_scenes", side_effect=search_scenes),
+            patch.object(engine, "_search_bible_leg", return_value=([], 0)),
+            patch.object(
+                engine.semantic_adapter, "search_semantic", side_effect=search_semantic
+            ),
+        ):
+            response = await engine.search_async(query)
+
+        assert {r.scene_id for r in response.results} == {1, 2}
+        assert response.search_methods == ["sql", "semantic"]
+
+    @pytest.mark.asyncio
+    async def test_sql_legs_run_in_parallel(self, engine, query):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def search_scenes(_query):
+            barrier.wait()
+            return [_scene(1)], 1
+
+        def search_bible(_query):
+            barrier.wait()
+            return [_chunk(1)], 1
+
+        with (
+            patch.object(engine, "_search_scenes", side_effect=search_scenes),
+            patch.object(engine, "_search_bible_leg", side_effect=search_bible),
+            patch.object(
+                engine.semantic_adapter, "search_semantic", return_value=([], [])
+            ),
+        ):
+            response = await engine.search_async(query)
+
+        assert len(response.results) == 1
+        assert len(response.bible_results) == 1
+
+
+class TestLegTimeouts:
+    """Test that slow legs degrade to SQL-only results."""
+
+    @pytest.mark.asyncio
+    async def test_slow_semantic_leg_is_dropped(self, engine, query):
+        async def slow_semantic(_query, _limit):
+            await asyncio.sleep(5)
+            return [_scene(2, "semantic")], []
+
+        with (
+            patch.object(engine, "_search_scenes", return_value=([_scene(1)], 1)),
+            patch.object(engine, "_search_bible_leg", return_value=([_chunk(1)], 1)),
+            patch.object(
+                engine.semantic_adapter, "search_semantic", side_effect=slow_semantic
+            ),
+        ):
+            start = time.monotonic()
+            response = await engine.search_async(query)
+            elapsed = time.monotonic() - start
+
+        assert elapsed < 2
+        assert [r.scene_id for r in response.results] == [1]
+        assert len(response.bible_results) == 1
+        assert "semantic" in response.search_methods
+
+    @pytest.mark.asyncio
+    async def test_slow_bible_leg_is_dropped(self, engine, query):
+        release = threading.Event()
+
+        def slow_bible(_query):
+            release.wait(timeout=5)
+            return [_chunk(1)], 1
+
+        with (
+            patch.object(engine, "_search_scenes", return_value=([_scene(1)], 1)),
+            patch.object(engine, "_search_bible_leg", side_effect=slow_bible),
+            patch.object(
+                engine.semantic_adapter, "search_semantic", return_value=([], [])
+            ),
+        ):
+            try:
+                response = await engine.search_async(query)
+            finally:
+                release.set()
+
+        assert [r.scene_id for r in response.results] == [1]
+        assert response.bible_results == []
+        assert response.bible_total_count == 0
+
+    @pytest.mark.asyncio
+    async def test_degraded_response_is_not_cached(self, engine, query):
+        engine.settings.result_cache_size = 8
+
+        async def slow_semantic(_query, _limit):
+            await asyncio.sleep(5)
+            return [], []
+
+        with (
+            patch.object(engine, "_search_scenes", return_value=([_scene(1)], 1)),
+            patch.object(engine, "_search_bible_leg", return_value=([], 0)),
+            patch.object(
+                engine.semantic_adapter, "search_semantic", side_effect=slow_semantic
+            ),
+            patch("scriptrag.search.engine.get_database_generation", return_value=1),
+        ):
+            await engine.search_async(query)
+
+        assert engine.result_cache.get(engine._cache_key(query), 1) == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_scene_leg_errors_propagate(self, engine, query):
+        with (
+            patch.object(
+                engine, "_search_scenes", side_effect=RuntimeError("database locked")
+            ),
+            patch.object(engine, "_search_bible_leg", return_value=([], 0)),
+            patch.object(
+                engine.semantic_adapter, "search_semantic", return_value=([], [])
+            ),
+            pytest.raises(RuntimeError, match="database locked"),
+        ):
+            await engine.search_async(query)
+
+
+class TestFusion:
+    """Test fusion of the lexical and semantic legs."""
+
+    @pytest.mark.asyncio
+    async def test_semantic_results_are_fused_by_rank(self, engine, query):
+        query.limit = 3
+        lexical = [_scene(1), _scene(2), _scene(3)]
+        semantic = [_scene(4, "semantic"), _scene(2, "semantic")]
+        semantic[0].relevance_score = 0.99
+
+        with (
+            patch.object(engine, "_search_scenes", return_value=(lexical, 3)),
+            patch.object(engine, "_search_bible_leg", return_value=([], 0)),
+            patch.object(
+                engine.semantic_adapter,
+                "search_semantic",
+                return_value=(semantic, []),
+            ),
+        ):
+            response = await engine.search_async(query)
+
+        # Scene 2 is found by both legs; the fused list is cut to the limit
+        assert len(response.results) == 3
+        assert response.results[0].scene_id == 2
+        assert response.results[0].match_type == "text"
+        assert 4 in {r.scene_id for r in response.results}
@@ -368,6 +368,31 @@ class TestAnalyzeCommandBranchCoverage:
         assert analyzer.cleaned_up
         assert result.files[0].updated
 
+    @pytest.mark.asyncio
+    async def test_warm_analyzers_are_kept_until_closed(self, temp_fountain_file):
+        """Warmed-up analyzers are not cleaned up between analyze runs."""
+
+        class AnalyzerWithLifecycle(BaseSceneAnalyzer):
+            name = "lifecycle"
+            cleanups = 0
+
+            async def analyze(self, _scene: dict) -> dict:
+                return {}
+
+            async def cleanup(self):
+                self.cleanups += 1
+
+        analyzer = AnalyzerWithLifecycle()
+        cmd = AnalyzeCommand(analyzers=[analyzer])
+
+        await cmd.warm_up()
+        await cmd.analyze(path=temp_fountain_file, recursive=False, force=True)
+        await cmd.analyze(path=temp_fountain_file, recursive=False, force=True)
+        assert analyzer.cleanups == 0
+
+        await cmd.close()
+        assert analyzer.cleanups == 1
+
     @pytest.mark.asyncio
     async def test_analyzer_with_version(self, temp_fountain_file):
         """Test analyzer with version attribute."""
@@ -1005,3 +1005,88 @@ class TestIndexCommandMissingCoverage:
         )
         assert result.indexed is True
         assert result.updated is True
+
+
+class TestIndexFiles:
+    """Test indexing a batch of files in one transaction."""
+
+    @pytest.fixture
+    def db_settings(self, settings):
+        """Settings for an initialized database."""
+        from scriptrag.api.database import DatabaseInitializer
+        from scriptrag.database.connection_manager import close_connection_manager
+
+        close_connection_manager()
+        DatabaseInitializer().initialize_database(settings=settings, force=True)
+        yield settings
+        close_connection_manager()
+
+    @pytest.fixture
+    def scripts(self, tmp_path):
+        """Two small Fountain files."""
+        paths = []
+        for name in ("first", "second"):
+            path = tmp_path / f"{name}.fountain"
+            path.write_text(
+                f"Title: {name.title()}\n\nINT. OFFICE - DAY\n\nALICE\nGood morning.\n",
+                encoding="utf-8",
+            )
+            paths.append(path)
+        return paths
+
+    @staticmethod
+    def _titles(settings):
+        import sqlite3
+
+        conn = sqlite3.connect(settings.database_path)
+        try:
+            return {row[0] for row in conn.execute("SELECT title FROM scripts")}
+        finally:
+            conn.close()
+
+    @pytest.mark.asyncio
+    async def test_indexes_batch_in_one_transaction(self, db_settings, scripts):
+        """All files are written inside a single transaction."""
+        cmd = IndexCommand(settings=db_settings)
+
+        with patch.object(
+            cmd.db_ops, "transaction", wraps=cmd.db_ops.transaction
+        ) as transaction:
+            result = await cmd.index_files(scripts)
+
+        assert [script.indexed for script in result.scripts] == [True, True]
+        assert result.errors == []
+        assert transaction.call_count == 1
+        assert self._titles(db_settings) == {"First", "Second"}
+
+    @pytest.mark.asyncio
+    async def test_failed_script_is_rolled_back_alone(self, db_settings, scripts):
+        """A script failing half-way is rolled back; the others are kept."""
+        cmd = IndexCommand(settings=db_settings)
+        write_script = cmd._write_script
+
+        async def fail_second(conn, script, file_path):
+            result = await write_script(conn, script, file_path)
+            if file_path.name == "second.fountain":
+                raise DatabaseError("disk full")
+            return result
+
+        with patch.object(cmd, "_write_script", side_effect=fail_second):
+            result = await cmd.index_files(scripts)
+
+        assert [script.indexed for script in result.scripts] == [True, False]
+        assert "disk full" in result.scripts[1].error
+        assert len(result.errors) == 1
+        assert self._titles(db_settings) == {"First"}
+
+    @pytest.mark.asyncio
+    async def test_no_database(self, settings, mock_db_ops, scripts):
+        """Nothing is indexed without a database."""
+        mock_db_ops.check_database_exists.return_value = False
+        cmd = IndexCommand(settings=settings, db_ops=mock_db_ops)
+
+        result = await cmd.index_files(scripts)
+
+        assert result.scripts == []
+        assert "Database not initialized" in result.errors[0]
+        mock_db_ops.transaction.assert_not_called()
@@ -9,6 +9,7 @@ These tests achieve 99%+ coverage by testing all aspects of the CLI application:
 
 from unittest.mock import patch
 
+import click
 import pytest
 import typer
 from typer.testing import CliRunner
@@ -16,6 +17,13 @@ from typer.testing import CliRunner
 from scriptrag.cli.main import app, main
 
 
+def _resolved_commands() -> dict[str, click.Command | None]:
+    """Resolve every root command through the lazily loading Click group."""
+    group = typer.main.get_command(app)
+    ctx = click.Context(group)
+    return {name: group.get_command(ctx, name) for name in group.list_commands(ctx)}
+
+
 class TestCLIAppConfiguration:
     """Test the CLI Typer application configuration and metadata."""
 
@@ -99,11 +107,8 @@ class TestCommandRegistration:
 
     def test_command_registration_order(self):
         """Test that commands are registered in the expected order."""
-        # Get the registered commands list
-        commands = app.registered_commands
-
-        # Extract command names
-        command_names = {cmd.name for cmd in commands}
+        # Get the command names exposed by the root group
+        command_names = set(_resolved_commands())
 
         # Verify all expected commands exist
         expected_commands = {"init", "list", "ls", "analyze", "index", "search"}
@@ -251,25 +256,23 @@ class TestCommandBinding:
 
     def test_init_command_bound(self):
         """Test that init command is properly bound."""
-        commands = app.registered_commands
-        command_names = [cmd.name for cmd in commands]
-        assert "init" in command_names
+        commands = _resolved_commands()
+        assert "init" in commands
 
         # Find the init command and verify it has a callback
-        init_cmd = next((cmd for cmd in commands if cmd.name == "init"), None)
+        init_cmd = commands["init"]
         assert init_cmd is not None
         assert init_cmd.callback is not None
 
     def test_list_command_bound(self):
         """Test that list command is properly bound."""
-        commands = app.registered_commands
-        command_names = [cmd.name for cmd in commands]
-        assert "list" in command_names
-        assert "ls" in command_names  # Alias should also exist
+        commands = _resolved_commands()
+        assert "list" in commands
+        assert "ls" in commands  # Alias should also exist
 
         # Find both commands and verify they have callbacks
-        list_cmd = next((cmd for cmd in commands if cmd.name == "list"), None)
-        ls_cmd = next((cmd for cmd in commands if cmd.name == "ls"), None)
+        list_cmd = commands["list"]
+        ls_cmd = commands["ls"]
         assert list_cmd is not None
         assert ls_cmd is not None
         assert list_cmd.callback is not None
@@ -277,31 +280,28 @@ class TestCommandBinding:
 
     def test_analyze_command_bound(self):
         """Test that analyze command is properly bound."""
-        commands = app.registered_commands
-        command_names = [cmd.name for cmd in commands]
-        assert "analyze" in command_names
+        commands = _resolved_commands()
+        assert "analyze" in commands
 
-        analyze_cmd = next((cmd for cmd in commands if cmd.name == "analyze"), None)
+        analyze_cmd = commands["analyze"]
         assert analyze_cmd is not None
         assert analyze_cmd.callback is not None
 
     def test_index_command_bound(self):
         """Test that index command is properly bound."""
-        commands = app.registered_commands
-        command_names = [cmd.name for cmd in commands]
-        assert "index" in command_names
+        commands = _resolved_commands()
+        assert "index" in commands
 
-        index_cmd = next((cmd for cmd in commands if cmd.name == "index"), None)
+        index_cmd = commands["index"]
         assert index_cmd is not None
         assert index_cmd.callback is not None
 
     def test_search_command_bound(self):
         """Test that search command is properly bound."""
-        commands = app.registered_commands
-        command_names = [cmd.name for cmd in commands]
-        assert "search" in command_names
+        commands = _resolved_commands()
+        assert "search" in commands
 
-        search_cmd = next((cmd for cmd in commands if cmd.name == "search"), None)
+        search_cmd = commands["search"]
         assert search_cmd is not None
         assert search_cmd.callback is not None
 
@@ -357,14 +357,15 @@ class TestModuleLevelConstants:
 
     def test_command_count(self):
         """Test that the expected number of commands are registered."""
-        commands = app.registered_commands
+        commands = _resolved_commands()
 
-        # Should have exactly 11 commands including init, list, ls alias,
-        # analyze, index, pull, search, watch, mcp, config, scene and query subapps
-        expected_count = 11
+        # Should have exactly 14 commands: init, index, list, ls alias, search,
+        # analyze, watch, pull, mcp, status, version and the config, query and
+        # scene subapps
+        expected_count = 14
         actual_count = len(commands)
 
-        command_names = [c.name for c in commands if hasattr(c, "name")]
+        command_names = list(commands)
 
         assert actual_count == expected_count, (
             f"Expected {expected_count} commands, found {actual_count}: {command_names}"
@@ -1,13 +1,15 @@
 """Unit tests for the file watcher utility."""
 
 import threading
-import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from watchdog.events import FileSystemEvent
+from watchdog.events import FileMovedEvent, FileSystemEvent
 
+from scriptrag.api.analyze import AnalyzeCommand
+from scriptrag.api.analyze_results import AnalyzeResult
+from scriptrag.api.index import IndexCommand, IndexOperationResult, IndexResult
 from scriptrag.cli.utils.file_watcher import FountainFileHandler, StatusCallback
 from scriptrag.config.settings import ScriptRAGSettings
 
@@ -53,11 +55,10 @@ class TestFountainFileHandler:
         assert handler.force is False
         assert handler.batch_size == 5
         assert handler.callback == mock_callback
-        assert handler.event_queue.maxsize == 10  # Check queue's maxsize instead
+        assert handler.max_queue_size == 10
         assert handler.batch_timeout == 1.0
-        assert handler.debounce_seconds == 2.0
-        assert len(handler.processing) == 0
-        assert len(handler.last_processed) == 0
+        assert len(handler.pending) == 0
+        assert len(handler.content_hashes) == 0
 
     def test_should_process_valid_fountain_file(self, handler):
         """Test should_process returns True for valid Fountain files."""
@@ -78,31 +79,6 @@ class TestFountainFileHandler:
         path = Path("/test/script.pdf")
         assert handler.should_process(path) is False
 
-    def test_should_process_already_processing(self, handler):
-        """Test should_process returns False for files being processed."""
-        path = Path("/test/script.fountain")
-        handler.processing.add(str(path))
-        assert handler.should_process(path) is False
-
-    def test_should_process_debounce(self, handler):
-        """Test should_process respects debounce timing."""
-        path = Path("/test/script.fountain")
-
-        # First check should return True
-        assert handler.should_process(path) is True
-
-        # Mark as recently processed
-        current_time = time.time()
-        handler.last_processed[str(path)] = current_time
-
-        # Immediate check should return False due to debounce
-        assert handler.should_process(path) is False
-
-        # Mock time to simulate debounce period passing
-        with patch("scriptrag.cli.utils.file_watcher.time.time") as mock_time:
-            mock_time.return_value = current_time + 3  # 3 seconds later
-            assert handler.should_process(path) is True
-
     def test_on_modified_with_valid_file(self, handler):
         """Test on_modified handles valid file events."""
         event = MagicMock(spec=FileSystemEvent)
@@ -137,20 +113,37 @@ class TestFountainFileHandler:
         """Test _queue_file adds files to the event queue."""
         path = Path("/test/script.fountain")
         handler._queue_file(path)
-        assert handler.event_queue.qsize() == 1
-        assert handler.event_queue.get_nowait() == path
-
-    def test_queue_file_handles_full_queue(self, handler):
-        """Test _queue_file handles full queue gracefully."""
-        # Fill the queue
-        for i in range(handler.event_queue.maxsize):
-            handler.event_queue.put(Path(f"/test/script{i}.fountain"))
-
-        # Try to add one more
-        with patch("scriptrag.cli.utils.file_watcher.logger") as mock_logger:
-            path = Path("/test/overflow.fountain")
+        assert list(handler.pending.values()) == [path]
+
+    def test_queue_file_coalesces_events(self, handler):
+        """Repeated events for one file keep a single queue entry."""
+        first = Path("/test/first.fountain")
+        second = Path("/test/second.fountain")
+
+        for path in (first, second, first, first):
             handler._queue_file(path)
-            mock_logger.warning.assert_called_once()
+
+        assert list(handler.pending.values()) == [first, second]
+
+    def test_queue_file_never_drops_events(self, handler):
+        """Events beyond max_queue_size are kept rather than dropped."""
+        paths = [Path(f"/test/script{i}.fountain") for i in range(15)]
+
+        for path in paths:
+            handler._queue_file(path)
+
+        assert list(handler.pending.values()) == paths
+
+    def test_on_moved_queues_destination(self, handler):
+        """Files saved by renaming a temporary file are queued."""
+        event = MagicMock(spec=FileMovedEvent)
+        event.is_directory = False
+        event.src_path = "/test/.script.fountain.tmp"
+        event.dest_path = "/test/script.fountain"
+
+        with patch.object(handler, "_queue_file") as mock_queue:
+            handler.on_moved(event)
+            mock_queue.assert_called_once_with(Path("/test/script.fountain"))
 
     def test_start_stop_processing(self, handler):
         """Test starting and stopping the processor thread."""
@@ -163,276 +156,6 @@ class TestFountainFileHandler:
         handler.stop_processing(timeout=2.0)
         assert handler.shutdown_event.is_set()
 
-    def test_process_batch_deduplicates_paths(self, handler):
-        """Test _process_batch deduplicates paths."""
-        paths = [
-            Path("/test/script1.fountain"),
-            Path("/test/script2.fountain"),
-            Path("/test/script1.fountain"),  # Duplicate
-        ]
-
-        with patch.object(handler, "_process_file_sync") as mock_process:
-            handler._process_batch(paths)
-            # Should only process 2 unique files
-            assert mock_process.call_count == 2
-
-    def test_process_file_sync_success(self, handler, mock_callback):
-        """Test _process_file_sync handles successful processing."""
-        path = Path("/test/script.fountain")
-
-        with patch("scriptrag.cli.utils.file_watcher.asyncio") as mock_asyncio:
-            mock_loop = MagicMock()
-            mock_loop.run_until_complete = MagicMock(return_value=None)
-            mock_asyncio.new_event_loop.return_value = mock_loop
-
-            # Mock successful completion
-            mock_loop.run_until_complete.return_value = None
-
-            handler._process_file_sync(path)
-
-            # Verify callbacks
-            assert mock_callback.call_count == 2
-            mock_callback.assert_any_call("processing", path)
-            mock_callback.assert_any_call("completed", path)
-
-    def test_process_file_sync_error(self, handler, mock_callback):
-        """Test _process_file_sync handles errors."""
-        path = Path("/test/script.fountain")
-        error_msg = "Test error"
-
-        with patch.object(handler, "_pull_single_file") as mock_pull:
-            mock_pull.side_effect = Exception(error_msg)
-
-            handler._process_file_sync(path)
-
-            # Verify error callback
-            mock_callback.assert_any_call("error", path, error_msg)
-
-    @pytest.mark.asyncio
-    async def test_pull_single_file_with_existing_db(self, handler):
-        """Test _pull_single_file with existing database."""
-        path = Path("/test/script.fountain")
-
-        with (
-            patch("scriptrag.cli.utils.file_watcher.DatabaseOperations") as mock_db_ops,
-            patch("scriptrag.cli.utils.file_watcher.AnalyzeCommand") as mock_analyze,
-            patch("scriptrag.cli.utils.file_watcher.IndexCommand") as mock_index,
-        ):
-            # Setup mocks
-            db_ops = MagicMock()
-            db_ops.check_database_exists = MagicMock(return_value=True)
-            mock_db_ops.return_value = db_ops
-
-            analyze_cmd = MagicMock(spec=["content", "model", "provider", "usage"])
-            analyze_cmd.analyze = AsyncMock(
-                spec=["complete", "cleanup", "embed", "list_models", "is_available"]
-            )
-            mock_analyze.from_config.return_value = analyze_cmd
-
-            index_cmd = MagicMock(spec=["content", "model", "provider", "usage"])
-            index_cmd.index = AsyncMock(
-                spec=["complete", "cleanup", "embed", "list_models", "is_available"]
-            )
-            mock_index.from_config.return_value = index_cmd
-
-            # Run
-            await handler._pull_single_file(path)
-
-            # Verify database was not initialized
-            db_ops.check_database_exists.assert_called_once()
-
-            # Verify analyze and index were called with the specific file
-            analyze_cmd.analyze.assert_called_once_with(
-                path=path,
-                recursive=False,
-                force=handler.force,
-                dry_run=False,
-            )
-            index_cmd.index.assert_called_once_with(
-                path=path,
-                recursive=False,
-                dry_run=False,
-                batch_size=1,
-            )
-
-    @pytest.mark.asyncio
-    async def test_pull_single_file_initializes_db(self, handler):
-        """Test _pull_single_file initializes database if missing."""
-        path = Path("/test/script.fountain")
-
-        with (
-            patch("scriptrag.cli.utils.file_watcher.DatabaseOperations") as mock_db_ops,
-            patch("scriptrag.api.DatabaseInitializer") as mock_init,
-            patch("scriptrag.cli.utils.file_watcher.AnalyzeCommand") as mock_analyze,
-            patch("scriptrag.cli.utils.file_watcher.IndexCommand") as mock_index,
-        ):
-            # Setup mocks
-            db_ops = MagicMock()
-            db_ops.check_database_exists = MagicMock(return_value=False)
-            mock_db_ops.return_value = db_ops
-
-            initializer = MagicMock()
-            initializer.initialize_database = MagicMock()
-            mock_init.return_value = initializer
-
-            analyze_cmd = MagicMock(spec=["content", "model", "provider", "usage"])
-            analyze_cmd.analyze = AsyncMock(
-                spec=["complete", "cleanup", "embed", "list_models", "is_available"]
-            )
-            mock_analyze.from_config.return_value = analyze_cmd
-
-            index_cmd = MagicMock(spec=["content", "model", "provider", "usage"])
-            index_cmd.index = AsyncMock(
-                spec=["complete", "cleanup", "embed", "list_models", "is_available"]
-            )
-            mock_index.from_config.return_value = index_cmd
-
-            # Run
-            await handler._pull_single_file(path)
-
-            # Verify database was initialized
-            initializer.initialize_database.assert_called_once()
-
-    def test_process_events_batch_processing(self, handler):
-        """Test _process_events processes batches correctly."""
-        # Add files to queue
-        paths = [Path(f"/test/script{i}.fountain") for i in range(3)]
-        for path in paths:
-            handler.event_queue.put(path)
-
-        with patch.object(handler, "_process_batch") as mock_process:
-            # Set shutdown after a short time
-            def shutdown_after_delay():
-                time.sleep(0.5)
-                handler.shutdown_event.set()
-
-            shutdown_thread = threading.Thread(target=shutdown_after_delay)
-            shutdown_thread.start()
-
-            # Run process events
-            handler._process_events()
-
-            # Verify batch was processed
-            mock_process.assert_called()
-            shutdown_thread.join()
-
-    def test_process_events_timeout_processing(self, handler):
-        """Test _process_events processes on timeout."""
-        # Add a single file
-        path = Path("/test/script.fountain")
-        handler.event_queue.put(path)
-
-        # Set very short batch timeout for testing
-        handler.batch_timeout = 0.1
-
-        with patch.object(handler, "_process_batch") as mock_process:
-            # Set shutdown after timeout
-            def shutdown_after_delay():
-                time.sleep(0.3)
-                handler.shutdown_event.set()
-
-            shutdown_thread = threading.Thread(target=shutdown_after_delay)
-            shutdown_thread.start()
-
-            # Run process events
-            handler._process_events()
-
-            # Verify batch was processed due to timeout
-            mock_process.assert_called()
-            shutdown_thread.join()
-
-    def test_process_events_batch_size_trigger(self, handler):
-        """Test _process_events processes when batch size reached."""
-        # Add files equal to batch size
-        paths = [Path(f"/test/script{i}.fountain") for i in range(handler.batch_size)]
-        for path in paths:
-            handler.event_queue.put(path)
-
-        with patch.object(handler, "_process_batch") as mock_process:
-            # Set shutdown immediately after processing
-            def shutdown_after_delay():
-                time.sleep(0.2)
-                handler.shutdown_event.set()
-
-            shutdown_thread = threading.Thread(target=shutdown_after_delay)
-            shutdown_thread.start()
-
-            # Run process events
-            handler._process_events()
-
-            # Verify batch was processed due to size
-            mock_process.assert_called()
-            # Check that the batch had the right size
-            call_args = mock_process.call_args[0][0]
-            assert len(call_args) == handler.batch_size
-            shutdown_thread.join()
-
-    def test_process_events_empty_queue_timeout(self, handler):
-        """Test _process_events handles empty queue with batch timeout."""
-        # Add one file
-        path = Path("/test/script.fountain")
-        handler.event_queue.put(path)
-
-        # Set batch timeout
-        handler.batch_timeout = 0.1
-
-        with patch.object(handler, "_process_batch") as mock_process:
-            with patch("scriptrag.cli.utils.file_watcher.time.time") as mock_time:
-                # Simulate time progression
-                time_values = [0, 0.05, 0.15, 0.2]  # Trigger timeout
-                mock_time.side_effect = time_values + [0.3] * 10
-
-                # Set shutdown after processing
-                def shutdown_after_delay():
-                    time.sleep(0.25)
-                    handler.shutdown_event.set()
-
-                shutdown_thread = threading.Thread(target=shutdown_after_delay)
-                shutdown_thread.start()
-
-                # Run process events
-                handler._process_events()
-
-                # Verify batch was processed on timeout
-                mock_process.assert_called()
-                shutdown_thread.join()
-
-    def test_process_events_shutdown_with_remaining(self, handler):
-        """Test _process_events processes remaining items on shutdown."""
-        # Add files less than batch size
-        paths = [Path(f"/test/script{i}.fountain") for i in range(2)]
-        for path in paths:
-            handler.event_queue.put(path)
-
-        processed_batches = []
-
-        def track_batch(batch):
-            processed_batches.append(batch)
-
-        with patch.object(
-            handler, "_process_batch", side_effect=track_batch
-        ) as mock_process:
-            # Set shutdown after getting items from queue
-            def delayed_shutdown():
-                time.sleep(0.1)  # Allow time to get items from queue
-                handler.shutdown_event.set()
-
-            shutdown_thread = threading.Thread(target=delayed_shutdown)
-            shutdown_thread.start()
-
-            # Run process events
-            handler._process_events()
-
-            shutdown_thread.join()
-
-            # Verify remaining batch was processed
-            assert len(processed_batches) > 0
-            # Check that paths were processed
-            all_processed = []
-            for batch in processed_batches:
-                all_processed.extend(batch)
-            assert len(all_processed) == 2
-
     def test_start_processing_restarts_dead_thread(self, handler):
         """Test start_processing restarts a dead thread."""
         # Create a dead thread
@@ -473,53 +196,6 @@ class TestFountainFileHandler:
         # join should not be called on dead thread
         handler.processor_thread.join.assert_not_called()
 
-    def test_process_batch_with_processing_file(self, handler):
-        """Test _process_batch skips files already being processed."""
-        paths = [
-            Path("/test/script1.fountain"),
-            Path("/test/script2.fountain"),
-        ]
-
-        # Mark script1 as already processing
-        handler.processing.add(str(paths[0]))
-
-        with patch.object(handler, "_process_file_sync") as mock_process:
-            handler._process_batch(paths)
-
-            # Should only process script2
-            assert mock_process.call_count == 1
-            mock_process.assert_called_with(paths[1])
-
-    def test_process_batch_updates_last_processed(self, handler):
-        """Test _process_batch updates last_processed timestamps."""
-        path = Path("/test/script.fountain")
-
-        with patch.object(handler, "_process_file_sync"):
-            with patch("scriptrag.cli.utils.file_watcher.time.time") as mock_time:
-                mock_time.return_value = 12345.0
-
-                handler._process_batch([path])
-
-                # Verify timestamp was updated
-                assert handler.last_processed[str(path)] == 12345.0
-                # Verify file was removed from processing set
-                assert str(path) not in handler.processing
-
-    def test_process_file_sync_no_callback(self, handler):
-        """Test _process_file_sync without callback."""
-        handler.callback = None
-        path = Path("/test/script.fountain")
-
-        with patch("scriptrag.cli.utils.file_watcher.asyncio.run") as mock_run:
-            # Mock successful completion
-            mock_run.return_value = None
-
-            # Should not raise
-            handler._process_file_sync(path)
-
-            # Verify pull was executed via asyncio.run
-            mock_run.assert_called_once()
-
     def test_on_modified_non_fountain_file(self, handler):
         """Test on_modified ignores non-Fountain files."""
         event = MagicMock(spec=FileSystemEvent)
@@ -540,34 +216,242 @@ class TestFountainFileHandler:
             handler.on_created(event)
             mock_queue.assert_not_called()
 
-    def test_process_file_sync_with_pull_error(self, handler, mock_callback):
-        """Test _process_file_sync handles pull errors properly."""
+
+class TestBatching:
+    """Test how pending files are gathered into batches."""
+
+    def test_full_batch_is_returned_without_waiting(self, handler):
+        """A batch is returned as soon as batch_size files are pending."""
+        handler.batch_timeout = 30.0
+        paths = [Path(f"/test/script{i}.fountain") for i in range(7)]
+        for path in paths:
+            handler._queue_file(path)
+
+        assert handler._next_batch() == paths[:5]
+        assert list(handler.pending.values()) == paths[5:]
+
+    def test_partial_batch_is_returned_after_timeout(self, handler):
+        """Fewer files are processed once the batch timeout expires."""
+        handler.batch_timeout = 0.05
+        path = Path("/test/script.fountain")
+        handler._queue_file(path)
+
+        assert handler._next_batch() == [path]
+
+    def test_shutdown_returns_remaining_files(self, handler):
+        """Pending files are returned without waiting once shut down."""
+        handler.batch_timeout = 30.0
         path = Path("/test/script.fountain")
-        error_msg = "Database connection failed"
+        handler._queue_file(path)
+        handler.shutdown_event.set()
 
-        with patch("scriptrag.cli.utils.file_watcher.asyncio.run") as mock_run:
-            # Make asyncio.run raise the exception
-            mock_run.side_effect = Exception(error_msg)
+        assert handler._next_batch() == [path]
+        assert handler._next_batch() == []
 
-            handler._process_file_sync(path)
+    def test_worker_processes_batches_and_closes_commands(self, handler):
+        """The worker processes queued files and releases analyzers on stop."""
+        handler.batch_timeout = 0.05
+        processed = threading.Event()
 
-            # Verify error callback was called
-            assert mock_callback.call_count >= 2
-            calls = [call.args for call in mock_callback.call_args_list]
-            assert ("processing", path) in calls
-            assert ("error", path, error_msg) in calls
+        async def process(paths):
+            processed.set()
 
-    def test_process_batch_exception_handling(self, handler):
-        """Test _process_batch handles exceptions and cleans up properly."""
         path = Path("/test/script.fountain")
+        with (
+            patch.object(handler, "_process_batch", side_effect=process) as batch,
+            patch.object(handler, "_close_commands", new=AsyncMock()) as close,
+        ):
+            handler.start_processing()
+            handler._queue_file(path)
+            assert processed.wait(timeout=5.0)
+            handler.stop_processing(timeout=5.0)
+
+        batch.assert_called_once_with([path])
+        close.assert_awaited_once()
+        assert not handler.processor_thread.is_alive()
+
+
+@pytest.fixture
+def commands(handler):
+    """Analyze and index commands used by the worker."""
+    analyze_cmd = MagicMock(spec=AnalyzeCommand)
+    analyze_cmd.analyze = AsyncMock(return_value=AnalyzeResult())
+    index_cmd = MagicMock(spec=IndexCommand)
+
+    async def index_files(paths):
+        return IndexOperationResult(
+            scripts=[IndexResult(path=path, indexed=True) for path in paths]
+        )
+
+    index_cmd.index_files = AsyncMock(side_effect=index_files)
+    handler._analyze_cmd = analyze_cmd
+    handler._index_cmd = index_cmd
+    return analyze_cmd, index_cmd
+
+
+@pytest.fixture
+def scripts(tmp_path):
+    """Two Fountain files on disk."""
+    paths = [tmp_path / "one.fountain", tmp_path / "two.fountain"]
+    for path in paths:
+        path.write_text("INT. OFFICE - DAY\n\nAlice works.\n", encoding="utf-8")
+    return paths
+
+
+class TestProcessBatch:
+    """Test analyzing and indexing a batch of changed files."""
+
+    @pytest.mark.asyncio
+    async def test_batch_is_analyzed_then_indexed_together(
+        self, handler, mock_callback, commands, scripts
+    ):
+        """Each file is analyzed, then the batch is indexed with one call."""
+        analyze_cmd, index_cmd = commands
+
+        await handler._process_batch(scripts)
+
+        assert [call.kwargs["path"] for call in analyze_cmd.analyze.call_args_list] == (
+            scripts
+        )
+        analyze_cmd.analyze.assert_called_with(
+            path=scripts[1], recursive=False, force=False, dry_run=False
+        )
+        index_cmd.index_files.assert_awaited_once_with(scripts)
+        for path in scripts:
+            mock_callback.assert_any_call("processing", path)
+            mock_callback.assert_any_call("completed", path)
+
+    @pytest.mark.asyncio
+    async def test_own_write_back_does_not_retrigger(self, handler, commands, scripts):
+        """The event for analyze's metadata write-back is ignored."""
+        analyze_cmd, index_cmd = commands
+
+        async def write_metadata(path, **kwargs):
+            path.write_text(
+                path.read_text(encoding="utf-8") + "\n/* SCRIPTRAG-META */\n",
+                encoding="utf-8",
+            )
+            return AnalyzeResult()
+
+        analyze_cmd.analyze.side_effect = write_metadata
+
+        await handler._process_batch(scripts[:1])
+        await handler._process_batch(scripts[:1])
+
+        assert analyze_cmd.analyze.await_count == 1
+        assert index_cmd.index_files.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_edited_file_is_processed_again(self, handler, commands, scripts):
+        """A real edit after processing is picked up."""
+        analyze_cmd, _ = commands
+
+        await handler._process_batch(scripts[:1])
+        scripts[0].write_text("INT. OFFICE - NIGHT\n", encoding="utf-8")
+        await handler._process_batch(scripts[:1])
+
+        assert analyze_cmd.analyze.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_analysis_is_not_indexed(
+        self, handler, mock_callback, commands, scripts
+    ):
+        """A file that fails analysis is reported and left out of the index."""
+        analyze_cmd, index_cmd = commands
+        analyze_cmd.analyze.side_effect = [
+            RuntimeError("analyzer crashed"),
+            AnalyzeResult(),
+        ]
+
+        await handler._process_batch(scripts)
+
+        mock_callback.assert_any_call("error", scripts[0], "analyzer crashed")
+        index_cmd.index_files.assert_awaited_once_with(scripts[1:])
+        assert str(scripts[0]) not in handler.content_hashes
+
+    @pytest.mark.asyncio
+    async def test_index_errors_are_reported_per_file(
+        self, handler, mock_callback, commands, scripts
+    ):
+        """A script that fails to index is reported and processed again later."""
+        _, index_cmd = commands
+        index_cmd.index_files.side_effect = None
+        index_cmd.index_files.return_value = IndexOperationResult(
+            scripts=[
+                IndexResult(path=scripts[0], indexed=True),
+                IndexResult(path=scripts[1], indexed=False, error="locked"),
+            ],
+            errors=[f"{scripts[1]}: locked"],
+        )
+
+        await handler._process_batch(scripts)
+
+        mock_callback.assert_any_call("completed", scripts[0])
+        mock_callback.assert_any_call("error", scripts[1], "locked")
+        assert set(handler.content_hashes) == {str(scripts[0])}
+
+    @pytest.mark.asyncio
+    async def test_missing_file_is_skipped(self, handler, commands, tmp_path):
+        """Events for files deleted since are ignored."""
+        analyze_cmd, index_cmd = commands
+
+        await handler._process_batch([tmp_path / "gone.fountain"])
+
+        analyze_cmd.analyze.assert_not_called()
+        index_cmd.index_files.assert_not_called()
+
+
+class TestCommands:
+    """Test the worker's long-lived commands."""
+
+    @pytest.fixture
+    def patched(self):
+        """Patch the command and database classes used by the worker."""
+        with (
+            patch("scriptrag.cli.utils.file_watcher.DatabaseOperations") as db_ops,
+            patch("scriptrag.cli.utils.file_watcher.AnalyzeCommand") as analyze,
+            patch("scriptrag.cli.utils.file_watcher.IndexCommand") as index,
+        ):
+            db_ops.return_value.check_database_exists.return_value = True
+            analyze_cmd = analyze.from_config.return_value
+            analyze_cmd.warm_up = AsyncMock()
+            analyze_cmd.close = AsyncMock()
+            yield db_ops, analyze, index
+
+    @pytest.mark.asyncio
+    async def test_commands_are_created_and_warmed_once(self, handler, patched):
+        """Analyzers are loaded and warmed up once for the whole session."""
+        _, analyze, index = patched
+
+        first = await handler._get_commands()
+        second = await handler._get_commands()
+
+        assert first == second
+        analyze.from_config.assert_called_once()
+        analyze.from_config.return_value.warm_up.assert_awaited_once()
+        index.assert_called_once()
+        assert index.call_args.kwargs["settings"] is handler.settings
+
+    @pytest.mark.asyncio
+    async def test_missing_database_is_initialized(self, handler, patched):
+        """The database is created before the first batch if needed."""
+        db_ops, _, _ = patched
+        db_ops.return_value.check_database_exists.return_value = False
+
+        with patch("scriptrag.api.DatabaseInitializer") as initializer:
+            await handler._get_commands()
+
+        initializer.return_value.initialize_database.assert_called_once_with(
+            settings=handler.settings
+        )
+
+    @pytest.mark.asyncio
+    async def test_close_releases_analyzers(self, handler, patched):
+        """Closing the worker cleans up the warmed analyzers."""
+        _, analyze, _ = patched
+        await handler._get_commands()
 
-        # The current implementation doesn't catch exceptions in _process_batch
-        # but uses a finally block to clean up. Let's test that behavior.
-        with patch.object(handler, "_process_file_sync") as mock_process:
-            # Normal execution
-            handler._process_batch([path])
+        await handler._close_commands()
 
-            # Verify file was processed and cleaned up
-            mock_process.assert_called_once_with(path)
-            assert str(path) not in handler.processing
-            assert str(path) in handler.last_processed
+        analyze.from_config.return_value.close.assert_awaited_once()
+        assert handler._analyze_cmd is None
@@ -432,6 +432,57 @@ class TestDatabaseOperations:
             assert rows[0]["action_text"] == "Alice enters the coffee shop."
             assert rows[1]["action_text"] == "Bob waves from his table."
 
+    def test_get_scene_details(self, initialized_db, sample_script):
+        """Test batched lookup of scene and script metadata."""
+        file_path = Path("/test/script.fountain")
+        sample_script.metadata.update({"season": 2, "episode": 5})
+
+        with initialized_db.transaction() as conn:
+            script_id = initialized_db.upsert_script(conn, sample_script, file_path)
+            scene_ids = [
+                initialized_db.upsert_scene(conn, scene, script_id)[0]
+                for scene in sample_script.scenes
+            ]
+
+            details = initialized_db.get_scene_details(conn, [*scene_ids, 9999])
+
+        assert set(details) == set(scene_ids)
+        assert details[scene_ids[1]] == {
+            "scene_number": 2,
+            "time_of_day": "NIGHT",
+            "script_title": "Test Script",
+            "script_author": "Test Author",
+            "season": 2,
+            "episode": 5,
+        }
+
+    def test_get_scene_details_empty(self, initialized_db):
+        """Test that no query is needed for an empty scene list."""
+        with initialized_db.transaction() as conn:
+            assert initialized_db.get_scene_details(conn, []) == {}
+
+    def test_get_scene_candidates(self, initialized_db, sample_script):
+        """Test fetching embedded scenes by ID for rescoring."""
+        file_path = Path("/test/script.fountain")
+
+        with initialized_db.transaction() as conn:
+            script_id = initialized_db.upsert_script(conn, sample_script, file_path)
+            scene_ids = [
+                initialized_db.upsert_scene(conn, scene, script_id)[0]
+                for scene in sample_script.scenes
+            ]
+            initialized_db.upsert_embedding(
+                conn, "scene", scene_ids[0], "test-model", b"embedding"
+            )
+
+            candidates = initialized_db.get_scene_candidates(
+                conn, [*scene_ids, 9999], "test-model"
+            )
+
+        assert [c["id"] for c in candidates] == [scene_ids[0]]
+        assert candidates[0]["_embedding"] == b"embedding"
+        assert "embedding" not in candidates[0]
+
     def test_clear_scene_content(self, initialized_db, sample_script):
         """Test clearing scene content."""
         file_path = Path("/test/script.fountain")
@@ -54,6 +54,22 @@ class TestEmbeddingService:
         assert service.default_model == "text-embedding-3-small"
         assert service.embedding_dimensions == 1536
 
+    def test_storage_precision_from_settings(self, mock_llm_client, tmp_path):
+        """Test that the configured precision is used for database storage."""
+        settings = ScriptRAGSettings(embedding_storage_precision="int8")
+        service = EmbeddingService(
+            settings, llm_client=mock_llm_client, cache_dir=tmp_path / "cache"
+        )
+        embedding = [0.5, -0.25, 0.125]
+
+        encoded = service.encode_embedding_for_db(embedding)
+
+        assert len(encoded) == 4 + 4 + 3
+        np.testing.assert_allclose(
+            service.decode_embedding_from_db(encoded), embedding, atol=0.005
+        )
+        assert service.lfs_store.dtype == np.float16
+
     def test_cache_key_generation(self, embedding_service):
         """Test cache key generation."""
         key1 = embedding_service.cache._get_cache_key("test text", "model-1")
@@ -1,11 +1,14 @@
 """Unit tests for FountainParser."""
 
+import os
+import stat
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from scriptrag.parser import FountainParser
+from scriptrag.parser import FountainParser, SourceSpan
+from scriptrag.parser.fountain_processor import locate_scene_spans
 
 # Path to fixture files
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "fountain" / "test_data"
@@ -1156,3 +1159,154 @@ comment */
         # Should only have one scene (the one with header)
         assert len(scenes) == 1
         assert scenes[0].heading == "INT. ROOM - DAY"
+
+
+class TestSceneSpans:
+    """Test that scenes carry their exact location in the source."""
+
+    CONTENT = """Title: Spans
+
+FADE IN:
+
+INT. KITCHEN - NIGHT
+
+Bob eats.
+
+/* SCRIPTRAG-META-START
+{"analyzed": true}
+SCRIPTRAG-META-END */
+
+.FLASHBACK
+
+Stuff.
+
+INT. KITCHEN - NIGHT
+
+More.
+/* INT. KITCHEN - NIGHT */
+
+EXT. PARK - DAY
+
+Words.
+"""
+
+    @pytest.fixture
+    def scenes(self):
+        return FountainParser().parse(self.CONTENT).scenes
+
+    def test_spans_slice_original_text(self, scenes):
+        assert [scene.heading for scene in scenes] == [
+            "INT. KITCHEN - NIGHT",
+            "FLASHBACK",
+            "INT. KITCHEN - NIGHT",
+            "EXT. PARK - DAY",
+        ]
+        for scene in scenes:
+            span = scene.span
+            assert span is not None
+            assert self.CONTENT[span.start : span.end] == scene.original_text
+
+    def test_repeated_heading_gets_its_own_scene(self, scenes):
+        first, _, repeat, _ = scenes
+
+        assert first.boneyard_metadata == {"analyzed": True}
+        assert "Bob eats." in first.original_text
+        assert "More." in repeat.original_text
+        assert "Bob eats." not in repeat.original_text
+        assert repeat.boneyard_metadata is None
+        assert first.content_hash != repeat.content_hash
+
+    def test_line_numbers(self, scenes):
+        assert [(s.span.start_line, s.span.end_line) for s in scenes] == [
+            (5, 11),
+            (13, 15),
+            (17, 20),
+            (22, 24),
+        ]
+
+    def test_forced_heading_span_includes_dot(self, scenes):
+        assert scenes[1].original_text == ".FLASHBACK\n\nStuff."
+
+    def test_unmatched_heading_has_no_span(self):
+        spans = locate_scene_spans(
+            "INT. HOUSE - DAY\n\nx\n", ["INT. GONE - DAY", "INT. HOUSE - DAY"]
+        )
+
+        assert spans[0] is None
+        assert spans[1] == SourceSpan(start=0, end=19, start_line=1, end_line=3)
+
+
+class TestBoneyardWriteBack:
+    """Test span-based, atomic boneyard write-back."""
+
+    @pytest.fixture
+    def script_file(self, tmp_path):
+        path = tmp_path / "spans.fountain"
+        path.write_text(TestSceneSpans.CONTENT, encoding="utf-8")
+        return path
+
+    def _update_all(self, parser, path):
+        script = parser.parse_file(path)
+        for scene in script.scenes:
+            scene.update_boneyard({"number": scene.number, "note": "a\\nb"})
+        parser.write_with_updated_scenes(path, script, script.scenes)
+        return script
+
+    def test_metadata_lands_in_each_scene(self, script_file):
+        parser = FountainParser()
+
+        self._update_all(parser, script_file)
+
+        scenes = parser.parse_file(script_file).scenes
+        assert [scene.boneyard_metadata["number"] for scene in scenes] == [1, 2, 3, 4]
+        assert scenes[0].boneyard_metadata["analyzed"] is True
+        assert scenes[0].boneyard_metadata["note"] == "a\\nb"
+        assert [scene.heading for scene in scenes] == [
+            "INT. KITCHEN - NIGHT",
+            "FLASHBACK",
+            "INT. KITCHEN - NIGHT",
+            "EXT. PARK - DAY",
+        ]
+
+    def test_unchanged_file_is_not_rewritten(self, script_file):
+        parser = FountainParser()
+        self._update_all(parser, script_file)
+
+        with patch.object(FountainParser, "_replace_file") as mock_replace:
+            self._update_all(parser, script_file)
+
+        mock_replace.assert_not_called()
+
+    def test_failed_replace_leaves_file_intact(self, script_file):
+        parser = FountainParser()
+
+        with (
+            patch.object(Path, "replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError, match="disk full"),
+        ):
+            self._update_all(parser, script_file)
+
+        assert script_file.read_text(encoding="utf-8") == TestSceneSpans.CONTENT
+        assert list(script_file.parent.iterdir()) == [script_file]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_permissions_are_kept(self, script_file):
+        script_file.chmod(0o640)
+
+        self._update_all(FountainParser(), script_file)
+
+        assert stat.S_IMODE(script_file.stat().st_mode) == 0o640
+
+    def test_stale_span_falls_back_to_scene_text(self, script_file):
+        parser = FountainParser()
+        script = parser.parse_file(script_file)
+        script_file.write_text(
+            "Title: Moved\n\n" + TestSceneSpans.CONTENT, encoding="utf-8"
+        )
+        scene = script.scenes[3]
+        scene.update_boneyard({"moved": True})
+
+        parser.write_with_updated_scenes(script_file, script, [scene])
+
+        scenes = parser.parse_file(script_file).scenes
+        assert scenes[3].boneyard_metadata == {"moved": True}
@@ -348,7 +348,7 @@ SCRIPTRAG-META-END */
 
         with patch.object(parser.processor, "process_jouvence_scene") as mock_process:
 
-            def mock_scene_processor(number, scene, content):
+            def mock_scene_processor(number, scene, content, span=None):
                 return Scene(
                     number=number,
                     heading=scene.header,
@@ -0,0 +1,87 @@
+"""Unit tests for the MCP batch semantic search tool."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from mcp.server import FastMCP
+
+from scriptrag.api.semantic_search import SceneSearchResult
+from scriptrag.mcp.tools.semantic import register_semantic_batch_tool
+
+
+@pytest.fixture
+def mock_service():
+    """Patch the semantic search service used by the tool."""
+    with (
+        patch("scriptrag.mcp.tools.semantic.get_settings"),
+        patch("scriptrag.mcp.tools.semantic.SemanticSearchService") as mock_class,
+    ):
+        service = mock_class.return_value
+        service.search_similar_scenes_batch = AsyncMock()
+        yield service
+
+
+@pytest.fixture
+def mcp():
+    """MCP server with the batch semantic search tool."""
+    server = FastMCP("test")
+    register_semantic_batch_tool(server)
+    return server
+
+
+@pytest.mark.asyncio
+async def test_batch_search_returns_results_per_query(mcp, mock_service):
+    """Each query gets its own list of scenes, in query order."""
+    mock_service.search_similar_scenes_batch.return_value = [
+        [
+            SceneSearchResult(
+                scene_id=3,
+                script_id=1,
+                heading="INT. DINER - NIGHT",
+                location="DINER",
+                content="Sarah waits.",
+                similarity_score=0.91,
+                scene_number=3,
+                script_title="Pilot",
+            )
+        ],
+        [],
+    ]
+
+    response = await mcp.call_tool(
+        "scriptrag_semantic_search_batch",
+        {"queries": ["a tense wait", "a chase"], "top_k": 3},
+    )
+    data = response[1]  # Get raw result
+
+    assert data["success"] is True
+    assert [entry["query"] for entry in data["results"]] == ["a tense wait", "a chase"]
+    scene = data["results"][0]["scenes"][0]
+    assert scene["scene_id"] == 3
+    assert scene["scene_heading"] == "INT. DINER - NIGHT"
+    assert scene["similarity_score"] == 0.91
+    assert data["results"][1]["scenes"] == []
+    mock_service.search_similar_scenes_batch.assert_awaited_once_with(
+        ["a tense wait", "a chase"], script_id=None, top_k=3, threshold=0.5
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_search_requires_queries(mcp, mock_service):
+    """An empty query list is rejected without searching."""
+    response = await mcp.call_tool("scriptrag_semantic_search_batch", {"queries": []})
+
+    assert response[1]["success"] is False
+    mock_service.search_similar_scenes_batch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_search_error(mcp, mock_service):
+    """Search failures are reported rather than raised."""
+    mock_service.search_similar_scenes_batch.side_effect = ValueError("no model")
+
+    response = await mcp.call_tool(
+        "scriptrag_semantic_search_batch", {"queries": ["a chase"]}
+    )
+
+    assert response[1] == {"error": "no model", "success": False}
@@ -0,0 +1,48 @@
+"""Unit tests for the MCP performance statistics tool."""
+
+import pytest
+from mcp.server import FastMCP
+
+from scriptrag.common.profiling import get_profiler
+from scriptrag.mcp.tools.stats import register_stats_tool
+
+
+@pytest.fixture
+def profiler():
+    """Reset the process-wide profiler around each test."""
+    shared = get_profiler()
+    shared.reset()
+    yield shared
+    shared.reset()
+
+
+@pytest.mark.asyncio
+async def test_perf_stats_reports_spans(profiler):
+    """The tool reports aggregated spans and result cache statistics."""
+    mcp = FastMCP("test")
+    register_stats_tool(mcp)
+    with profiler.span("search"):
+        pass
+
+    tools = await mcp.list_tools()
+    assert "scriptrag_perf_stats" in [tool.name for tool in tools]
+
+    response = await mcp.call_tool("scriptrag_perf_stats", {})
+    data = response[1]  # Get raw result
+
+    assert data["success"] is True
+    assert [span["name"] for span in data["spans"]] == ["search"]
+    assert isinstance(data["result_caches"], dict)
+
+
+@pytest.mark.asyncio
+async def test_perf_stats_reset(profiler):
+    """Resetting clears spans after they are reported."""
+    mcp = FastMCP("test")
+    register_stats_tool(mcp)
+    with profiler.span("search"):
+        pass
+
+    await mcp.call_tool("scriptrag_perf_stats", {"reset": True})
+
+    assert profiler.get_stats() == {}
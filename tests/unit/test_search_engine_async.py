@@ -125,17 +125,15 @@ class TestSearchEngineAsync:
         )
 
         # Mock semantic adapter
-        with patch.object(
-            engine.semantic_adapter, "enhance_results_with_semantic_search"
-        ) as mock_enhance:
-            mock_enhance.return_value = ([], [])
+        with patch.object(engine.semantic_adapter, "search_semantic") as mock_semantic:
+            mock_semantic.return_value = ([], [])
 
             response = await engine.search_async(query)
 
             assert isinstance(response, SearchResponse)
             assert "sql" in response.search_methods
             assert "semantic" in response.search_methods
-            mock_enhance.assert_called_once()
+            mock_semantic.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_async_search_vector_error_handling(self, mock_settings, mock_db):
@@ -150,10 +148,8 @@ class TestSearchEngineAsync:
         )
 
         # Mock semantic adapter to raise error
-        with patch.object(
-            engine.semantic_adapter, "enhance_results_with_semantic_search"
-        ) as mock_enhance:
-            mock_enhance.side_effect = Exception("Semantic search failed")
+        with patch.object(engine.semantic_adapter, "search_semantic") as mock_semantic:
+            mock_semantic.side_effect = Exception("Semantic search failed")
 
             response = await engine.search_async(query)
 
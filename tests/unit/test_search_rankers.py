@@ -9,9 +9,11 @@ from scriptrag.search.rankers import (
     HybridRanker,
     PositionalRanker,
     ProximityRanker,
+    RankFusion,
     RelevanceRanker,
     SearchRanker,
     TextMatchRanker,
+    tokenize_text,
 )
 
 
@@ -268,6 +270,31 @@ class TestTextMatchRanker:
         assert ranked[0].relevance_score > 0
 
 
+class TestTokenizeText:
+    """Test shared tokenisation for the text rankers."""
+
+    def test_tokenize_text(self) -> None:
+        """Test lowercasing and word extraction."""
+        tokens = tokenize_text("The Quick  brown\nFOX")
+        assert tokens.lower == "the quick  brown\nfox"
+        assert tokens.words == {"the", "quick", "brown", "fox"}
+
+    def test_tokenize_text_is_cached(self) -> None:
+        """Test that rankers share the tokens of the same text."""
+        text = "A long scene " * 10
+        assert tokenize_text(text) is tokenize_text(text)
+
+    def test_partial_match_equals_token_scan(self) -> None:
+        """Test partial matching against the per-token substring scan."""
+        ranker = TextMatchRanker()
+        text = "Coffee-stained letters, whispered secrets"
+        # "stain" and "whisper" are inside words, "tea" is nowhere
+        score = ranker.calculate_text_score(text, "stain whisper tea")
+
+        # No exact or whole-word match; two of three words match partially
+        assert score == pytest.approx(0.5 * 2 / 3)
+
+
 class TestPositionalRanker:
     """Test PositionalRanker functionality."""
 
@@ -427,6 +454,27 @@ class TestProximityRanker:
         # First result should rank higher (terms closer)
         assert ranked[0].scene_id == 1
 
+    def test_calculate_proximity_score_uses_window_over_all_terms(self) -> None:
+        """Test that proximity measures the smallest window with every term."""
+        ranker = ProximityRanker()
+        terms = ["alpha", "beta", "gamma"]
+
+        # alpha and beta are adjacent early on, but gamma only appears later
+        # next to a second beta; the tightest window spans "beta gamma alpha"
+        text = "alpha beta " + "x " * 200 + "beta gamma alpha"
+        score = ranker.calculate_proximity_score(text, terms)
+
+        window = len("beta gamma ")
+        assert score == pytest.approx(1.0 / (1.0 + window / 100.0))
+
+    def test_calculate_proximity_score_repeated_terms(self) -> None:
+        """Test that repeated and differently cased terms count once."""
+        ranker = ProximityRanker()
+        text = "quick brown fox"
+        assert ranker.calculate_proximity_score(
+            text, ["quick", "QUICK", "brown"]
+        ) == ranker.calculate_proximity_score(text, ["quick", "brown"])
+
     def test_rank_preserves_zero_score(self) -> None:
         """Test that infinity proximity returns 0 score."""
         ranker = ProximityRanker()
@@ -524,6 +572,97 @@ class TestHybridRanker:
         assert ranked[0].relevance_score > 0
 
 
+def _fusion_result(scene_id: int, score: float = 1.0) -> SearchResult:
+    return SearchResult(
+        script_id=1,
+        script_title="Test",
+        script_author="Author",
+        scene_id=scene_id,
+        scene_number=scene_id,
+        scene_heading=f"Scene {scene_id}",
+        scene_location="LOC",
+        scene_time="DAY",
+        scene_content="Content",
+        relevance_score=score,
+    )
+
+
+class TestRankFusion:
+    """Test RankFusion class."""
+
+    def test_invalid_parameters(self) -> None:
+        """Test that invalid fusion parameters are rejected."""
+        with pytest.raises(ValueError, match="Unknown fusion method"):
+            RankFusion(method="max")
+        with pytest.raises(ValueError, match="k must be at least 1"):
+            RankFusion(k=0)
+        with pytest.raises(ValueError, match="Vector weight"):
+            RankFusion(vector_weight=1.5)
+
+    def test_rrf_rewards_agreement(self) -> None:
+        """Test that scenes ranked by both lists come first."""
+        fusion = RankFusion(k=60)
+        lexical = [_fusion_result(1), _fusion_result(2)]
+        vector = [_fusion_result(3), _fusion_result(2)]
+
+        fused = fusion.fuse(lexical, vector)
+
+        assert [r.scene_id for r in fused] == [2, 1, 3]
+        assert fused[0].relevance_score == pytest.approx(0.5 / 62 + 0.5 / 62)
+        assert fused[1].relevance_score == pytest.approx(0.5 / 61)
+
+    def test_rrf_ignores_score_scales(self) -> None:
+        """Test that RRF fuses by rank, not by raw score."""
+        fusion = RankFusion()
+        lexical = [_fusion_result(1, score=100.0)]
+        vector = [_fusion_result(2, score=0.1)]
+
+        fused = fusion.fuse(lexical, vector)
+
+        # Equal ranks and weights tie; ties keep lexical order
+        assert [r.scene_id for r in fused] == [1, 2]
+        assert fused[0].relevance_score == fused[1].relevance_score
+
+    def test_shared_scene_keeps_lexical_result(self) -> None:
+        """Test that a scene in both lists keeps the lexical result object."""
+        lexical_hit = _fusion_result(1)
+        lexical_hit.matched_text = "matched"
+
+        fused = RankFusion().fuse([lexical_hit], [_fusion_result(1)])
+
+        assert len(fused) == 1
+        assert fused[0] is lexical_hit
+
+    def test_vector_weight(self) -> None:
+        """Test that the vector weight shifts the fused order."""
+        lexical = [_fusion_result(1)]
+        vector = [_fusion_result(2)]
+
+        fused = RankFusion(vector_weight=0.8).fuse(lexical, vector)
+
+        assert [r.scene_id for r in fused] == [2, 1]
+
+    def test_weighted_normalises_scores(self) -> None:
+        """Test weighted fusion of min-max normalised scores."""
+        fusion = RankFusion(method="weighted", vector_weight=0.5)
+        lexical = [_fusion_result(1, 10.0), _fusion_result(2, 5.0)]
+        vector = [_fusion_result(2, 0.9), _fusion_result(3, 0.3)]
+
+        fused = fusion.fuse(lexical, vector)
+
+        scores = {r.scene_id: r.relevance_score for r in fused}
+        assert scores == pytest.approx({1: 0.5, 2: 0.5, 3: 0.0})
+
+    def test_limit_and_duplicates(self) -> None:
+        """Test that fused results are truncated and deduplicated."""
+        lexical = [_fusion_result(1), _fusion_result(1), _fusion_result(2)]
+        vector = [_fusion_result(3), _fusion_result(4)]
+
+        fused = RankFusion().fuse(lexical, vector, limit=2)
+
+        assert [r.scene_id for r in fused] == [1, 3]
+
+
 class TestBibleResultRanker:
     """Test BibleResultRanker functionality."""
 
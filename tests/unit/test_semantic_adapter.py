@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import numpy as np
 import pytest
 
+from scriptrag.api.semantic_search import SceneSearchResult
 from scriptrag.config.settings import ScriptRAGSettings
 from scriptrag.search.models import SearchMode, SearchQuery
 from scriptrag.search.semantic_adapter import SemanticSearchAdapter
@@ -38,6 +39,11 @@ class TestSemanticSearchAdapter:
             "scriptrag.search.semantic_adapter.SemanticSearchService"
         ) as mock_service_class:
             mock_service = MagicMock(spec=["content", "model", "provider", "usage"])
+            mock_service.embedding_service = MagicMock()
+            mock_service.embedding_service.default_model = "text-embedding-3-small"
+            mock_service.embedding_service.generate_embedding = AsyncMock(
+                return_value=[0.1, 0.2, 0.3]
+            )
             mock_service_class.return_value = mock_service
             adapter = SemanticSearchAdapter(mock_settings)
             # Ensure the service is properly set up
@@ -80,24 +86,15 @@ class TestSemanticSearchAdapter:
     @pytest.mark.asyncio
     async def test_enhance_results_with_scenes(self, adapter):
         """Test enhance_results with scene results."""
-        # Create mock search results with only the attributes the adapter actually uses
-        mock_scene_result = MagicMock(
-            spec_set=[
-                "scene_id",
-                "script_id",
-                "heading",
-                "location",
-                "content",
-                "similarity_score",
-                "metadata",
-            ]
+        # Create a scene search result as returned by the semantic service
+        mock_scene_result = SceneSearchResult(
+            scene_id=123,
+            script_id=1,
+            heading="INT. OFFICE - DAY",
+            location="OFFICE",
+            content="Test content",
+            similarity_score=0.8,
         )
-        mock_scene_result.scene_id = 123
-        mock_scene_result.script_id = 1
-        mock_scene_result.heading = "INT. OFFICE - DAY"
-        mock_scene_result.location = "OFFICE"
-        mock_scene_result.content = "Test content"
-        mock_scene_result.similarity_score = 0.8
 
         # Mock both semantic service methods with proper async behavior
         adapter.semantic_service.search_similar_scenes = AsyncMock(
@@ -181,6 +178,68 @@ class TestSemanticSearchAdapter:
         assert bible[0].match_type == "semantic"
         assert bible[0].relevance_score == 0.7
 
+    @pytest.mark.asyncio
+    async def test_search_semantic_embeds_query_once(self, adapter):
+        """Test scene and bible searches share one query embedding."""
+        adapter.semantic_service.search_similar_scenes = AsyncMock(return_value=[])
+        adapter.semantic_service.search_similar_bible_content = AsyncMock(
+            return_value=[]
+        )
+
+        query = SearchQuery(
+            raw_query="test query",
+            text_query="test query",
+            mode=SearchMode.FUZZY,
+            include_bible=True,
+        )
+
+        await adapter.search_semantic(query, limit=5)
+
+        embedding_service = adapter.semantic_service.embedding_service
+        embedding_service.generate_embedding.assert_awaited_once_with(
+            "test query", "text-embedding-3-small"
+        )
+        for search in (
+            adapter.semantic_service.search_similar_scenes,
+            adapter.semantic_service.search_similar_bible_content,
+        ):
+            assert search.call_args.kwargs["query_embedding"] == [0.1, 0.2, 0.3]
+
+    @pytest.mark.asyncio
+    async def test_search_semantic_keeps_hydrated_metadata(self, adapter):
+        """Test that hydrated script metadata reaches the search results."""
+        adapter.semantic_service.search_similar_scenes = AsyncMock(
+            return_value=[
+                SceneSearchResult(
+                    scene_id=5,
+                    script_id=1,
+                    heading="INT. OFFICE - NIGHT",
+                    location="OFFICE",
+                    content="Test content",
+                    similarity_score=0.8,
+                    scene_number=12,
+                    time_of_day="NIGHT",
+                    script_title="Pilot",
+                    script_author="Writer",
+                    season=1,
+                    episode=3,
+                )
+            ]
+        )
+
+        adapter.semantic_service.search_similar_bible_content = AsyncMock(
+            return_value=[]
+        )
+
+        query = SearchQuery(raw_query="office", text_query="office")
+        scenes, _bible = await adapter.search_semantic(query, limit=5)
+
+        assert scenes[0].script_title == "Pilot"
+        assert scenes[0].script_author == "Writer"
+        assert scenes[0].scene_number == 12
+        assert scenes[0].scene_time == "NIGHT"
+        assert (scenes[0].season, scenes[0].episode) == (1, 3)
+
     @pytest.mark.asyncio
     async def test_enhance_results_deduplication(self, adapter):
         """Test that duplicate results are not added."""
@@ -200,23 +259,14 @@ class TestSemanticSearchAdapter:
         )
 
         # Create mock scene that duplicates existing with only adapter attributes
-        mock_scene_result = MagicMock(
-            spec_set=[
-                "scene_id",
-                "script_id",
-                "heading",
-                "location",
-                "content",
-                "similarity_score",
-                "metadata",
-            ]
+        mock_scene_result = SceneSearchResult(
+            scene_id=123,
+            script_id=1,
+            heading="INT. OFFICE - DAY",
+            location="OFFICE",
+            content="Test content",
+            similarity_score=0.8,
         )
-        mock_scene_result.scene_id = 123  # Same as existing
-        mock_scene_result.script_id = 1
-        mock_scene_result.heading = "INT. OFFICE - DAY"
-        mock_scene_result.location = "OFFICE"
-        mock_scene_result.content = "Test content"
-        mock_scene_result.similarity_score = 0.8
 
         # Mock both semantic service methods with proper async behavior
         adapter.semantic_service.search_similar_scenes = AsyncMock(
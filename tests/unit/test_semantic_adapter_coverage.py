@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import numpy as np
 import pytest
 
+from scriptrag.api.semantic_search import SceneSearchResult
 from scriptrag.config.settings import ScriptRAGSettings
 from scriptrag.search.models import SearchQuery, SearchResult
 from scriptrag.search.semantic_adapter import SemanticSearchAdapter
@@ -34,6 +35,11 @@ def semantic_adapter(mock_settings):
         adapter.semantic_service = MagicMock(
             spec=["content", "model", "provider", "usage"]
         )
+        adapter.semantic_service.embedding_service = MagicMock()
+        adapter.semantic_service.embedding_service.default_model = "test-model"
+        adapter.semantic_service.embedding_service.generate_embedding = AsyncMock(
+            return_value=[0.1, 0.2, 0.3]
+        )
         adapter.semantic_service.search_similar_scenes = AsyncMock(
             spec=["complete", "cleanup", "embed", "list_models", "is_available"]
         )
@@ -193,13 +199,14 @@ class TestSemanticAdapterCoverage:
         existing_results = []
 
         # Mock scene search results
-        mock_scene_result = MagicMock(spec=["content", "model", "provider", "usage"])
-        mock_scene_result.scene_id = 10
-        mock_scene_result.script_id = 1
-        mock_scene_result.heading = "Scene Heading"
-        mock_scene_result.location = "Location"
-        mock_scene_result.content = "Scene content"
-        mock_scene_result.similarity_score = 0.9
+        mock_scene_result = SceneSearchResult(
+            scene_id=10,
+            script_id=1,
+            heading="Scene Heading",
+            location="Location",
+            content="Scene content",
+            similarity_score=0.9,
+        )
 
         semantic_adapter.semantic_service.search_similar_scenes.return_value = [
             mock_scene_result
@@ -301,21 +308,23 @@ class TestSemanticAdapterCoverage:
         ]
 
         # Mock semantic search returning duplicate and new scenes
-        mock_duplicate = MagicMock(spec=["content", "model", "provider", "usage"])
-        mock_duplicate.scene_id = 1  # Duplicate
-        mock_duplicate.script_id = 1
-        mock_duplicate.heading = "Duplicate"
-        mock_duplicate.location = "Location"
-        mock_duplicate.content = "Content"
-        mock_duplicate.similarity_score = 0.95
-
-        mock_new = MagicMock(spec=["content", "model", "provider", "usage"])
-        mock_new.scene_id = 2  # New
-        mock_new.script_id = 1
-        mock_new.heading = "New Scene"
-        mock_new.location = "New Location"
-        mock_new.content = "New Content"
-        mock_new.similarity_score = 0.9
+        mock_duplicate = SceneSearchResult(
+            scene_id=1,
+            script_id=1,
+            heading="Duplicate",
+            location="Location",
+            content="Content",
+            similarity_score=0.95,
+        )
+
+        mock_new = SceneSearchResult(
+            scene_id=2,
+            script_id=1,
+            heading="New Scene",
+            location="New Location",
+            content="New Content",
+            similarity_score=0.9,
+        )
 
         semantic_adapter.semantic_service.search_similar_scenes.return_value = [
             mock_duplicate,
@@ -342,13 +351,14 @@ class TestSemanticAdapterCoverage:
         # Mock many semantic search results
         mock_results = []
         for i in range(10):
-            mock_result = MagicMock(spec=["content", "model", "provider", "usage"])
-            mock_result.scene_id = i
-            mock_result.script_id = 1
-            mock_result.heading = f"Scene {i}"
-            mock_result.location = f"Location {i}"
-            mock_result.content = f"Content {i}"
-            mock_result.similarity_score = 0.9 - (i * 0.01)
+            mock_result = SceneSearchResult(
+                scene_id=i,
+                script_id=1,
+                heading=f"Scene {i}",
+                location=f"Location {i}",
+                content=f"Content {i}",
+                similarity_score=0.9 - (i * 0.01),
+            )
             mock_results.append(mock_result)
 
         semantic_adapter.semantic_service.search_similar_scenes.return_value = (
@@ -2,6 +2,7 @@
 
 from unittest.mock import AsyncMock, MagicMock, Mock
 
+import numpy as np
 import pytest
 
 from scriptrag.api.database_operations import DatabaseOperations
@@ -12,6 +13,7 @@ from scriptrag.api.semantic_search import (
     SemanticSearchService,
 )
 from scriptrag.config import ScriptRAGSettings
+from scriptrag.embeddings.vector_store import BinaryEmbeddingSerializer
 
 
 @pytest.fixture
@@ -246,6 +248,17 @@ class TestSemanticSearchService:
             0.2,  # Not similar
         ]
 
+        mock_db_ops.get_scene_details.return_value = {
+            2: {
+                "scene_number": 7,
+                "time_of_day": "NIGHT",
+                "script_title": "Pilot",
+                "script_author": "Writer",
+                "season": 1,
+                "episode": 2,
+            }
+        }
+
         # Execute search
         results = await semantic_search.find_related_scenes(
             scene_id=1, script_id=10, threshold=0.5
@@ -256,6 +269,12 @@ class TestSemanticSearchService:
         assert results[0].scene_id == 2
         assert results[0].similarity_score == 0.95
 
+        # Script metadata is hydrated with one batched lookup
+        mock_db_ops.get_scene_details.assert_called_once_with(mock_conn, [2])
+        assert results[0].scene_number == 7
+        assert results[0].script_title == "Pilot"
+        assert (results[0].season, results[0].episode) == (1, 2)
+
     @pytest.mark.asyncio
     async def test_find_related_scenes_no_embedding(
         self, semantic_search, mock_db_ops, mock_embedding_service
@@ -708,3 +727,240 @@ class TestSemanticSearchService:
         assert processed == 1
         assert generated == 0  # No successful generations due to encoding error
         assert mock_db_ops.upsert_embedding.call_count == 0
+
+
+class TestSemanticSearchAnnIndex:
+    """Test the approximate-nearest-neighbour candidate path."""
+
+    @pytest.fixture
+    def scene_row(self):
+        return {
+            "id": 7,
+            "script_id": 1,
+            "heading": "INT. ROOM - DAY",
+            "location": "ROOM",
+            "content": "Scene content",
+            "_embedding": b"scene_bytes",
+            "metadata": None,
+        }
+
+    @pytest.fixture
+    def ann_search(self, semantic_search, mock_db_ops, mock_embedding_service):
+        mock_db_ops.transaction.return_value.__enter__.return_value = MagicMock()
+        mock_db_ops.get_scene_details.return_value = {}
+        mock_embedding_service.generate_embedding.return_value = [0.1, 0.2]
+        mock_embedding_service.encode_embedding_for_db.return_value = b"query"
+        mock_embedding_service.decode_embedding_from_db.return_value = [0.1, 0.2]
+        mock_embedding_service.cosine_similarity.return_value = 0.9
+        semantic_search.ann_store = MagicMock(probes=4)
+        return semantic_search
+
+    @pytest.mark.asyncio
+    async def test_fresh_index_narrows_candidates(
+        self, ann_search, mock_db_ops, scene_row
+    ):
+        index = MagicMock()
+        index.search.return_value = [(7, 0.9), (8, 0.8)]
+        ann_search.ann_store.fresh_index.return_value = index
+        mock_db_ops.get_scene_candidates.return_value = [scene_row]
+
+        results = await ann_search.search_similar_scenes("query", top_k=5)
+
+        assert [r.scene_id for r in results] == [7]
+        index.search.assert_called_once_with([0.1, 0.2], 50, 4)
+        mock_db_ops.get_scene_candidates.assert_called_once()
+        assert mock_db_ops.get_scene_candidates.call_args.args[1] == [7, 8]
+        mock_db_ops.search_similar_scenes.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_index_falls_back_to_exact_search(
+        self, ann_search, mock_db_ops, scene_row
+    ):
+        ann_search.ann_store.fresh_index.return_value = None
+        mock_db_ops.search_similar_scenes.return_value = [scene_row]
+
+        results = await ann_search.search_similar_scenes("query", top_k=5)
+
+        assert [r.scene_id for r in results] == [7]
+        # Exact search scores every candidate rather than an arbitrary prefix
+        assert mock_db_ops.search_similar_scenes.call_args.kwargs["limit"] is None
+        mock_db_ops.get_scene_candidates.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_script_filter_uses_exact_search(
+        self, ann_search, mock_db_ops, scene_row
+    ):
+        mock_db_ops.search_similar_scenes.return_value = [scene_row]
+
+        await ann_search.search_similar_scenes("query", script_id=1, top_k=5)
+
+        ann_search.ann_store.fresh_index.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_generation_syncs_index(
+        self, ann_search, mock_db_ops, mock_embedding_service
+    ):
+        conn = mock_db_ops.transaction.return_value.__enter__.return_value
+        conn.execute.return_value.fetchall.return_value = []
+
+        await ann_search.generate_missing_embeddings()
+
+        ann_search.ann_store.sync.assert_called_once_with(
+            conn,
+            "scene",
+            "test-model",
+            decode=mock_embedding_service.decode_embedding_from_db,
+        )
+
+
+class TestApproximateShortlist:
+    """Test approximate scoring before exact rescoring."""
+
+    @pytest.mark.asyncio
+    async def test_only_shortlist_is_rescored(
+        self, semantic_search, mock_db_ops, mock_embedding_service
+    ):
+        scenes = [
+            {
+                "id": i,
+                "script_id": 1,
+                "heading": f"INT. ROOM {i} - DAY",
+                "location": "ROOM",
+                "content": "Scene content",
+                "_embedding": b"bad" if i == 0 else b"scene",
+                "metadata": None,
+            }
+            for i in range(80)
+        ]
+        estimates = np.arange(80, dtype=np.float32) / 80
+        estimates[0] = np.nan
+        mock_db_ops.transaction.return_value.__enter__.return_value = MagicMock()
+        mock_db_ops.search_similar_scenes.return_value = scenes
+        mock_db_ops.get_scene_details.return_value = {}
+        mock_embedding_service.generate_embedding.return_value = [0.1, 0.2]
+        mock_embedding_service.encode_embedding_for_db.return_value = b"query"
+        mock_embedding_service.approximate_similarities = Mock(return_value=estimates)
+        mock_embedding_service.decode_embedding_from_db.return_value = [0.1, 0.2]
+        mock_embedding_service.cosine_similarity.return_value = 0.9
+
+        results = await semantic_search.search_similar_scenes("query", top_k=5)
+
+        # The 50 best estimates plus the unscorable scene are rescored exactly
+        assert mock_embedding_service.decode_embedding_from_db.call_count == 51
+        assert len(results) == 5
+        rescored = {r.scene_id for r in results}
+        assert rescored <= {0, *range(30, 80)}
+
+
+class TestBatchSceneSearch:
+    """Test searching for several queries at once."""
+
+    @pytest.fixture
+    def batch_search(self, semantic_search, mock_db_ops, mock_embedding_service):
+        serializer = BinaryEmbeddingSerializer()
+        vectors = {1: [1.0, 0.0], 2: [0.0, 1.0], 3: [0.7, 0.7]}
+        mock_db_ops.transaction.return_value.__enter__.return_value = MagicMock()
+        mock_db_ops.get_scene_details.return_value = {}
+        mock_db_ops.search_similar_scenes.return_value = [
+            {
+                "id": scene_id,
+                "script_id": 1,
+                "heading": f"INT. ROOM {scene_id} - DAY",
+                "location": "ROOM",
+                "content": "Scene content",
+                "_embedding": serializer.encode(vector),
+                "metadata": None,
+            }
+            for scene_id, vector in vectors.items()
+        ]
+        mock_embedding_service.generate_query_embeddings = AsyncMock(
+            return_value=[[1.0, 0.1], [0.1, 1.0]]
+        )
+        mock_embedding_service.decode_embedding_from_db.side_effect = serializer.decode
+        mock_embedding_service.approximate_similarities = Mock(
+            side_effect=lambda query, blobs: serializer.approximate_similarities(
+                blobs, query
+            )
+        )
+        mock_embedding_service.cosine_similarity.side_effect = lambda a, b: float(
+            np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+        )
+        return semantic_search
+
+    @pytest.mark.asyncio
+    async def test_each_query_gets_its_own_ranking(
+        self, batch_search, mock_db_ops, mock_embedding_service
+    ):
+        results = await batch_search.search_similar_scenes_batch(
+            ["the first", "the second"], top_k=2
+        )
+
+        assert [[r.scene_id for r in rs] for rs in results] == [[1, 3], [2, 3]]
+        mock_embedding_service.generate_query_embeddings.assert_awaited_once_with(
+            ["the first", "the second"], "test-model"
+        )
+        mock_db_ops.search_similar_scenes.assert_called_once()
+        mock_db_ops.get_scene_details.assert_called_once()
+        assert sorted(mock_db_ops.get_scene_details.call_args.args[1]) == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_matches_single_query_search(self, batch_search):
+        batch = await batch_search.search_similar_scenes_batch(
+            ["a", "b"], top_k=3, threshold=0.0
+        )
+
+        for embedding, results in zip([[1.0, 0.1], [0.1, 1.0]], batch, strict=True):
+            single = await batch_search.search_similar_scenes(
+                "q", top_k=3, threshold=0.0, query_embedding=embedding
+            )
+            assert results == single
+
+    @pytest.mark.asyncio
+    async def test_large_corpus_is_shortlisted_in_one_pass(
+        self, batch_search, mock_db_ops, mock_embedding_service
+    ):
+        scene = mock_db_ops.search_similar_scenes.return_value[0]
+        mock_db_ops.search_similar_scenes.return_value = [
+            {**scene, "id": i} for i in range(80)
+        ]
+
+        results = await batch_search.search_similar_scenes_batch(
+            ["a", "b"], top_k=5, threshold=0.0
+        )
+
+        assert [len(rs) for rs in results] == [5, 5]
+        mock_embedding_service.approximate_similarities.assert_called_once()
+        queries = mock_embedding_service.approximate_similarities.call_args.args[0]
+        assert queries == [[1.0, 0.1], [0.1, 1.0]]
+
+    @pytest.mark.asyncio
+    async def test_fresh_index_fetches_candidate_union_once(
+        self, batch_search, mock_db_ops
+    ):
+        rows = mock_db_ops.search_similar_scenes.return_value
+        index = MagicMock()
+        index.search.side_effect = [[(1, 0.9), (3, 0.7)], [(2, 0.9), (3, 0.7)]]
+        batch_search.ann_store = MagicMock(probes=4)
+        batch_search.ann_store.fresh_index.return_value = index
+        mock_db_ops.get_scene_candidates.return_value = rows
+
+        results = await batch_search.search_similar_scenes_batch(["a", "b"], top_k=1)
+
+        assert [[r.scene_id for r in rs] for rs in results] == [[1], [2]]
+        mock_db_ops.get_scene_candidates.assert_called_once()
+        assert mock_db_ops.get_scene_candidates.call_args.args[1] == [1, 2, 3]
+        mock_db_ops.search_similar_scenes.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_queries(self, batch_search, mock_embedding_service):
+        assert await batch_search.search_similar_scenes_batch([]) == []
+        mock_embedding_service.generate_query_embeddings.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure(self, batch_search, mock_embedding_service):
+        mock_embedding_service.generate_query_embeddings.side_effect = Exception(
+            "API error"
+        )
+
+        with pytest.raises(ValueError, match="Failed to generate embeddings"):
+            await batch_search.search_similar_scenes_batch(["a", "b"])